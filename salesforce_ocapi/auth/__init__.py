@@ -1,6 +1,7 @@
 """Authentication classes, provide objects with renewable access tokens.
 """
 
+from salesforce_ocapi.auth.cache import TokenCache
 from salesforce_ocapi.auth.helper import (
     CommerceCloudBMSession,
     CommerceCloudClientSession,
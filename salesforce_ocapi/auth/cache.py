@@ -0,0 +1,111 @@
+"""On-disk token cache, lets short lived processes reuse a still valid bearer token.
+"""
+
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl, fall back to unlocked access
+    fcntl = None
+
+
+class TokenCache:
+    """File backed token cache shared between processes.
+
+    Tokens are stored one file per credential set, named by a hash of the client ID, grant type,
+    token endpoint and Business Manager user. Files are created readable by the owner only and
+    every read-fetch-write cycle holds an exclusive file lock, so a fleet of processes starting
+    together performs a single OAuth round-trip.
+
+    Args:
+        path (str, optional): Cache directory. Defaults to "~/.sfcc/tokens".
+        min_lifetime (int, optional): Seconds a cached token must still be valid to be reused. Defaults to 60.
+    """
+
+    def __init__(
+        self,
+        path: str = Path.joinpath(Path.home(), Path(".sfcc/tokens")),
+        min_lifetime: int = 60,
+    ):
+        self.path = Path(path)
+        self.min_lifetime = min_lifetime
+
+    @staticmethod
+    def key(client_id: str, grant_type: str, instance: str, bm_user: str = None) -> str:
+        """Build the cache key for a credential set.
+
+        Secrets are never part of the key, a key only says which token a file holds.
+
+        Args:
+            client_id (str): Client ID for OCAPI roles/authentication.
+            grant_type (str): Grant type of the session.
+            instance (str): Host the token was issued by.
+            bm_user (str, optional): Business Manager username. Defaults to None.
+
+        Returns:
+            str: Hex digest used as the cache file name.
+        """
+        raw = "|".join([client_id, grant_type, instance or "", bm_user or ""])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _file(self, key: str, suffix: str) -> Path:
+        self.path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        return self.path.joinpath(f"{key}{suffix}")
+
+    @contextmanager
+    def lock(self, key: str):
+        """Hold an exclusive lock on a cache entry across processes.
+
+        Args:
+            key (str): Cache key from TokenCache.key.
+        """
+        fd = os.open(self._file(key, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def load(self, key: str, rejected: str = None) -> dict:
+        """Read a cached token if it is still valid long enough.
+
+        Args:
+            key (str): Cache key from TokenCache.key.
+            rejected (str, optional): Access token known to be stale, never returned. Defaults to None.
+
+        Returns:
+            dict: Token with expires_in rebased on the current time, None if nothing usable is cached.
+        """
+        try:
+            with open(self._file(key, ".json")) as file:
+                token = json.load(file)
+        except (OSError, ValueError):
+            return None
+        remaining = token.get("expires_at", 0) - int(time.time())
+        if remaining < self.min_lifetime or token.get("access_token") == rejected:
+            return None
+        # expires_at is issued at + expires_in - 15, keep that relation for the remaining lifetime
+        token["expires_in"] = remaining + 15
+        return token
+
+    def store(self, key: str, token: dict):
+        """Write a token to the cache, replacing the file atomically.
+
+        Args:
+            key (str): Cache key from TokenCache.key.
+            token (dict): Token including expires_at.
+        """
+        target = self._file(key, ".json")
+        temp = self._file(key, f".{os.getpid()}.tmp")
+        fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as file:
+            json.dump(token, file)
+        os.replace(temp, target)
@@ -7,9 +7,13 @@ from configparser import ConfigParser
 from os import environ as env
 from pathlib import Path
 
-import httpx
-
+from salesforce_ocapi.auth.cache import TokenCache
+from salesforce_ocapi.auth.manager import TokenManager
 from salesforce_ocapi.utils.exceptions import AuthenticationFailure, CredentialsMissing
+from salesforce_ocapi.utils.ratelimit import rate_limiter
+from salesforce_ocapi.utils.transport import connection_pool
+
+ACCOUNT_MANAGER = "https://account.demandware.com"
 
 
 class BaseToken:
@@ -17,30 +21,112 @@ class BaseToken:
     """
 
     def __init__(
-        self, client_id, client_secret, instance=None, bm_user=None, bm_password=None,
+        self,
+        client_id,
+        client_secret,
+        instance=None,
+        bm_user=None,
+        bm_password=None,
+        refresh_margin=60,
+        token_cache=None,
     ):
         self.client_id = client_id
         self.client_secret = client_secret
         self.bm_password = bm_password
         self.bm_user = bm_user
         self.instance = instance
-        self.session = httpx.Client()
+        self.token_cache = token_cache
+        if self.bm_user and self.bm_password:
+            self.grant_type = "bm_user"
+            self.token_host = self.instance
+        else:
+            self.grant_type = "client_credentials"
+            self.token_host = ACCOUNT_MANAGER
+        self._manager = TokenManager.for_credentials(
+            (
+                self.grant_type,
+                self.token_host,
+                self.client_id,
+                self.client_secret,
+                self.bm_user,
+                self.bm_password,
+            ),
+            margin=refresh_margin,
+        )
+
+    @property
+    def session(self):
+        """Shared HTTPX client for the token endpoint's host.
 
-    def getToken(self):
-        """Gets a token and stores it in the object, additionally injects an expiry time for renewing the token.
+        Returns:
+            Client: Pooled client from the process wide connection pool.
         """
-        if self.bm_user and self.bm_password:
+        return connection_pool.session(self.token_host)
+
+    @property
+    def token(self) -> dict:
+        """Current token held by the shared TokenManager, acquired on first use.
+
+        Returns:
+            dict: Dictionary representation of the JSON bearer token response.
+        """
+        if self._manager.token is None:
+            self.CheckExpiry()
+        return self._manager.token
+
+    def _acquireToken(self, rejected: str = None) -> dict:
+        """Get a new token, reusing one from the on-disk cache when configured.
+
+        The rejected token, or the token currently held, is treated as unusable, so a forced
+        renewal never gets it back from the cache.
+
+        Args:
+            rejected (str, optional): Access token the server refused. Defaults to None.
+
+        Returns:
+            dict: Dictionary representation of the JSON bearer token response.
+        """
+        if self.token_cache is None:
+            return self._fetchToken()
+        key = TokenCache.key(
+            self.client_id, self.grant_type, self.token_host, self.bm_user
+        )
+        if rejected is None:
+            rejected = (self._manager.token or {}).get("access_token")
+        with self.token_cache.lock(key):
+            token = self.token_cache.load(key, rejected=rejected)
+            if token is None:
+                token = self._fetchToken()
+                if "access_token" in token:
+                    self.token_cache.store(key, token)
+        return token
+
+    def _fetchToken(self) -> dict:
+        """Request a new token from the OAuth endpoint, injects an expiry time for renewing the token.
+
+        The request waits for the token host's rate limiter like any other request.
+
+        Raises:
+            AuthenticationFailure: Credentials rejected by the OAuth endpoint.
+
+        Returns:
+            dict: Dictionary representation of the JSON bearer token response.
+        """
+        if self.grant_type == "bm_user":
             url = f"{self.instance}/dw/oauth2/access_token?client_id={self.client_id}"
             payload = "grant_type=urn%3Ademandware%3Aparams%3Aoauth%3Agrant-type%3Aclient-id%3Adwsid%3Adwsecuretoken"
             auth = (self.bm_user, f"{self.bm_password}:{self.client_secret}")
         else:
-            url = "https://account.demandware.com/dw/oauth2/access_token"
+            url = f"{ACCOUNT_MANAGER}/dw/oauth2/access_token"
             payload = "grant_type=client_credentials"
             auth = (self.client_id, self.client_secret)
         headers = {
             "Content-Type": "application/x-www-form-urlencoded",
         }
 
+        wait = rate_limiter.reserve(self.token_host)
+        if wait:
+            time.sleep(wait)
         response = self.session.post(url, headers=headers, data=payload, auth=auth,)
         token = response.json()
         try:
@@ -54,13 +140,38 @@ class BaseToken:
                     print(response.json())
                     raise AuthenticationFailure
 
-        self.token = token
+        return token
+
+    def getToken(self, rejected: str = None):
+        """Gets a new token and stores it in the shared TokenManager.
+
+        Concurrent callers that saw the same token rejected share a single OAuth request, a
+        caller whose token was already replaced by another thread fetches nothing.
+
+        Args:
+            rejected (str, optional): Access token the server refused with a 401.
+                Defaults to None, the token currently held.
+        """
+        if rejected is None:
+            rejected = (self._manager.token or {}).get("access_token")
+        self._manager.refresh(lambda: self._acquireToken(rejected), stale=rejected)
 
     def CheckExpiry(self):
         """Check token expiry and renew if needed.
+
+        Compares against a monotonic deadline, cheap enough to run on every request. Tokens are
+        renewed in the background before expiry so request threads rarely wait here.
+        """
+        self._manager.get(self._acquireToken)
+
+    @property
+    def Valid(self) -> bool:
+        """Is the current token usable without an OAuth request?
+
+        Returns:
+            bool: True until the token is due for renewal.
         """
-        if self.token["expires_at"] < int(time.time()):
-            self.getToken()
+        return self._manager.valid
 
     @property
     def AuthHeader(self) -> dict:
@@ -107,9 +218,24 @@ class CommerceCloudClientSession(BaseToken):
         instance (str, optional): Top level domain of the SFCC instance.
             Optional since Client Credentials tokens can be used across multiple instances.
             Defaults to None.
+        refresh_margin (int, optional): Seconds before expiry the token is renewed in the background.
+            Defaults to 60.
+        token_cache (TokenCache, optional): On-disk cache to share tokens between processes.
+            Defaults to None.
+
+    The token is requested on first use, not when the session is created.
     """
 
-    def __init__(self, *, client_id=None, client_secret=None, instance=None, **kwargs):
+    def __init__(
+        self,
+        *,
+        client_id=None,
+        client_secret=None,
+        instance=None,
+        refresh_margin=60,
+        token_cache=None,
+        **kwargs,
+    ):
 
         try:
             self.client_id = client_id or env["OCAPI_CLIENT_ID"]
@@ -117,8 +243,13 @@ class CommerceCloudClientSession(BaseToken):
             self.instance = instance or env["OCAPI_INSTANCE"]
         except KeyError:
             raise CredentialsMissing
-        super().__init__(self.client_id, self.client_secret, self.instance)
-        self.getToken()
+        super().__init__(
+            self.client_id,
+            self.client_secret,
+            self.instance,
+            refresh_margin=refresh_margin,
+            token_cache=token_cache,
+        )
 
 
 class CommerceCloudBMSession(BaseToken):
@@ -138,6 +269,12 @@ class CommerceCloudBMSession(BaseToken):
         instance (str, optional): Top level domain of the SFCC instance.
         bm_user (str, optional): Business Manager username, either local or SSO.
         bm_password (str, optional): Business Manager password.
+        refresh_margin (int, optional): Seconds before expiry the token is renewed in the background.
+            Defaults to 60.
+        token_cache (TokenCache, optional): On-disk cache to share tokens between processes.
+            Defaults to None.
+
+    The token is requested on first use, not when the session is created.
     """
 
     def __init__(
@@ -148,6 +285,8 @@ class CommerceCloudBMSession(BaseToken):
         instance=None,
         bm_user=None,
         bm_password=None,
+        refresh_margin=60,
+        token_cache=None,
         **kwargs,
     ):
         try:
@@ -164,8 +303,9 @@ class CommerceCloudBMSession(BaseToken):
             self.instance,
             self.bm_user,
             self.bm_password,
+            refresh_margin=refresh_margin,
+            token_cache=token_cache,
         )
-        self.getToken()
 
 
 class Profile:
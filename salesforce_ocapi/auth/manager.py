@@ -0,0 +1,119 @@
+"""Token manager, keeps one renewable token per credential set shared between sessions.
+"""
+
+import threading
+import time
+
+
+class TokenManager:
+    """Single-flight token holder with background renewal.
+
+    Every session built from the same credentials shares one manager, so only one OAuth
+    round-trip is ever in flight for them. A daemon timer renews the token `margin` seconds
+    before it expires, request threads only read the current token and never wait on the
+    happy path.
+
+    Args:
+        margin (float, optional): Seconds before expiry to renew in the background. Defaults to 60.
+    """
+
+    _managers = {}
+    _managers_lock = threading.Lock()
+
+    def __init__(self, margin: float = 60):
+        self.margin = margin
+        self.token = None
+        self._renew_at = 0.0
+        self._lock = threading.Lock()
+        self._timer = None
+
+    @classmethod
+    def for_credentials(cls, key: tuple, margin: float = 60) -> "TokenManager":
+        """Get the manager for a credential set, creating it on first use.
+
+        Args:
+            key (tuple): Values identifying the credentials, grant type and token endpoint.
+            margin (float, optional): Seconds before expiry to renew, only used when creating. Defaults to 60.
+
+        Returns:
+            TokenManager: Manager shared by every session with these credentials.
+        """
+        with cls._managers_lock:
+            manager = cls._managers.get(key)
+            if manager is None:
+                manager = cls(margin)
+                cls._managers[key] = manager
+            return manager
+
+    @property
+    def valid(self) -> bool:
+        """Is the current token usable without renewing?
+
+        Returns:
+            bool: True until the monotonic renewal deadline passes.
+        """
+        return time.monotonic() < self._renew_at
+
+    def get(self, fetch) -> dict:
+        """Return a valid token, fetching one if the current token expired.
+
+        Args:
+            fetch (callable): Returns a fresh token dictionary from the OAuth endpoint.
+
+        Returns:
+            dict: Bearer token.
+        """
+        if self.valid:
+            return self.token
+        with self._lock:
+            if not self.valid:
+                self._store(fetch(), fetch)
+            return self.token
+
+    def refresh(self, fetch, stale: str = None) -> dict:
+        """Force a new token, unless another caller already replaced the stale one.
+
+        Args:
+            fetch (callable): Returns a fresh token dictionary from the OAuth endpoint.
+            stale (str, optional): Access token the caller saw rejected. Defaults to None, always renew.
+
+        Returns:
+            dict: Bearer token.
+        """
+        with self._lock:
+            current = (self.token or {}).get("access_token")
+            if stale is None or current is None or current == stale:
+                self._store(fetch(), fetch)
+            return self.token
+
+    def cancel(self):
+        """Stop background renewal, the token is then only renewed by callers after expiry.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _store(self, token: dict, fetch):
+        self.token = token
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if "expires_in" not in token:
+            self._renew_at = 0.0
+            return
+        lifetime = token["expires_in"] - 15
+        self._renew_at = time.monotonic() + lifetime
+        self._timer = threading.Timer(
+            max(lifetime - min(self.margin, lifetime / 2), 0), self._background, (fetch,)
+        )
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _background(self, fetch):
+        with self._lock:
+            try:
+                self._store(fetch(), fetch)
+            except Exception:
+                # leave the current token in place, the next caller after expiry retries in the foreground
+                pass
@@ -1,10 +1,10 @@
 """ OCAPI Data Endpoints
 """
-from .code_versions import CodeVersions
-from .custom_objects import CustomObjects
-from .customer_lists import CustomerLists
-from .customer_objects_search import CustomObjectsSearch
-from .global_jobs import GlobalJobs
-from .job_execution_search import JobExecutionSearch
-from .jobs import Jobs
-from .libraries import Libraries
+from .code_versions import AsyncCodeVersions, CodeVersions
+from .custom_objects import AsyncCustomObjects, CustomObjects
+from .customer_lists import AsyncCustomerLists, CustomerLists
+from .customer_objects_search import AsyncCustomObjectsSearch, CustomObjectsSearch
+from .global_jobs import AsyncGlobalJobs, GlobalJobs
+from .job_execution_search import AsyncJobExecutionSearch, JobExecutionSearch
+from .jobs import AsyncJobs, Jobs
+from .libraries import AsyncLibraries, Libraries
@@ -4,7 +4,7 @@
 from httpx._models import Response
 
 from salesforce_ocapi.auth.helper import BaseToken
-from salesforce_ocapi.utils import Endpoint
+from salesforce_ocapi.utils import AsyncEndpoint, Endpoint
 
 
 class CodeVersions(Endpoint):
@@ -36,7 +36,7 @@ class CodeVersions(Endpoint):
         """
 
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}"
-        return Endpoint.GET(self, url, headers=headers)
+        return self.GET(url, headers=headers)
 
     def PutCodeVersions(self, code_version_id: str, headers: dict = None):
         """Create code version.
@@ -52,7 +52,7 @@ class CodeVersions(Endpoint):
         url = (
             f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/{code_version_id}"
         )
-        return Endpoint.PUT(self, url, headers=headers)
+        return self.PUT(url, headers=headers)
 
     def PatchCodeVersions(self, code_version_id: str, body: dict, headers: dict = None):
         """Patch code version.
@@ -76,7 +76,7 @@ class CodeVersions(Endpoint):
         url = (
             f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/{code_version_id}"
         )
-        return Endpoint.PATCH(self, url, headers=headers)
+        return self.PATCH(url, body=body, headers=headers)
 
     def GetCodeVersion(self, code_version_id: str, headers: dict = None) -> Response:
         """Get Code Version on Commerce Cloud Instance.
@@ -92,7 +92,7 @@ class CodeVersions(Endpoint):
         url = (
             f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/{code_version_id}"
         )
-        return Endpoint.GET(self, url, headers=headers)
+        return self.GET(url, headers=headers)
 
     def DeleteCodeVersion(self, code_version_id: str, headers: dict = None) -> Response:
         """Delete Code Version on Commerce Cloud Instance.
@@ -108,4 +108,14 @@ class CodeVersions(Endpoint):
         url = (
             f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/{code_version_id}"
         )
-        return Endpoint.DELETE(self, url, headers=headers)
+        return self.DELETE(url, headers=headers)
+
+
+class AsyncCodeVersions(CodeVersions, AsyncEndpoint):
+    """CodeVersions Endpoint for asyncio, every method returns a coroutine.
+
+    Args:
+        client (CommerceCloudBMToken): Business Manager authenticated session token.
+        instance (str, optional): Override the instance set in the client session. Defaults to None.
+        site (str, optional): Optionally use site specific context instead of global. Defaults to "-".
+    """
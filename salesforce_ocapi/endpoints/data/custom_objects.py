@@ -3,7 +3,7 @@
 
 from httpx._models import Response
 
-from salesforce_ocapi.utils import Endpoint
+from salesforce_ocapi.utils import AsyncEndpoint, Endpoint
 
 
 class CustomObjects(Endpoint):
@@ -38,7 +38,7 @@ class CustomObjects(Endpoint):
             Response: HTTPX response object.
         """
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/{object_type}/{key}"
-        return Endpoint.GET(self, url, headers=headers)
+        return self.GET(url, headers=headers)
 
     def PutCustomObject(
         self, object_type: str, key: str, body: dict, headers: dict = None
@@ -57,7 +57,7 @@ class CustomObjects(Endpoint):
             Response: HTTPX response object.
         """
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/{object_type}/{key}"
-        return Endpoint.PUT(self, url, headers=headers)
+        return self.PUT(url, body=body, headers=headers)
 
     def DeleteCustomObject(
         self, object_type: str, key: str, headers: dict = None
@@ -75,7 +75,7 @@ class CustomObjects(Endpoint):
             Response: HTTPX response object.
         """
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/{object_type}/{key}"
-        return Endpoint.DELETE(self, url, headers=headers)
+        return self.DELETE(url, headers=headers)
 
     def PatchCustomObject(
         self, object_type: str, key: str, body: dict, headers: dict = None
@@ -94,4 +94,14 @@ class CustomObjects(Endpoint):
             Response: HTTPX response object.
         """
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/{object_type}/{key}"
-        return Endpoint.PATCH(self, url, headers=headers)
+        return self.PATCH(url, body=body, headers=headers)
+
+
+class AsyncCustomObjects(CustomObjects, AsyncEndpoint):
+    """CustomObjects Endpoint for asyncio, every method returns a coroutine.
+
+    Args:
+        client (CommerceCloudBMToken): Business Manager authenticated session token.
+        instance (str, optional): Override the instance set in the client session. Defaults to None.
+        site (str, optional): Optionally use site specific context instead of global. Defaults to "-".
+    """
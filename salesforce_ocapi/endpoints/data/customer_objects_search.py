@@ -3,7 +3,7 @@
 
 from httpx._models import Response
 
-from salesforce_ocapi.utils import Endpoint
+from salesforce_ocapi.utils import AsyncEndpoint, Endpoint
 
 
 class CustomObjectsSearch(Endpoint):
@@ -37,4 +37,14 @@ class CustomObjectsSearch(Endpoint):
             Response: HTTPX response object.
         """
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/{object_type}"
-        return Endpoint.POST(self, url, body, headers=headers, idempotent=True)
+        return self.POST(url, body=body, headers=headers, idempotent=True)
+
+
+class AsyncCustomObjectsSearch(CustomObjectsSearch, AsyncEndpoint):
+    """CustomObjectsSearch Endpoint for asyncio, every method returns a coroutine.
+
+    Args:
+        client (CommerceCloudBMToken): Business Manager authenticated session token.
+        instance (str, optional): Override the instance set in the client session. Defaults to None.
+        site (str, optional): Optionally use site specific context instead of global. Defaults to "-".
+    """
@@ -3,7 +3,7 @@
 
 from httpx._models import Response
 
-from salesforce_ocapi.utils import Endpoint
+from salesforce_ocapi.utils import AsyncEndpoint, Endpoint
 
 
 class GlobalJobs(Endpoint):
@@ -38,7 +38,7 @@ class GlobalJobs(Endpoint):
         """
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/sfcc-search-index-active-data-full-update/executions"
         body = {"site_scope": site_scope}
-        return Endpoint.POST(self, url, body=body, headers=headers)
+        return self.POST(url, body=body, headers=headers)
 
     def FullContentIndexUpdate(self, site_scope: str, headers: dict = None) -> Response:
         """Full Content Index Update.
@@ -54,7 +54,7 @@ class GlobalJobs(Endpoint):
         """
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/sfcc-search-index-content-full-update/executions"
         body = {"site_scope": site_scope}
-        return Endpoint.POST(self, url, body=body, headers=headers)
+        return self.POST(url, body=body, headers=headers)
 
     def FullProductIndexUpdate(self, site_scope: str, headers: dict = None) -> Response:
         """Full Product Index Update.
@@ -70,7 +70,7 @@ class GlobalJobs(Endpoint):
         """
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/sfcc-search-index-product-full-update/executions"
         body = {"site_scope": site_scope}
-        return Endpoint.POST(self, url, body=body, headers=headers)
+        return self.POST(url, body=body, headers=headers)
 
     def IncrementatlActiveDataIndexUpdate(
         self, site_scope: str, headers: dict = None
@@ -88,7 +88,7 @@ class GlobalJobs(Endpoint):
         """
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/sfcc-search-index-active-data-incremental-update/executions"
         body = {"site_scope": site_scope}
-        return Endpoint.POST(self, url, body=body, headers=headers)
+        return self.POST(url, body=body, headers=headers)
 
     def IncrementalContentIndexUpdate(
         self, site_scope: str, headers: dict = None
@@ -106,7 +106,7 @@ class GlobalJobs(Endpoint):
         """
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/sfcc-search-index-content-incremental-update/executions"
         body = {"site_scope": site_scope}
-        return Endpoint.POST(self, url, body=body, headers=headers)
+        return self.POST(url, body=body, headers=headers)
 
     def IncrementalProductIndexUpdate(
         self, site_scope: str, headers: dict = None
@@ -124,7 +124,7 @@ class GlobalJobs(Endpoint):
         """
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/sfcc-search-index-product-incremental-update/executions"
         body = {"site_scope": site_scope}
-        return Endpoint.POST(self, url, body=body, headers=headers)
+        return self.POST(url, body=body, headers=headers)
 
     def SiteArchiveExport(
         self,
@@ -153,7 +153,7 @@ class GlobalJobs(Endpoint):
             "data_units": data_units,
             "overwrite_export_file": overwrite,
         }
-        return Endpoint.POST(self, url, body=body, headers=headers)
+        return self.POST(url, body=body, headers=headers)
 
     def SiteArchiveImport(
         self, file_path: str, mode: str = "merge", headers: dict = None
@@ -173,4 +173,14 @@ class GlobalJobs(Endpoint):
         """
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/sfcc-site-archive-import/executions"
         body = {"file_name": file_path, "mode": mode}
-        return Endpoint.POST(self, url, body=body, headers=headers)
+        return self.POST(url, body=body, headers=headers)
+
+
+class AsyncGlobalJobs(GlobalJobs, AsyncEndpoint):
+    """GlobalJobs Endpoint for asyncio, every method returns a coroutine.
+
+    Args:
+        client (CommerceCloudBMToken): Business Manager authenticated session token.
+        instance (str, optional): Override the instance set in the client session. Defaults to None.
+        site (str, optional): Optionally use site specific context instead of global. Defaults to "-".
+    """
@@ -3,7 +3,7 @@
 
 from httpx._models import Response
 
-from salesforce_ocapi.utils import Endpoint
+from salesforce_ocapi.utils import AsyncEndpoint, Endpoint
 
 
 class Jobs(Endpoint):
@@ -36,7 +36,7 @@ class Jobs(Endpoint):
             Response: HTTPX response object.
         """
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/{job_id}/executions/{id}"
-        return Endpoint.GET(self, url, headers=headers)
+        return self.GET(url, headers=headers)
 
     def DeleteJobExecution(
         self, job_id: str, id: str, headers: dict = None
@@ -54,7 +54,7 @@ class Jobs(Endpoint):
             Response: HTTPX response object.
         """
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/{job_id}/executions/{id}"
-        return Endpoint.DELETE(self, url, headers=headers)
+        return self.DELETE(url, headers=headers)
 
     def ExecuteJob(self, job_id: str, headers: dict = None) -> Response:
         """Trigger Job Execution information by Job ID.
@@ -70,4 +70,14 @@ class Jobs(Endpoint):
             Response: HTTPX response object.
         """
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/{job_id}/executions"
-        return Endpoint.POST(self, url, headers=headers)
+        return self.POST(url, headers=headers)
+
+
+class AsyncJobs(Jobs, AsyncEndpoint):
+    """Jobs Endpoint for asyncio, every method returns a coroutine.
+
+    Args:
+        client (CommerceCloudBMToken): Business Manager authenticated session token.
+        instance (str, optional): Override the instance set in the client session. Defaults to None.
+        site (str, optional): Optionally use site specific context instead of global. Defaults to "-".
+    """
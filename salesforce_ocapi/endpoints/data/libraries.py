@@ -3,7 +3,7 @@
 
 from httpx._models import Response
 
-from salesforce_ocapi.utils import Endpoint
+from salesforce_ocapi.utils import AsyncEndpoint, Endpoint
 
 
 class Libraries(Endpoint):
@@ -36,7 +36,7 @@ class Libraries(Endpoint):
             Response: HTTPX response object.
         """
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/{library_id}/content/{content_id}"
-        return Endpoint.GET(self, url, headers=headers)
+        return self.GET(url, headers=headers)
 
     def PutContentAsset(
         self, library_id: str, content_id: str, body: dict, headers: dict = None
@@ -52,4 +52,14 @@ class Libraries(Endpoint):
             Response: HTTPX response object.
         """
         url = f"{self.instance}/s/{self.site}/dw/data/v20_4/{self.base}/{library_id}/content/{content_id}"
-        return Endpoint.PUT(self, url, body, headers=headers)
+        return self.PUT(url, body=body, headers=headers)
+
+
+class AsyncLibraries(Libraries, AsyncEndpoint):
+    """Libraries Endpoint for asyncio, every method returns a coroutine.
+
+    Args:
+        client (CommerceCloudBMToken): Business Manager authenticated session token.
+        instance (str, optional): Override the instance set in the client session. Defaults to None.
+        site (str, optional): Optionally use site specific context instead of global. Defaults to "-".
+    """
@@ -1,7 +1,9 @@
 """ OCAPI Shop Endpoints
 """
-from .baskets import Baskets
-from .order_search import OrderSearch
-from .orders import Orders
-from .product_search import ProductSearch
-from .site import Site
+from .baskets import AsyncBaskets, Baskets
+from .categories import AsyncCategories, Categories
+from .order_search import AsyncOrderSearch, OrderSearch
+from .orders import AsyncOrders, Orders
+from .product_search import AsyncProductSearch, ProductSearch
+from .products import AsyncProducts, Products
+from .site import AsyncSite, Site
@@ -2,7 +2,7 @@
 """
 from httpx._models import Response
 
-from salesforce_ocapi.utils import Endpoint
+from salesforce_ocapi.utils import AsyncEndpoint, Endpoint
 
 
 class Baskets(Endpoint):
@@ -33,7 +33,7 @@ class Baskets(Endpoint):
             Response: Response to request.
         """
         url = f"{self.instance}/s/{self.site}/dw/shop/v20_4/{self.base}"
-        return Endpoint.POST(self, url, headers=headers)
+        return self.POST(url, headers=headers)
 
     def GetBasket(self, basket_id: str, headers=None) -> Response:
         """Get a basket.
@@ -46,7 +46,7 @@ class Baskets(Endpoint):
             Response: Response to request.
         """
         url = f"{self.instance}/s/{self.site}/dw/shop/v20_4/{self.base}/{basket_id}"
-        return Endpoint.GET(self, url, headers=headers)
+        return self.GET(url, headers=headers)
 
     def ModifyBasket(self, basket_id: str, body: dict, headers=None) -> Response:
         """Get a basket.
@@ -63,7 +63,7 @@ class Baskets(Endpoint):
             Response: Response to request.
         """
         url = f"{self.instance}/s/{self.site}/dw/shop/v20_4/{self.base}/{basket_id}"
-        return Endpoint.PATCH(self, url, body, headers=headers)
+        return self.PATCH(url, body=body, headers=headers)
 
     def DeleteBasket(self, basket_id: str, headers=None) -> Response:
         """Remove a basket.
@@ -76,4 +76,14 @@ class Baskets(Endpoint):
             Response: Response to request.
         """
         url = f"{self.instance}/s/{self.site}/dw/shop/v20_4/{self.base}/{basket_id}"
-        return Endpoint.DELETE(self, url, headers=headers, idempotent=True)
+        return self.DELETE(url, headers=headers)
+
+
+class AsyncBaskets(Baskets, AsyncEndpoint):
+    """Baskets Endpoint for asyncio, every method returns a coroutine.
+
+    Args:
+        client (CommerceCloudBMToken): Business Manager authenticated session token.
+        instance (str, optional): Override the instance set in the client session. Defaults to None.
+        site (str, optional): Optionally use site specific context instead of global. Defaults to "-".
+    """
@@ -0,0 +1,74 @@
+""" https://documentation.b2c.commercecloud.salesforce.com/DOC1/topic/com.demandware.dochelp/OCAPI/current/shop/Resources/Categories.html
+"""
+from httpx._models import Response
+
+from salesforce_ocapi.utils import AsyncEndpoint
+
+from .multi_id import MultiIdResource
+
+
+class Categories(MultiIdResource):
+    """Categories Endpoint
+
+    Args:
+        client (CommerceCloudBMToken): Business Manager authenticated session token.
+        instance (str, optional): Override the instance set in the client session. Defaults to None.
+        site (str): Site ID, shop resources are always site specific.
+    """
+
+    limit = 50
+
+    def __init__(self, client, site: str, instance: str = None):
+        self.base = "categories"
+        super().__init__(client, instance, site)
+
+    def __repr__(self):
+        return self.__class__.__name__
+
+    def GetCategory(
+        self, category_id: str, params: dict = None, headers: dict = None
+    ) -> Response:
+        """Get a category.
+
+        Args:
+            category_id (str): Category ID.
+            params (dict, optional): Query parameters, eg {"levels": 2}. Defaults to None.
+            headers (dict, optional): Key value pairs for headers added to request. Defaults to None.
+
+        Returns:
+            Response: HTTPX response object.
+        """
+        return self._get_one(category_id, params, headers)
+
+    def GetCategories(
+        self, category_ids, params: dict = None, headers: dict = None, workers: int = 4
+    ):
+        """Get any number of categories with multi-ID requests.
+
+        IDs are fetched 50 per request, the API maximum, with `workers` requests in flight.
+        Unknown IDs are left out of the results.
+
+        Args:
+            category_ids (iterable): Category IDs, consumed lazily.
+            params (dict, optional): Query parameters, eg {"levels": 0}. Defaults to None.
+            headers (dict, optional): Key value pairs for headers added to request. Defaults to None.
+            workers (int, optional): Concurrent requests. Defaults to 4.
+
+        Raises:
+            OCAPIException: A request failed.
+
+        Yields:
+            dict: Each category document, in the order of the IDs.
+        """
+        return self._get_ids(category_ids, params, headers, workers)
+
+
+class AsyncCategories(Categories, AsyncEndpoint):
+    """Categories Endpoint for asyncio, every method returns a coroutine and GetCategories an
+    async generator.
+
+    Args:
+        client (CommerceCloudBMToken): Business Manager authenticated session token.
+        instance (str, optional): Override the instance set in the client session. Defaults to None.
+        site (str): Site ID, shop resources are always site specific.
+    """
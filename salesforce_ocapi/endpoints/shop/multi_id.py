@@ -0,0 +1,39 @@
+""" Shared base of shop resources that can be fetched by ID or many IDs at once.
+"""
+from urllib import parse
+
+from httpx._models import Response
+
+from salesforce_ocapi.utils import Endpoint
+
+
+class MultiIdResource(Endpoint):
+    """Base for shop resources with a resource/{id} and a resource/({id1},...) form.
+
+    Subclasses set `base` and `limit`, the most IDs the API accepts in one request. IDs are
+    percent-encoded in both forms.
+
+    Args:
+        client (CommerceCloudBMToken): Business Manager authenticated session token.
+        instance (str, optional): Override the instance set in the client session. Defaults to None.
+        site (str): Use site specific context instead of global. Defaults to "-".
+    """
+
+    limit = 1
+
+    def _url(self) -> str:
+        return f"{self.instance}/s/{self.site}/dw/shop/v20_4/{self.base}"
+
+    def _headers(self, headers: dict = None) -> dict:
+        return {"x-dw-client-id": self.client.client_id, **(headers or {})}
+
+    def _get_one(
+        self, resource_id: str, params: dict = None, headers: dict = None
+    ) -> Response:
+        url = f"{self._url()}/{parse.quote(str(resource_id), safe='')}"
+        return self.GET(url, params=params, headers=self._headers(headers))
+
+    def _get_ids(self, ids, params: dict = None, headers: dict = None, workers=4):
+        return self._get_many(
+            self._url(), ids, self.limit, params, self._headers(headers), workers
+        )
@@ -2,7 +2,7 @@
 """
 from httpx._models import Response
 
-from salesforce_ocapi.utils import Endpoint
+from salesforce_ocapi.utils import AsyncEndpoint, Endpoint
 
 
 class OrderSearch(Endpoint):
@@ -21,7 +21,7 @@ class OrderSearch(Endpoint):
     def __repr__(self):
         return self.__class__.__name__
 
-    def Search(self, body, headers: dict = {}, **kwargs) -> Response:
+    def Search(self, body, headers: dict = None, **kwargs) -> Response:
         """Get Orders by Search query.
 
         [extended_summary]
@@ -35,4 +35,14 @@ class OrderSearch(Endpoint):
         """
 
         url = f"{self.instance}/s/{self.site}/dw/shop/v20_4/{self.base}"
-        return Endpoint.POST(self, url=url, body=body, headers=headers, idempotent=True)
+        return self.POST(url=url, body=body, headers=headers, idempotent=True)
+
+
+class AsyncOrderSearch(OrderSearch, AsyncEndpoint):
+    """OrderSearch Endpoint for asyncio, every method returns a coroutine.
+
+    Args:
+        client (CommerceCloudBMToken): Business Manager authenticated session token.
+        instance (str, optional): Override the instance set in the client session. Defaults to None.
+        site (str): Use site specific context instead of global.
+    """
@@ -2,7 +2,7 @@
 """
 from httpx._models import Response
 
-from salesforce_ocapi.utils import Endpoint
+from salesforce_ocapi.utils import AsyncEndpoint, Endpoint
 
 
 class Orders(Endpoint):
@@ -21,7 +21,7 @@ class Orders(Endpoint):
     def __repr__(self):
         return self.__class__.__name__
 
-    def GetOrder(self, order, headers: dict = {}) -> Response:
+    def GetOrder(self, order, headers: dict = None) -> Response:
         """Get order.
 
         Args:
@@ -31,9 +31,9 @@ class Orders(Endpoint):
             Response: HTTPX response object.
         """
         url = f"{self.instance}/s/{self.site}/dw/shop/v20_4/{self.base}/{order}"
-        return Endpoint.GET(self, url=url, headers=headers)
+        return self.GET(url=url, headers=headers)
 
-    def PatchOrder(self, order, body, headers: dict = {}) -> Response:
+    def PatchOrder(self, order, body, headers: dict = None) -> Response:
         """Edit order.
 
         Args:
@@ -45,9 +45,9 @@ class Orders(Endpoint):
         """
 
         url = f"{self.instance}/s/{self.site}/dw/shop/v20_4/{self.base}/{order}"
-        return Endpoint.PATCH(self, url=url, body=body, headers=headers)
+        return self.PATCH(url=url, body=body, headers=headers)
 
-    def AddOrderNote(self, order: str, note: dict, headers: dict = {}) -> Response:
+    def AddOrderNote(self, order: str, note: dict, headers: dict = None) -> Response:
         """Get order notes.
 
         Args:
@@ -58,9 +58,9 @@ class Orders(Endpoint):
             Response: HTTPX response object
         """
         url = f"{self.instance}/s/{self.site}/dw/shop/v20_4/{self.base}/{order}/notes"
-        return Endpoint.POST(self, url=url, body=note, headers=headers)
+        return self.POST(url=url, body=note, headers=headers)
 
-    def GetOrderNotes(self, order: str, headers: dict = {}) -> Response:
+    def GetOrderNotes(self, order: str, headers: dict = None) -> Response:
         """Get order notes.
 
         Args:
@@ -70,9 +70,9 @@ class Orders(Endpoint):
             Response: HTTPX response object
         """
         url = f"{self.instance}/s/{self.site}/dw/shop/v20_4/{self.base}/{order}/notes"
-        return Endpoint.GET(self, url=url, headers=headers)
+        return self.GET(url=url, headers=headers)
 
-    def DeleteOrderNote(self, order: str, note: str, headers: dict = {}) -> Response:
+    def DeleteOrderNote(self, order: str, note: str, headers: dict = None) -> Response:
         """Delete order note.
 
         Args:
@@ -83,4 +83,14 @@ class Orders(Endpoint):
             Response: HTTPX response object
         """
         url = f"{self.instance}/s/{self.site}/dw/shop/v20_4/{self.base}/{order}/notes/{note}"
-        return Endpoint.DELETE(self, url=url, headers=headers)
+        return self.DELETE(url=url, headers=headers)
+
+
+class AsyncOrders(Orders, AsyncEndpoint):
+    """Orders Endpoint for asyncio, every method returns a coroutine.
+
+    Args:
+        client (CommerceCloudBMToken): Business Manager authenticated session token.
+        instance (str, optional): Override the instance set in the client session. Defaults to None.
+        site (str, optional): Optionally use site specific context instead of global. Defaults to "-".
+    """
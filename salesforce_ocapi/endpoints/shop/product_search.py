@@ -2,7 +2,7 @@
 """
 from httpx._models import Response
 
-from salesforce_ocapi.utils import Endpoint
+from salesforce_ocapi.utils import AsyncEndpoint, Endpoint
 
 
 class ProductSearch(Endpoint):
@@ -21,7 +21,7 @@ class ProductSearch(Endpoint):
     def __repr__(self):
         return self.__class__.__name__
 
-    def Search(self, params: dict, headers: dict = {}, **kwargs) -> Response:
+    def Search(self, params: dict, headers: dict = None, **kwargs) -> Response:
         """Get Products by Search query.
 
         [extended_summary]
@@ -33,6 +33,16 @@ class ProductSearch(Endpoint):
         Returns:
             Response: HTTPX response object.
         """
-        headers.update({"x-dw-client-id": self.client.client_id})
+        headers = {**(headers or {}), "x-dw-client-id": self.client.client_id}
         url = f"{self.instance}/s/{self.site}/dw/shop/v20_4/{self.base}"
-        return Endpoint.GET(self, url, params=params, headers=headers)
+        return self.GET(url, params=params, headers=headers)
+
+
+class AsyncProductSearch(ProductSearch, AsyncEndpoint):
+    """ProductSearch Endpoint for asyncio, every method returns a coroutine.
+
+    Args:
+        client (CommerceCloudBMToken): Business Manager authenticated session token.
+        instance (str, optional): Override the instance set in the client session. Defaults to None.
+        site (str): Use site specific context instead of global.
+    """
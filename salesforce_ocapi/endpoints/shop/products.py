@@ -0,0 +1,74 @@
+""" https://documentation.b2c.commercecloud.salesforce.com/DOC1/topic/com.demandware.dochelp/OCAPI/current/shop/Resources/Products.html
+"""
+from httpx._models import Response
+
+from salesforce_ocapi.utils import AsyncEndpoint
+
+from .multi_id import MultiIdResource
+
+
+class Products(MultiIdResource):
+    """Products Endpoint
+
+    Args:
+        client (CommerceCloudBMToken): Business Manager authenticated session token.
+        instance (str, optional): Override the instance set in the client session. Defaults to None.
+        site (str): Site ID, shop resources are always site specific.
+    """
+
+    limit = 24
+
+    def __init__(self, client, site: str, instance: str = None):
+        self.base = "products"
+        super().__init__(client, instance, site)
+
+    def __repr__(self):
+        return self.__class__.__name__
+
+    def GetProduct(
+        self, product_id: str, params: dict = None, headers: dict = None
+    ) -> Response:
+        """Get a product.
+
+        Args:
+            product_id (str): Product ID.
+            params (dict, optional): Query parameters, eg {"expand": "prices,images"}. Defaults to None.
+            headers (dict, optional): Key value pairs for headers added to request. Defaults to None.
+
+        Returns:
+            Response: HTTPX response object.
+        """
+        return self._get_one(product_id, params, headers)
+
+    def GetProducts(
+        self, product_ids, params: dict = None, headers: dict = None, workers: int = 4
+    ):
+        """Get any number of products with multi-ID requests.
+
+        IDs are fetched 24 per request, the API maximum, with `workers` requests in flight.
+        Unknown IDs are left out of the results.
+
+        Args:
+            product_ids (iterable): Product IDs, consumed lazily.
+            params (dict, optional): Query parameters, eg {"expand": "prices,images"}. Defaults to None.
+            headers (dict, optional): Key value pairs for headers added to request. Defaults to None.
+            workers (int, optional): Concurrent requests. Defaults to 4.
+
+        Raises:
+            OCAPIException: A request failed.
+
+        Yields:
+            dict: Each product document, in the order of the IDs.
+        """
+        return self._get_ids(product_ids, params, headers, workers)
+
+
+class AsyncProducts(Products, AsyncEndpoint):
+    """Products Endpoint for asyncio, every method returns a coroutine and GetProducts an
+    async generator.
+
+    Args:
+        client (CommerceCloudBMToken): Business Manager authenticated session token.
+        instance (str, optional): Override the instance set in the client session. Defaults to None.
+        site (str): Site ID, shop resources are always site specific.
+    """
@@ -1,6 +1,6 @@
 """ https://documentation.b2c.commercecloud.salesforce.com/DOC1/topic/com.demandware.dochelp/OCAPI/current/shop/Resources/Site.html
 """
-from salesforce_ocapi.utils import Endpoint
+from salesforce_ocapi.utils import AsyncEndpoint, Endpoint
 
 
 class Site(Endpoint):
@@ -19,7 +19,7 @@ class Site(Endpoint):
     def __repr__(self):
         return self.__class__.__name__
 
-    def GetSiteInformation(self, site: str = None, headers: dict = {}):
+    def GetSiteInformation(self, site: str = None, headers: dict = None):
         """Get a Commerce Cloud order
 
         Arguments:
@@ -28,7 +28,17 @@ class Site(Endpoint):
         Returns:
             Response -- HTTPX response object
         """
-        self.site = site or self.site
-        headers.update({"x-dw-client-id": self.client.client_id})
-        url = f"{self.instance}/s/{self.site}/dw/shop/v20_4/{self.base}"
-        return Endpoint.GET(self, url, headers=headers)
+        site = site or self.site
+        headers = {**(headers or {}), "x-dw-client-id": self.client.client_id}
+        url = f"{self.instance}/s/{site}/dw/shop/v20_4/{self.base}"
+        return self.GET(url, headers=headers)
+
+
+class AsyncSite(Site, AsyncEndpoint):
+    """Site Endpoint for asyncio, every method returns a coroutine.
+
+    Args:
+        client (CommerceCloudBMToken): Business Manager authenticated session token.
+        instance (str, optional): Override the instance set in the client session. Defaults to None.
+        site (str, optional): Optionally use site specific context instead of global. Defaults to "-".
+    """
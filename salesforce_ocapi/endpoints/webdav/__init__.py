@@ -1,3 +1,3 @@
 """ WebDAV Client using access token
 """
-from .client import WebDAV
+from .client import DirectoryEntry, WebDAV
@@ -1,19 +1,218 @@
 """ https://documentation.b2c.commercecloud.salesforce.com/DOC1/topic/com.demandware.dochelp/ImportExport/UsingWebDAV.html
 """
-import time
+import json
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import closing
+from email.utils import parsedate_to_datetime
 from hashlib import md5
 from io import BytesIO
 from pathlib import Path
-from urllib.parse import urlparse
+from tempfile import SpooledTemporaryFile
+from urllib.parse import quote, unquote, urlparse, urlsplit
+from xml.etree import ElementTree
 
+from httpcore import _exceptions
+from httpx import Client
 from opnieuw import RetryException, retry
-from webdav3.client import Client
-from webdav3.exceptions import ConnectionException, NoConnection, WebDavException
 
+from salesforce_ocapi.utils.exceptions import (
+    RemoteResourceNotFound,
+    WebDAVConnectionError,
+    WebDAVException,
+    WebDAVResponseError,
+)
+from salesforce_ocapi.utils.paginator import Checkpoint
+from salesforce_ocapi.utils.request import Endpoint
+from salesforce_ocapi.utils.transport import connection_pool
+
+CHUNK_SIZE = 1024 * 1024
+PART_SIZE = 8 * 1024 * 1024
+
+_CONNECTION_ERRORS = (
+    _exceptions.NetworkError,
+    _exceptions.ProtocolError,
+    _exceptions.TimeoutException,
+)
+_PROPS = {
+    "created": "creationdate",
+    "name": "displayname",
+    "size": "getcontentlength",
+    "modified": "getlastmodified",
+    "etag": "getetag",
+    "content_type": "getcontenttype",
+}
+_PROPFIND = (
+    '<?xml version="1.0" encoding="utf-8"?><propfind xmlns="DAV:"><prop>'
+    + "".join(f"<{prop}/>" for prop in _PROPS.values())
+    + "<resourcetype/></prop></propfind>"
+).encode("utf-8")
+
+
+class DirectoryEntry:
+    """Resource found by a WebDAV listing.
+
+    Attributes:
+        created (str): Creation date.
+        name (str): Display name.
+        size (str): Content length in bytes, None for folders.
+        modified (str): Last modified date.
+        etag (str): Entity tag.
+        content_type (str): Content type.
+        isdir (bool): The resource is a folder.
+        path (str): Unquoted path of the resource on the host.
+    """
+
+    __slots__ = tuple(_PROPS) + ("isdir", "path")
+
+    def __init__(self, path: str, isdir: bool = False, **props):
+        for name in _PROPS:
+            setattr(self, name, props.get(name))
+        self.isdir = isdir
+        self.path = path
+
+    @classmethod
+    def from_element(cls, response: ElementTree.Element):
+        """Build an entry from a multistatus response element.
 
-class WebDAV:
+        Args:
+            response (Element): {DAV:}response element.
+
+        Returns:
+            DirectoryEntry: Attributes of the resource.
+        """
+        return cls(
+            unquote(urlsplit(response.findtext("{DAV:}href")).path),
+            response.find(".//{DAV:}collection") is not None,
+            **{
+                name: response.findtext(f".//{{DAV:}}{prop}") or None
+                for name, prop in _PROPS.items()
+            },
+        )
+
+    def asdict(self) -> dict:
+        """Attributes as the dictionary returned by GetInfo.
+
+        Returns:
+            dict: created, name, size, modified, etag, content_type, isdir and path.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f"DirectoryEntry(path={self.path!r}, isdir={self.isdir})"
+
+
+def _parse_multistatus(response):
+    """Yield the entries of a streamed PROPFIND response as their elements complete.
+
+    Parsed elements are dropped once turned into an entry, so memory stays flat however
+    long the listing is. Closing the generator closes the response, unread content is
+    never downloaded.
+
+    Raises:
+        WebDAVException: The body is not a complete multistatus document.
+    """
+    parser = ElementTree.XMLPullParser(events=("start", "end"))
+    root = None
+    try:
+        for chunk in response.iter_bytes():
+            parser.feed(chunk)
+            for event, element in parser.read_events():
+                if root is None:
+                    if element.tag != "{DAV:}multistatus":
+                        raise WebDAVException(
+                            f"PROPFIND answered with {element.tag}, not multistatus."
+                        )
+                    root = element
+                elif event == "end" and element.tag == "{DAV:}response":
+                    yield DirectoryEntry.from_element(element)
+                    root.clear()
+        parser.close()
+    except ElementTree.ParseError as error:
+        raise WebDAVException(f"PROPFIND response is not valid XML: {error}")
+    except _CONNECTION_ERRORS as error:
+        raise WebDAVConnectionError(error)
+    finally:
+        response.close()
+
+
+def _own_path(remote_path: str) -> str:
+    return unquote("/" + remote_path.strip("/")).rstrip("/")
+
+
+def _name(path: str) -> str:
+    return path.rstrip("/").rsplit("/", 1)[-1]
+
+
+def _timestamp(modified: str) -> float:
+    try:
+        return parsedate_to_datetime(modified).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _rechunk(chunks, size: int):
+    """Regroup a byte stream into chunks of `size` bytes, the last one may be shorter."""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        while len(buffer) >= size:
+            yield bytes(buffer[:size])
+            del buffer[:size]
+    if buffer:
+        yield bytes(buffer)
+
+
+def _seekable(file) -> bool:
+    """Can the file object be rewound, sockets and pipes have seek but refuse it."""
+    return getattr(file, "seekable", lambda: False)()
+
+
+class _Body:
+    """Request body read from a file object in chunks.
+
+    Iterating starts again from the file's initial position, so the request can be
+    replayed after a 401 or a throttle answer. Streams that cannot seek are copied into
+    a spooled temporary file as they are read, and replays send that copy first.
+    """
+
+    def __init__(self, file, chunk_size: int = CHUNK_SIZE):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.start = file.tell() if _seekable(file) else None
+        self.spool = None if _seekable(file) else SpooledTemporaryFile(PART_SIZE)
+
+    def _read(self, file):
+        while True:
+            chunk = file.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+    def __iter__(self):
+        if self.spool is None:
+            self.file.seek(self.start)
+            yield from self._read(self.file)
+            return
+        self.spool.seek(0)
+        yield from self._read(self.spool)
+        for chunk in self._read(self.file):
+            self.spool.write(chunk)
+            yield chunk
+
+    def close(self):
+        if self.spool is not None:
+            self.spool.close()
+
+
+class WebDAV(Endpoint):
     """Commerce Cloud WebDAV session.
 
+    Requests go through the shared connection pool of the instance, so WebDAV transfers
+    reuse the keep-alive connections of the OCAPI endpoints, and carry the client
+    session's current bearer token, renewed in place without rebuilding anything.
+
     Args:
         client (CommerceCloudClientSession): Active client session with Commerce Cloud for a bearer token.
         instance (str, optional): Optional commerce cloud instance, useful for opening clients to multiple instances using the same bearer token. Defaults to None.
@@ -23,32 +222,60 @@ class WebDAV:
     """
 
     def __init__(self, client, instance=None, cert=None, key=None, verify=True):
-        self.client = client
-
-        self._instance = instance or self.client.instance
-        self.options = {"webdav_hostname": self._instance.rstrip("/")}
+        super().__init__(client, instance)
+        self.instance = self.instance.rstrip("/")
         self.verify = verify
-        self.token = self.client.Token
-        self.options.update({"webdav_token": self.token["access_token"]})
-        self.webdav_client = Client(self.options)
-        self.webdav_client.verify = self.verify
-        if cert and key:
-            self.cert = str(Path(cert).resolve())
-            self.key = str(Path(key).resolve())
-            self.options.update({"cert_path": self.cert, "key_path": self.key})
+        self.cert = str(Path(cert).resolve()) if cert and key else None
+        self.key = str(Path(key).resolve()) if cert and key else None
+        self._session = None
+        self.reconnect()
+
+    def __repr__(self):
+        return self.__class__.__name__
+
+    @property
+    def session(self) -> Client:
+        """HTTPX client used for WebDAV requests.
+
+        Returns:
+            Client: Pooled client of the instance, or a client of this object alone when a
+                TLS client certificate or disabled verification needs its own connections.
+        """
+        if self._session is not None:
+            return self._session
+        return connection_pool.session(self.instance)
+
+    @property
+    def token(self) -> dict:
+        """Current bearer token of the client session.
+
+        Returns:
+            dict: Dictionary representation of the JSON bearer token response.
+        """
+        return self.client.Token
 
     def reauth(self):
-        """Checks token expiry and re-initialises the Client if a new token is needed.
+        """Checks token expiry and renews the token if a new one is needed.
+
+        Requests read the token when they are sent, so open connections are kept.
         """
-        if self.token["expires_at"] < int(time.time()):
-            self.client.getToken()
-            self.options.update({"webdav_token": self.token["access_token"]})
-            self.webdav_client = Client(self.options)
+        self.client.CheckExpiry()
 
     def reconnect(self):
-        """Re-initalise the Client session.
+        """Re-initalise the connections of a client certificate session.
+
+        Pooled connections are shared with other endpoints and dropped by the pool itself
+        when they fail, so nothing is done for them.
         """
-        self.webdav_client = Client(self.options)
+        if self.cert is None and self.verify is True:
+            return
+        if self._session is not None:
+            self._session.close()
+        self._session = Client(
+            cert=(self.cert, self.key) if self.cert else None,
+            verify=self.verify,
+            timeout=connection_pool.timeout,
+        )
 
     @property
     def hostname(self):
@@ -57,7 +284,7 @@ class WebDAV:
         Returns:
             str: Hostname including prefix eg https://
         """
-        return self.options["webdav_hostname"]
+        return self.instance
 
     @property
     def netloc(self):
@@ -66,34 +293,105 @@ class WebDAV:
         Returns:
             str: netloc of hostname.
         """
-        url = urlparse(self.options["webdav_hostname"])
+        url = urlparse(self.instance)
         return url.netloc
 
+    def _url(self, remote_path: str) -> str:
+        return f"{self.instance}/{quote(remote_path.lstrip('/'))}"
+
+    def _dav(
+        self,
+        method: str,
+        remote_path: str,
+        headers: dict = None,
+        stream: bool = False,
+        accept: tuple = (),
+        **kwargs,
+    ):
+        """Send a WebDAV request and turn failures into WebDAV exceptions.
+
+        Args:
+            method (str): HTTP or WebDAV verb.
+            remote_path (str): Path to remote resource.
+            headers (dict, optional): Headers for this request. Defaults to None.
+            stream (bool, optional): Return the response with its body unread. Defaults to False.
+            accept (tuple, optional): Error statuses returned instead of raised. Defaults to ().
+
+        Raises:
+            WebDAVConnectionError: The connection failed.
+            RemoteResourceNotFound: The server answered 404.
+            WebDAVResponseError: The server answered another error status.
+
+        Returns:
+            Response: HTTPX Response object.
+        """
+        url = self._url(remote_path)
+        try:
+            if stream:
+                with self.streaming():
+                    response = self._send(method, url, headers=headers, **kwargs)
+            else:
+                response = self._send(method, url, headers=headers, **kwargs)
+        except _CONNECTION_ERRORS as error:
+            raise WebDAVConnectionError(error)
+        if response.status_code < 400 or response.status_code in accept:
+            return response
+        response.close()
+        if response.status_code == 404:
+            raise RemoteResourceNotFound(remote_path)
+        raise WebDAVResponseError(response)
+
+    def _open_propfind(self, remote_path: str, depth: str, headers: dict = None):
+        headers = {
+            **(headers or {}),
+            "Depth": depth,
+            "Content-Type": 'application/xml; charset="utf-8"',
+        }
+        return self._dav(
+            "PROPFIND", remote_path, headers=headers, stream=True, data=_PROPFIND
+        )
+
+    def _propfind(self, remote_path: str, depth: str, headers: dict = None) -> list:
+        response = self._open_propfind(remote_path, depth, headers)
+        return [entry.asdict() for entry in _parse_multistatus(response)]
+
+    def _children(self, remote_path: str, depth: str, headers: dict = None) -> list:
+        """PROPFIND entries below a folder, without the folder itself."""
+        own_path = _own_path(remote_path)
+        return [
+            x
+            for x in self._propfind(remote_path, depth, headers)
+            if x["path"].rstrip("/") != own_path
+        ]
+
     @retry(
         retry_on_exceptions=(RetryException),
         max_calls_total=3,
         retry_window_after_first_call_in_seconds=10,
     )
-    def GetInfo(self, remote_filepath: str, headers: dict = None) -> list:
+    def GetInfo(self, remote_filepath: str, headers: dict = None) -> dict:
         """Get properties for entity
 
-        [extended_summary]
-
         Args:
             remote_filepath (str): Path to remote resource.
             headers (dict, optional): Additional headers to apply to request. Defaults to None.
 
         Raises:
             RetryException: Adds to retries counter on failure.
+            RemoteResourceNotFound: The resource doesn't exist.
 
         Returns:
-            list: WebDAV attribute information.
+            dict: WebDAV attribute information, created, name, size, modified, etag,
+                content_type, isdir and path.
         """
         try:
-            return self.webdav_client.info(remote_filepath)
-        except (NoConnection, ConnectionException, WebDavException):
-            self.reauth()
+            entries = self._propfind(remote_filepath, "0", headers)
+        except WebDAVConnectionError:
+            self.reconnect()
             raise RetryException
+        if not entries:
+            raise RemoteResourceNotFound(remote_filepath)
+        return entries[0]
 
     @retry(
         retry_on_exceptions=(RetryException),
@@ -105,63 +403,142 @@ class WebDAV:
     ) -> list:
         """Get list of files and folders in a path from WebDAV endpoint.
 
-        [extended_summary]
-
         Args:
             filepath (str): Path to get directory listing for.
             get_info (bool): returns dictionary of attributes instead of file list.
             headers (dict, optional): Additional headers to apply to request. Defaults to None.
 
         Returns:
-            list: Directory listing.
+            list: Directory listing, names with a trailing slash for folders, or attribute
+                dictionaries as returned by GetInfo.
         """
         try:
-            return self.webdav_client.list(filepath, get_info=get_info)
-        except (NoConnection, ConnectionException, WebDavException):
-            self.reauth()
+            entries = self._children(filepath, "1", headers)
+        except WebDAVConnectionError:
+            self.reconnect()
             raise RetryException
+        if get_info:
+            return entries
+        return [_name(x["path"]) + ("/" if x["isdir"] else "") for x in entries]
 
     @retry(
         retry_on_exceptions=(RetryException),
         max_calls_total=3,
         retry_window_after_first_call_in_seconds=10,
     )
+    def _open_listing(self, filepath: str, headers: dict = None):
+        try:
+            return self._open_propfind(filepath, "1", headers)
+        except WebDAVConnectionError:
+            self.reconnect()
+            raise RetryException
+
+    def StreamDirectoryList(
+        self,
+        filepath: str,
+        get_info: bool = False,
+        count: int = None,
+        headers: dict = None,
+    ):
+        """Stream the files and folders in a path as the listing downloads.
+
+        The PROPFIND response is parsed incrementally, each entry is yielded as soon as
+        its XML is complete and nothing is kept once yielded. Stopping early, or reaching
+        `count`, closes the response without reading the rest.
+
+        Example:
+            for entry in webdav.StreamDirectoryList(folder, get_info=True, count=100):
+                webdav.Delete(entry.path)
+
+        Args:
+            filepath (str): Path to get directory listing for.
+            get_info (bool, optional): Yield DirectoryEntry objects instead of names. Defaults to False.
+            count (int, optional): Most entries yielded. Defaults to None, every entry.
+            headers (dict, optional): Additional headers to apply to request. Defaults to None.
+
+        Raises:
+            WebDAVConnectionError: The connection failed during the listing.
+
+        Yields:
+            Iterator[DirectoryEntry]: Entries, or names with a trailing slash for folders.
+        """
+        if count is not None and count <= 0:
+            return
+        own_path = _own_path(filepath)
+        yielded = 0
+        response = self._open_listing(filepath, headers)
+        with closing(_parse_multistatus(response)) as entries:
+            for entry in entries:
+                if entry.path.rstrip("/") == own_path:
+                    continue
+                if get_info:
+                    yield entry
+                else:
+                    yield _name(entry.path) + ("/" if entry.isdir else "")
+                yielded += 1
+                if yielded == count:
+                    return
+
+    @retry(
+        retry_on_exceptions=(RetryException),
+        max_calls_total=3,
+        retry_window_after_first_call_in_seconds=10,
+    )
+    def _put(self, local_filepath: Path, remote_filepath: str):
+        try:
+            with open(local_filepath, "rb") as file:
+                self._dav("PUT", remote_filepath, data=_Body(file)).close()
+        except WebDAVConnectionError:
+            self.reconnect()
+            raise RetryException
+
     def Upload(self, local_filepath: str, remote_filepath: str):
         """Upload file or directory recursively to WebDAV endpoint.
 
-        [extended_summary]
+        Files are sent in chunks, never read into memory whole.
 
         Args:
             local_filepath (str): Local path to file or directory to upload.
             remote_filepath (str): Remote path to upload to.
         """
-        local_filepath = str(Path(local_filepath).resolve())
-        try:
-            self.webdav_client.upload_sync(remote_filepath, local_filepath)
-        except (NoConnection, ConnectionException, WebDavException):
-            self.reauth()
-            raise RetryException
+        local_filepath = Path(local_filepath).resolve()
+        if not local_filepath.is_dir():
+            self._put(local_filepath, remote_filepath)
+            return
+        self.MakeDir(remote_filepath)
+        for child in sorted(local_filepath.iterdir()):
+            self.Upload(child, f"{remote_filepath.rstrip('/')}/{child.name}")
 
     @retry(
         retry_on_exceptions=(RetryException),
         max_calls_total=3,
         retry_window_after_first_call_in_seconds=10,
     )
+    def _put_body(self, data, remote_filepath: str):
+        try:
+            self._dav("PUT", remote_filepath, data=data).close()
+        except WebDAVConnectionError:
+            self.reconnect()
+            raise RetryException
+
     def StreamUpload(self, payload, remote_path: str, file_name: str):
         """Upload FileIO, StringIO, BytesIO or string to WebDAV
 
-        [extended_summary]
+        File objects are sent in chunks from their current position. Streams that cannot
+        seek are spooled as they are sent, so a replayed request uploads the whole body.
 
         Args:
             payload: Stream payload
             remote_path (str): Remote path relative to host.
             file_name (str): Name for the file uploaded.
         """
-        try:
-            self.webdav_client.upload_to(payload, f"{remote_path}/{file_name}")
-        except (NoConnection, ConnectionException, WebDavException):
-            self.reauth()
-            raise RetryException
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        if isinstance(payload, bytes):
+            self._put_body(payload, f"{remote_path}/{file_name}")
+            return
+        with closing(_Body(payload)) as body:
+            self._put_body(body, f"{remote_path}/{file_name}")
 
     @retry(
         retry_on_exceptions=(RetryException),
@@ -169,15 +546,15 @@ class WebDAV:
         retry_window_after_first_call_in_seconds=10,
     )
     def MakeDir(self, remote_path: str):
-        """Make new directory at path specified.
+        """Make new directory at path specified, an existing directory is left as is.
 
         Args:
             remote_path (str): Path of proposed new directory.
         """
         try:
-            self.webdav_client.mkdir(remote_path)
-        except (NoConnection, ConnectionException, WebDavException):
-            self.reauth()
+            self._dav("MKCOL", remote_path, accept=(405,)).close()
+        except WebDAVConnectionError:
+            self.reconnect()
             raise RetryException
 
     @retry(
@@ -188,17 +565,21 @@ class WebDAV:
     def Move(
         self, remote_path_source: str, remote_path_dest: str, overwrite: bool = False
     ):
-        """Make new directory at path specified.
+        """Move a resource to another path.
 
         Args:
             remote_path_source (str): Path of source resource.
             remote_path_dest (str): Path of destination resource.
             overwrite (bool): Overwrite destination resource. Defaults to False.
         """
+        headers = {
+            "Destination": self._url(remote_path_dest),
+            "Overwrite": "T" if overwrite else "F",
+        }
         try:
-            self.webdav_client.move(remote_path_source, remote_path_dest, overwrite)
-        except (NoConnection, ConnectionException, WebDavException):
-            self.reauth()
+            self._dav("MOVE", remote_path_source, headers=headers).close()
+        except WebDAVConnectionError:
+            self.reconnect()
             raise RetryException
 
     @retry(
@@ -213,16 +594,30 @@ class WebDAV:
             remote_filepath (str): Location of resource to delete.
         """
         try:
-            self.webdav_client.clean(remote_filepath)
-        except (NoConnection, ConnectionException, WebDavException):
-            self.reauth()
+            self._dav("DELETE", remote_filepath).close()
+        except WebDAVConnectionError:
+            self.reconnect()
             raise RetryException
 
-    @retry(
-        retry_on_exceptions=(RetryException),
-        max_calls_total=3,
-        retry_window_after_first_call_in_seconds=10,
-    )
+    def _download_entry(self, local_filepath: Path, entry: dict, newer: bool = False):
+        """Download a listed resource, folders recursively.
+
+        With newer set, files already present locally are only fetched again when the
+        remote copy was modified after the local one.
+        """
+        if entry["isdir"]:
+            local_filepath.mkdir(parents=True, exist_ok=True)
+            for child in self.GetDirectoryList(entry["path"], get_info=True):
+                target = local_filepath / _name(child["path"])
+                self._download_entry(target, child, newer)
+            return
+        if newer and local_filepath.exists():
+            modified = _timestamp(entry["modified"])
+            if modified is not None and modified <= local_filepath.stat().st_mtime:
+                return
+        with open(local_filepath, "wb") as file:
+            self.StreamDownload(entry["path"], file)
+
     def Download(self, local_filepath: str, remote_filepath: str):
         """Download file/folder from WebDAV endpoint.
 
@@ -232,195 +627,423 @@ class WebDAV:
             local_filepath (str): Local path to download to, including filename of file saved.
             remote_filepath (str): Remote path to file to download.
         """
-        local_filepath = str(Path(local_filepath).resolve())
-        try:
-            self.webdav_client.download_sync(remote_filepath, local_filepath)
-        except (NoConnection, ConnectionException, WebDavException):
-            self.reauth()
-            raise RetryException
+        local_filepath = Path(local_filepath).resolve()
+        self._download_entry(local_filepath, self.GetInfo(remote_filepath))
 
-    @retry(
-        retry_on_exceptions=(RetryException),
-        max_calls_total=3,
-        retry_window_after_first_call_in_seconds=10,
-    )
     def Pull(self, local_filepath: str, remote_filepath: str):
         """Sync file/folder from WebDAV endpoint to local storage.
 
-        This downloads missing or nwer modified files from the remote to local storage.
+        This downloads missing or newer modified files from the remote to local storage.
         You can use it to do "resumeable" transfers, but the checks are slow for deeply nested files.
 
         Args:
             local_filepath (str): Local path to download to, including filename of file saved.
             remote_filepath (str): Remote path to file to download.
         """
-        local_filepath = str(Path(local_filepath).resolve())
-        try:
-            self.webdav_client.pull(remote_filepath, local_filepath)
-            return True
-        except (NoConnection, ConnectionException, WebDavException):
-            self.reauth()
-            raise RetryException
-        return False
+        local_filepath = Path(local_filepath).resolve()
+        self._download_entry(local_filepath, self.GetInfo(remote_filepath), True)
+        return True
 
-    @retry(
-        retry_on_exceptions=(RetryException),
-        max_calls_total=3,
-        retry_window_after_first_call_in_seconds=10,
-    )
     def Push(self, local_filepath: str, remote_filepath: str):
         """Sync file/folder from local storage to WebDAV endpoint.
 
-        This uploads missing or nwer modified files from the local to remote storage.
+        This uploads missing or newer modified files from the local to remote storage.
         You can use it to do "resumeable" transfers, but the checks are slow for deeply nested files.
 
         Args:
             local_filepath (str): Local path to download to, including filename of file saved.
             remote_filepath (str): Remote path to file to download.
         """
-        local_filepath = str(Path(local_filepath).resolve())
+        local_filepath = Path(local_filepath).resolve()
+        if not local_filepath.is_dir():
+            try:
+                modified = _timestamp(self.GetInfo(remote_filepath)["modified"])
+            except RemoteResourceNotFound:
+                modified = None
+            if modified is None or modified < local_filepath.stat().st_mtime:
+                self._put(local_filepath, remote_filepath)
+            return True
+        self.MakeDir(remote_filepath)
+        remote = {
+            _name(x["path"]): x
+            for x in self.GetDirectoryList(remote_filepath, get_info=True)
+        }
+        for child in sorted(local_filepath.iterdir()):
+            target = f"{remote_filepath.rstrip('/')}/{child.name}"
+            if child.is_dir():
+                self.Push(child, target)
+                continue
+            entry = remote.get(child.name)
+            modified = _timestamp(entry["modified"]) if entry else None
+            if modified is None or modified < child.stat().st_mtime:
+                self._put(child, target)
+        return True
+
+    @retry(
+        retry_on_exceptions=(RetryException),
+        max_calls_total=10,
+        retry_window_after_first_call_in_seconds=60,
+    )
+    def _download_range(
+        self,
+        local_filepath: str,
+        remote_filepath: str,
+        start: int,
+        end: int,
+        validator: str = None,
+    ) -> str:
+        """Write one byte range of a remote file at its offset in the local file.
+
+        Returns the ETag, or Last-Modified for a weak ETag, of a 206 answer, an empty
+        string if it had neither, and None when the server sent the whole file instead,
+        because it ignores Range or the file no longer matches `validator`.
+        """
+        headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+        if validator:
+            headers["If-Range"] = validator
         try:
-            self.webdav_client.push(local_filepath, remote_filepath)
+            response = self._dav("GET", remote_filepath, headers=headers, stream=True)
+            try:
+                if response.status_code != 206:
+                    return None
+                etag = response.headers.get("ETag", "")
+                if not etag or etag.startswith("W/"):
+                    etag = response.headers.get("Last-Modified", "")
+                written = 0
+                with open(local_filepath, "r+b") as file:
+                    file.seek(start)
+                    for chunk in response.iter_bytes():
+                        file.write(chunk)
+                        written += len(chunk)
+            finally:
+                response.close()
+            if written != end - start + 1:
+                raise WebDAVConnectionError(
+                    f"Range {start}-{end} of {remote_filepath} "
+                    f"ended after {written} bytes"
+                )
+            return etag
+        except _CONNECTION_ERRORS + (WebDAVConnectionError,):
+            self.reconnect()
+            raise RetryException
+
+    def ParallelDownload(
+        self,
+        local_filepath: str,
+        remote_filepath: str,
+        workers: int = 4,
+        part_size: int = PART_SIZE,
+        state: str = None,
+    ):
+        """Download a file with concurrent Range requests, resuming an interrupted download.
+
+        The local file is preallocated to the remote size and each part is written at its
+        offset by one of the workers. Finished parts are recorded in a state file next to
+        the local file, so calling this again after a failure only fetches the missing
+        parts, as long as the remote file still has the same size and ETag.
+
+        The first part pins the version of the file: every other part is requested with
+        If-Range on its ETag or Last-Modified, so a file replaced on the server part way
+        through fails the download instead of mixing two versions. A server that ignores
+        Range on the first part gets a single streamed download instead.
+
+        Args:
+            local_filepath (str): Local path to download to, including filename of file saved.
+            remote_filepath (str): Remote path to file to download.
+            workers (int, optional): Parts downloaded at the same time. Defaults to 4.
+            part_size (int, optional): Bytes per Range request. Defaults to 8MB.
+            state (str, optional): State file. Defaults to the local path plus ".part.json".
+
+        Raises:
+            RetryException: A part kept failing, the parts done so far are kept for a resume.
+            WebDAVException: Parts came back whole, the file changed on the server or Range
+                stopped being honoured. The parts done so far are kept.
+            WebDAVConnectionError: A streamed download doesn't match the remote size.
+        """
+        local_filepath = Path(local_filepath).resolve()
+        info = self.GetInfo(remote_filepath)
+        size = int(info["size"])
+        checkpoint = Checkpoint(
+            state or local_filepath.with_name(f"{local_filepath.name}.part.json")
+        )
+        version = info.get("etag") or info.get("modified")
+        fingerprint = json.dumps([remote_filepath, size, version, part_size])
+        saved = checkpoint.load(fingerprint) or {}
+        done = set(saved.get("done", []))
+        validator = saved.get("validator")
+        if (
+            not done
+            or not local_filepath.exists()
+            or local_filepath.stat().st_size != size
+        ):
+            done, validator = set(), None
+            with open(local_filepath, "wb") as file:
+                file.truncate(size)
+        parts = [
+            (n, n * part_size, min(size, (n + 1) * part_size) - 1)
+            for n in range(-(-size // part_size))
+            if n not in done
+        ]
+        lock = threading.Lock()
+
+        def fetch(part) -> bool:
+            nonlocal validator
+            n, start, end = part
+            received = self._download_range(
+                local_filepath, remote_filepath, start, end, validator
+            )
+            if received is None:
+                return False
+            with lock:
+                if validator is None:
+                    validator = received
+                done.add(n)
+                cursor = {"done": sorted(done), "validator": validator}
+                checkpoint.save(fingerprint, cursor)
             return True
-        except (NoConnection, ConnectionException, WebDavException):
-            self.reauth()
+
+        if parts and validator is None and not fetch(parts.pop(0)):
+            with open(local_filepath, "r+b") as file:
+                self.StreamDownload(remote_filepath, file)
+            if local_filepath.stat().st_size != size:
+                raise WebDAVConnectionError(
+                    f"{local_filepath} is not the {size} bytes of {remote_filepath}"
+                )
+            checkpoint.clear()
+            return
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            ranged = list(pool.map(fetch, parts))
+        missing = [part for part, ok in zip(parts, ranged) if not ok]
+        if missing:
+            raise WebDAVException(
+                f"{len(missing)} parts of {remote_filepath} came back whole, it "
+                "changed on the server or Range is no longer honoured. Finished "
+                "parts are kept."
+            )
+        checkpoint.clear()
+
+    @retry(
+        retry_on_exceptions=(RetryException),
+        max_calls_total=10,
+        retry_window_after_first_call_in_seconds=15,
+    )
+    def _open_download(self, remote_filepath: str):
+        try:
+            return self._dav("GET", remote_filepath, stream=True)
+        except WebDAVConnectionError:
+            self.reconnect()
             raise RetryException
-        return False
+
+    def IterDownload(self, remote_filepath: str, chunk_size: int = CHUNK_SIZE):
+        """Download a file as a stream of chunks.
+
+        Only one chunk is held in memory at a time, whatever the size of the file.
+        Opening the download is retried, a connection lost part way through raises
+        WebDAVConnectionError as the chunks already yielded can't be taken back.
+
+        Args:
+            remote_filepath (str): Path to remote resource to download.
+            chunk_size (int, optional): Bytes per chunk, the last one may be shorter. Defaults to 1MB.
+
+        Raises:
+            WebDAVConnectionError: The connection failed during the transfer.
+
+        Yields:
+            Iterator[bytes]: File content in order.
+        """
+        response = self._open_download(remote_filepath)
+        try:
+            yield from _rechunk(response.iter_bytes(), chunk_size)
+        except _CONNECTION_ERRORS as error:
+            raise WebDAVConnectionError(error)
+        finally:
+            response.close()
 
     @retry(
         retry_on_exceptions=(RetryException),
         max_calls_total=10,
         retry_window_after_first_call_in_seconds=15,
     )
-    def StreamDownload(self, remote_filepath: str, buffer=None, decode: bool = False):
+    def _download_into(self, remote_filepath: str, buffer, start, chunk_size: int):
+        if start is not None:
+            buffer.seek(start)
+        written = 0
+        try:
+            for chunk in self.IterDownload(remote_filepath, chunk_size):
+                buffer.write(chunk)
+                written += len(chunk)
+        except WebDAVConnectionError:
+            if start is None and written:
+                # the sink can't be rewound, a retry would duplicate content
+                raise
+            self.reconnect()
+            raise RetryException
+        if start is not None and hasattr(buffer, "truncate"):
+            buffer.truncate()
+
+    def StreamDownload(
+        self,
+        remote_filepath: str,
+        buffer=None,
+        decode: bool = False,
+        chunk_size: int = CHUNK_SIZE,
+    ):
         """Download a file in chunks to a local file buffer.
 
-        You must provide a BytesIO object or one will be created for you.
+        Any object with a write method works as the buffer, eg an open file, a socket file
+        or a mmap sized to the file, a BytesIO object is created if none is given. Memory
+        use is one chunk on top of the buffer. A failed transfer is restarted from the
+        buffer's position at the call if it can seek, otherwise it is only retried when
+        nothing was written yet.
 
         Args:
             remote_filepath (str): Path to remote resource to download.
             buffer ([type], optional): Buffer write streamed content to.
             decode (bool, optional): Optionally try to decode downloaded file into a string. Defaults to False.
+            chunk_size (int, optional): Most bytes written at once. Defaults to 1MB.
 
         Raises:
             RetryException: Adds to retries counter on failure.
 
         Returns:
-            Bytes: Returns a BytesIO object for further use.
+            Bytes: Returns the buffer positioned at the start of the content for further use.
         """
-        self.reauth()
         if buffer is None:
             buffer = BytesIO()
-        try:
-            self.webdav_client.download_from(buff=buffer, remote_path=remote_filepath)
-            if decode is True:
-                return buffer.getvalue().decode("utf-8")
-            else:
-                buffer.seek(0)
-                return buffer
-        except (NoConnection, ConnectionException, WebDavException):
-            raise RetryException
+        start = buffer.tell() if _seekable(buffer) else None
+        self._download_into(remote_filepath, buffer, start, chunk_size)
+        if decode is True:
+            return buffer.getvalue()[start:].decode("utf-8")
+        if start is not None:
+            buffer.seek(start)
+        return buffer
 
     @retry(
         retry_on_exceptions=(RetryException),
         max_calls_total=10,
         retry_window_after_first_call_in_seconds=60,
     )
-    def HashObject(self, remote_filepath: str) -> str:
+    def HashObject(self, remote_filepath: str, chunk_size: int = CHUNK_SIZE) -> dict:
         """Generate a MD5 hashsum for a remote resource.
 
-        This is streamed into memory, hashed and discarded. Optimised for low memory but
-        high bandwidth environments.
+        The file is hashed chunk by chunk as it downloads and never stored, memory use
+        stays at one chunk. Optimised for low memory but high bandwidth environments.
 
         Args:
             remote_filepath (str): Path to remote resource.
+            chunk_size (int, optional): Most bytes hashed at once. Defaults to 1MB.
 
         Raises:
             RetryException: Adds to retries counter on failure.
 
         Returns:
-            str: MDSSUM of the file requested.
+            dict: Filepath, hash type and MD5 hashsum of the file requested.
         """
-        self.reauth()
+        sum = md5()
         try:
-            sum = md5(self.StreamDownload(remote_filepath).getbuffer())
-            return {
-                "filepath": remote_filepath,
-                "hashtype": "MD5",
-                "hashsum": sum.hexdigest(),
-            }
-
-        except (NoConnection, ConnectionException, WebDavException):
+            for chunk in self.IterDownload(remote_filepath, chunk_size):
+                sum.update(chunk)
+        except WebDAVConnectionError:
             self.reconnect()
             raise RetryException
+        return {
+            "filepath": remote_filepath,
+            "hashtype": "MD5",
+            "hashsum": sum.hexdigest(),
+        }
 
-    def RecursiveFileListing(self, remote_filepath: str) -> str:
-        """Recursive filetree walker, returns paths found.
+    @retry(
+        retry_on_exceptions=(RetryException),
+        max_calls_total=3,
+        retry_window_after_first_call_in_seconds=10,
+    )
+    def _list_infinity(self, remote_path: str) -> list:
+        try:
+            return self._children(remote_path, "infinity")
+        except WebDAVConnectionError:
+            self.reconnect()
+            raise RetryException
 
-        Args:
-            remote_filepath (str): [description]
+    def Walk(self, remote_filepath: str, workers: int = 4, infinity: bool = False):
+        """Walk a folder tree, yielding every file and folder below it.
 
-        Raises:
-            RetryException: Adds to retries counter on failure.
+        Each folder is listed once with a Depth 1 PROPFIND. Listings of subfolders run on
+        up to `workers` threads while entries already received are yielded, so entries
+        come in the order listings complete rather than in tree order. Folders found are
+        queued as paths, a listing is only requested when a worker is free.
+
+        Args:
+            remote_filepath (str): Path of the folder to walk.
+            workers (int, optional): Folders listed at the same time. Defaults to 4.
+            infinity (bool, optional): Ask for the whole tree in one Depth infinity
+                PROPFIND first, walking folder by folder if the server refuses.
+                Defaults to False.
 
         Yields:
-            Iterator[str]: Yields resource paths for any files found.
+            Iterator[dict]: Attribute dictionaries as returned by GetInfo.
         """
-
-        @retry(
-            retry_on_exceptions=(RetryException),
-            max_calls_total=10,
-            retry_window_after_first_call_in_seconds=60,
-        )
-        def get_list(self, path):
-            self.reauth()
+        if infinity:
             try:
-                return self.webdav_client.list(path, get_info=True)
-            except (NoConnection, ConnectionException, WebDavException):
-                self.reconnect()
-                raise RetryException
-
-        def get_files(self, path):
-            return [x for x in get_list(self, path) if x["isdir"] is False]
-
-        def get_dirs(self, path):
-            return [x["path"] for x in get_list(self, path) if x["isdir"] is True]
-
-        yield from get_files(self, remote_filepath)
-        for subdir in get_dirs(self, remote_filepath):
-            yield from self.RecursiveFileListing(subdir)
-
-    def RecursiveFolderListing(self, remote_filepath: str) -> str:
-        """Recursive filetree walker, returns paths found.
+                entries = self._list_infinity(remote_filepath)
+            except WebDAVResponseError:
+                pass
+            else:
+                yield from entries
+                return
+        folders = deque([remote_filepath])
+        pending = set()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            try:
+                while folders or pending:
+                    while folders and len(pending) < workers:
+                        folder = folders.popleft()
+                        pending.add(pool.submit(self.GetDirectoryList, folder, True))
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        for entry in future.result():
+                            if entry["isdir"]:
+                                folders.append(entry["path"])
+                            yield entry
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def RecursiveFileListing(
+        self, remote_filepath: str, workers: int = 4, infinity: bool = False
+    ):
+        """Recursive filetree walker, returns files found.
 
         Args:
-            remote_filepath (str): [description]
+            remote_filepath (str): Path of the folder to walk.
+            workers (int, optional): Folders listed at the same time. Defaults to 4.
+            infinity (bool, optional): Try a single Depth infinity listing first. Defaults to False.
 
         Raises:
             RetryException: Adds to retries counter on failure.
 
         Yields:
-            Iterator[str]: Yields resource paths for any files found.
+            Iterator[dict]: Attribute dictionaries of the files found, see Walk.
         """
+        for entry in self.Walk(remote_filepath, workers, infinity):
+            if entry["isdir"] is False:
+                yield entry
 
-        @retry(
-            retry_on_exceptions=(RetryException),
-            max_calls_total=10,
-            retry_window_after_first_call_in_seconds=60,
-        )
-        def get_list(self, path):
-            self.reauth()
-            try:
-                return self.webdav_client.list(path, get_info=True)
-            except (NoConnection, ConnectionException, WebDavException):
-                self.reconnect()
-                raise RetryException
+    def RecursiveFolderListing(
+        self, remote_filepath: str, workers: int = 4, infinity: bool = False
+    ):
+        """Recursive filetree walker, returns paths of folders found.
 
-        def get_dirs(self, path):
-            return [x["path"] for x in get_list(self, path) if x["isdir"] is True]
+        Args:
+            remote_filepath (str): Path of the folder to walk.
+            workers (int, optional): Folders listed at the same time. Defaults to 4.
+            infinity (bool, optional): Try a single Depth infinity listing first. Defaults to False.
 
-        dirlist = get_dirs(self, remote_filepath)
+        Raises:
+            RetryException: Adds to retries counter on failure.
 
-        yield from dirlist
-        for subdir in get_dirs(self, remote_filepath):
-            yield from self.RecursiveFolderListing(subdir)
+        Yields:
+            Iterator[str]: Yields resource paths for any folders found.
+        """
+        for entry in self.Walk(remote_filepath, workers, infinity):
+            if entry["isdir"] is True:
+                yield entry["path"]
@@ -2,7 +2,14 @@
 """
 
 import salesforce_ocapi.utils.exceptions as OCAPIExceptions
+from salesforce_ocapi.utils.batch import *
+from salesforce_ocapi.utils.bulk import *
+from salesforce_ocapi.utils.cache import *
 from salesforce_ocapi.utils.fs import *
 from salesforce_ocapi.utils.paginator import *
+from salesforce_ocapi.utils.partition import *
+from salesforce_ocapi.utils.ratelimit import *
 from salesforce_ocapi.utils.request import *
+from salesforce_ocapi.utils.sync import *
+from salesforce_ocapi.utils.transport import *
 from salesforce_ocapi.utils.webdav import *
\ No newline at end of file
@@ -0,0 +1,183 @@
+""" OCAPI batch helper, sends many sub-requests in one multipart/mixed round-trip.
+"""
+import asyncio
+import email
+import re
+import uuid
+from urllib import parse
+
+from httpx import URL
+from httpx import Request as HTTPRequest
+from httpx import Response
+
+from salesforce_ocapi.utils.exceptions import OCAPIException
+from salesforce_ocapi.utils.request import Endpoint
+
+_RESOURCE = re.compile(r"^(/s/([^/]+)/dw/[^/]+/v\d+_\d+/)(.*)$")
+
+
+class Batch(Endpoint):
+    """Batch Endpoint
+
+    Collects GET, PATCH, PUT and DELETE calls made through any endpoint object of this library
+    and sends them to the OCAPI /batch resource, up to `limit` sub-requests per round-trip.
+    Each sub-request gets its own HTTPX Response back, in the order the calls were added.
+
+    Consecutive calls to the same API, version and site share a batch, a change of API or site
+    starts a new one. The batch is authorised with this object's client when it is sent, so it
+    needs the roles of every sub-request. Calls of async endpoints are queued with aadd.
+
+    Example:
+        batch = Batch(client)
+        for order_no, body in updates:
+            batch.add(orders.PatchOrder, order_no, body)
+        for response in batch.send():
+            response.raise_for_status()
+
+    Args:
+        client (CommerceCloudBMToken): Business Manager authenticated session token.
+        instance ([type], optional): Override the instance set in the client session. Defaults to None.
+        limit (int, optional): Most sub-requests per batch the server accepts. Defaults to 50.
+    """
+
+    methods = ("GET", "PATCH", "PUT", "DELETE")
+
+    def __init__(self, client, instance=None, limit: int = 50):
+        self.base = "batch"
+        self.limit = limit
+        self._items = []
+        super().__init__(client, instance)
+
+    def __repr__(self):
+        return self.__class__.__name__
+
+    def __len__(self):
+        return len(self._items)
+
+    def _record(self, method: str, url: str, headers: dict, params=None, data=None):
+        if method not in self.methods:
+            raise ValueError(f"{method} requests can't be batched.")
+        url = URL(url, params=params)
+        match = _RESOURCE.match(url.path)
+        if match is None:
+            raise ValueError(f"{url} is not an OCAPI resource.")
+        headers = {k: v for k, v in headers.items() if k.lower() != "authorization"}
+        self._items.append((method, url, match.groups(), headers, data))
+
+    def add(self, call, *args, **kwargs) -> int:
+        """Queue an endpoint call instead of sending it.
+
+        Args:
+            call (method): Bound endpoint method, eg Orders(client).PatchOrder.
+            *args, **kwargs: Arguments for the endpoint method.
+
+        Raises:
+            ValueError: The call is not a GET, PATCH, PUT or DELETE to an OCAPI resource.
+            TypeError: The call is a coroutine function, queue it with aadd.
+
+        Returns:
+            int: Position of the call's response in the list returned by send.
+        """
+        with self.recording(self._record):
+            result = call(*args, **kwargs)
+        if asyncio.iscoroutine(result):
+            result.close()
+            raise TypeError(f"{call.__qualname__} is async, queue it with aadd.")
+        return len(self._items) - 1
+
+    async def aadd(self, call, *args, **kwargs) -> int:
+        """Queue an async endpoint call instead of sending it.
+
+        Args:
+            call (method): Bound async endpoint method, eg AsyncOrders(client).PatchOrder.
+            *args, **kwargs: Arguments for the endpoint method.
+
+        Raises:
+            ValueError: The call is not a GET, PATCH, PUT or DELETE to an OCAPI resource.
+
+        Returns:
+            int: Position of the call's response in the list returned by send.
+        """
+        with self.recording(self._record):
+            await call(*args, **kwargs)
+        return len(self._items) - 1
+
+    def _chunks(self) -> list:
+        chunks = []
+        for item in self._items:
+            if (
+                not chunks
+                or len(chunks[-1]) >= self.limit
+                or chunks[-1][0][2][:2] != item[2][:2]
+            ):
+                chunks.append([])
+            chunks[-1].append(item)
+        return chunks
+
+    @staticmethod
+    def _encode(chunk: list, boundary: str) -> bytes:
+        lines = []
+        for n, (method, url, (_, _, extension), headers, data) in enumerate(chunk):
+            if url.query:
+                extension = f"{extension}?{url.query}"
+            lines += [
+                f"--{boundary}",
+                f"x-dw-content-id: {n}",
+                f"x-dw-http-method: {method}",
+                f"x-dw-resource-path-extension: {extension}",
+            ]
+            lines += [f"{k}: {v}" for k, v in headers.items()]
+            lines += ["", data or ""]
+        lines += [f"--{boundary}--", ""]
+        return "\r\n".join(lines).encode("utf-8")
+
+    @staticmethod
+    def _decode(response: Response, chunk: list) -> list:
+        message = email.message_from_bytes(
+            f"Content-Type: {response.headers['Content-Type']}\r\n\r\n".encode("utf-8")
+            + response.content
+        )
+        results = [None] * len(chunk)
+        for part in message.get_payload():
+            n = int(part["x-dw-content-id"])
+            method, url = chunk[n][:2]
+            results[n] = Response(
+                int(part.get("x-dw-status-code", 200)),
+                request=HTTPRequest(method, url),
+                headers=[(k, v) for k, v in part.items()],
+                content=part.get_payload(decode=True) or b"",
+            )
+        return results
+
+    def _post(self, chunk: list) -> list:
+        base, site, _ = chunk[0][2]
+        boundary = uuid.uuid4().hex
+        headers = {
+            "Content-Type": f"multipart/mixed; boundary={boundary}",
+            "x-dw-http-method": "POST",
+            "x-dw-resource-path": base,
+        }
+        url = f"{self.instance}/s/{parse.quote(site)}/dw/{self.base}"
+        data = self._encode(chunk, boundary)
+        response = self._send("POST", url, headers=headers, data=data)
+        if response.status_code >= 400:
+            raise OCAPIException(response)
+        return self._decode(response, chunk)
+
+    def send(self) -> list:
+        """Send every queued call and clear the queue.
+
+        Calls leave the queue once their batch went out, if a batch fails its calls and every
+        later one stay queued for another send.
+
+        Raises:
+            OCAPIException: A batch request itself failed, sub-request errors are only in their responses.
+
+        Returns:
+            list: HTTPX Response per queued call, in the order they were added.
+        """
+        responses = []
+        for chunk in self._chunks():
+            responses += self._post(chunk)
+            del self._items[: len(chunk)]
+        return responses
@@ -0,0 +1,158 @@
+""" Bulk runner, calls an endpoint method for every item of a large input with bounded concurrency.
+"""
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+
+class BulkResult:
+    """Outcome of one bulk item.
+
+    Attributes:
+        index (int): Position of the item in the input.
+        item: The work item.
+        status (int): HTTP status code, None if the call raised.
+        latency (float): Seconds the call took.
+        error (Exception): Exception raised by the call, None if it returned.
+        response (Response): HTTPX response, None if the call raised.
+    """
+
+    __slots__ = ("index", "item", "status", "latency", "error", "response")
+
+    def __init__(self, index, item, status, latency, error=None, response=None):
+        self.index = index
+        self.item = item
+        self.status = status
+        self.latency = latency
+        self.error = error
+        self.response = response
+
+    @property
+    def ok(self) -> bool:
+        """Did the call return a non-error status?
+
+        Returns:
+            bool: True for a returned response with a status below 400.
+        """
+        return self.error is None and self.status is not None and self.status < 400
+
+    def __repr__(self):
+        return (
+            f"BulkResult(index={self.index}, status={self.status}, "
+            f"latency={self.latency:.3f}, error={self.error!r})"
+        )
+
+
+class BulkRunner:
+    """Bulk Runner
+
+    Calls an endpoint method once per work item on a thread pool. Items are read from the
+    input only as workers free up, so generators such as csviter over millions of lines
+    are never held in memory. Share one endpoint object between the workers.
+
+    A tuple or list item is passed as positional arguments, a dict as keyword arguments
+    and anything else as the single argument.
+
+    Example:
+        runner = BulkRunner(Orders(client).PatchOrder, workers=16)
+        items = ((order, {"c_pickedStatus": False}) for order in csviter("orders.csv"))
+        for result in runner.run(items):
+            if not result.ok:
+                print(result)
+        print(runner.summary)
+
+    Args:
+        method (callable): Bound endpoint method, eg Orders(client).PatchOrder.
+        workers (int, optional): Calls in flight at the same time. Defaults to 8.
+        window (int, optional): Items read ahead of the workers. Defaults to twice the workers.
+        ordered (bool, optional): Yield results in input order instead of completion order.
+            Defaults to False.
+    """
+
+    def __init__(self, method, workers: int = 8, window: int = None, ordered=False):
+        self.method = method
+        self.workers = workers
+        self.window = window or workers * 2
+        self.ordered = ordered
+        self.summary = {}
+
+    def _call(self, index: int, item) -> BulkResult:
+        if isinstance(item, dict):
+            args, kwargs = (), item
+        elif isinstance(item, (tuple, list)):
+            args, kwargs = item, {}
+        else:
+            args, kwargs = (item,), {}
+        began = time.monotonic()
+        try:
+            response = self.method(*args, **kwargs)
+        except Exception as error:
+            return BulkResult(index, item, None, time.monotonic() - began, error)
+        latency = time.monotonic() - began
+        return BulkResult(index, item, response.status_code, latency, response=response)
+
+    def _record(self, result: BulkResult):
+        summary = self.summary
+        summary["total"] += 1
+        summary["ok" if result.ok else "failed"] += 1
+        if result.error is not None:
+            name = type(result.error).__name__
+            summary["errors"][name] = summary["errors"].get(name, 0) + 1
+        else:
+            summary["statuses"][result.status] = (
+                summary["statuses"].get(result.status, 0) + 1
+            )
+        summary["max_latency"] = max(summary["max_latency"], result.latency)
+        summary["mean_latency"] += (
+            result.latency - summary["mean_latency"]
+        ) / summary["total"]
+
+    def run(self, items):
+        """Run the method for every item.
+
+        The summary attribute is updated as results are yielded: total, ok, failed, counts
+        per status and per exception type, mean and max latency and elapsed seconds.
+
+        Args:
+            items (iterable): Work items, consumed lazily.
+
+        Yields:
+            BulkResult: Outcome of each item.
+        """
+        self.summary = {
+            "total": 0,
+            "ok": 0,
+            "failed": 0,
+            "statuses": {},
+            "errors": {},
+            "mean_latency": 0.0,
+            "max_latency": 0.0,
+            "elapsed": 0.0,
+        }
+        began = time.monotonic()
+        items = enumerate(items)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = [
+                pool.submit(self._call, *item) for item in islice(items, self.window)
+            ]
+            try:
+                while pending:
+                    if self.ordered:
+                        done = [pending.pop(0)]
+                    else:
+                        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        done = [future for future in pending if future in finished]
+                        pending = [
+                            future for future in pending if future not in finished
+                        ]
+                    for future in done:
+                        pending.extend(
+                            pool.submit(self._call, *item) for item in islice(items, 1)
+                        )
+                        result = future.result()
+                        self._record(result)
+                        self.summary["elapsed"] = time.monotonic() - began
+                        yield result
+            finally:
+                for future in pending:
+                    future.cancel()
@@ -0,0 +1,303 @@
+""" Response caches for repeated GET requests, in memory and ETag validators on disk.
+"""
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import closing
+from pathlib import Path
+
+from httpx import Request as HTTPRequest
+from httpx import Response
+
+# the stored body is already decoded, these no longer describe it
+_ENCODING_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+def _stored_headers(response: Response) -> list:
+    return [(k, v) for k, v in response.headers.items() if k not in _ENCODING_HEADERS]
+
+
+def _copy(response: Response) -> Response:
+    return Response(
+        response.status_code,
+        request=response.request,
+        headers=_stored_headers(response),
+        content=response.content,
+    )
+
+
+class ResponseCache:
+    """TTL and LRU bounded cache of successful GET responses.
+
+    Opt-in, assign it to an endpoint object or to Request to cover every endpoint:
+
+        cache = ResponseCache(ttl=60, ttls={"site": 600})
+        Site(client).cache = cache
+
+    Entries are keyed on instance, URL, query parameters, request headers other than
+    Authorization and the client credentials, so sessions never see each other's responses.
+    Only 200 responses are stored, every hit returns a new Response object holding the
+    decoded body.
+
+    Args:
+        maxsize (int, optional): Entries kept before the least recently used is evicted. Defaults to 1024.
+        ttl (float, optional): Seconds an entry stays fresh. Defaults to 60.
+        ttls (dict, optional): TTL overrides keyed by endpoint base, eg {"product_search": 30}. Defaults to None.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60, ttls: dict = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(instance: str, url: str, params=None, headers=None, identity=None) -> str:
+        """Build the cache key of a GET request.
+
+        Args:
+            instance (str): Instance the request goes to.
+            url (str): Request URL.
+            params (dict, optional): Query parameters. Defaults to None.
+            headers (dict, optional): Request headers, Authorization is ignored. Defaults to None.
+            identity (tuple, optional): Values identifying the credentials. Defaults to None.
+
+        Returns:
+            str: Key for get and set.
+        """
+        headers = {
+            k.lower(): v
+            for k, v in (headers or {}).items()
+            if k.lower() != "authorization"
+        }
+        return json.dumps(
+            [instance, url, params or {}, headers, identity],
+            sort_keys=True,
+            default=str,
+        )
+
+    def get(self, key: str) -> Response:
+        """Look up a fresh response.
+
+        Args:
+            key (str): Key from ResponseCache.key.
+
+        Returns:
+            Response: Copy of the cached response, None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+        _, status_code, method, url, headers, content = entry
+        return Response(
+            status_code,
+            request=HTTPRequest(method, url),
+            headers=headers,
+            content=content,
+        )
+
+    def set(self, key: str, response: Response, base: str = None):
+        """Store a response if it is cacheable.
+
+        Args:
+            key (str): Key from ResponseCache.key.
+            response (Response): Response to a GET request, read already.
+            base (str, optional): Endpoint base used to pick the TTL. Defaults to None.
+        """
+        ttl = self.ttls.get(base, self.ttl)
+        if response.status_code != 200 or ttl <= 0:
+            return
+        entry = (
+            time.monotonic() + ttl,
+            response.status_code,
+            response.request.method,
+            str(response.request.url),
+            _stored_headers(response),
+            response.content,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self):
+        """Drop every entry, counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+class ValidatorCache:
+    """SQLite backed store of ETags and response bodies for conditional GET requests.
+
+    Opt-in like ResponseCache, assign it to an endpoint object or to Request:
+
+        CodeVersions(client).validators = ValidatorCache()
+
+    A GET whose last response carried an ETag is sent with If-None-Match, a 304 answer is
+    replaced by the stored body with status 200, so callers see no difference. Keys are the
+    same as ResponseCache keys.
+
+    Args:
+        path (str, optional): SQLite database file. Defaults to "~/.sfcc/validators.db".
+    """
+
+    def __init__(
+        self, path: str = Path.joinpath(Path.home(), Path(".sfcc/validators.db"))
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600))
+        os.chmod(self.path, 0o600)
+        self.stats = {"revalidated": 0, "stored": 0}
+        with closing(sqlite3.connect(str(self.path))) as db, db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS validators ("
+                "key TEXT PRIMARY KEY, etag TEXT, headers TEXT, body BLOB, updated_at REAL)"
+            )
+
+    def _row(self, key: str) -> tuple:
+        with closing(sqlite3.connect(str(self.path))) as db:
+            return db.execute(
+                "SELECT etag, headers, body FROM validators WHERE key = ?", (key,)
+            ).fetchone()
+
+    def conditional(self, key: str) -> dict:
+        """Headers making a GET conditional on the stored ETag.
+
+        Args:
+            key (str): Key from ResponseCache.key.
+
+        Returns:
+            dict: If-None-Match header, empty if nothing is stored.
+        """
+        row = self._row(key)
+        return {"If-None-Match": row[0]} if row else {}
+
+    def resolve(self, key: str, response: Response) -> Response:
+        """Turn a 304 into the stored response and store new validated responses.
+
+        Args:
+            key (str): Key from ResponseCache.key.
+            response (Response): Response to the conditional GET, read already.
+
+        Returns:
+            Response: The stored response on 304, otherwise the response given.
+        """
+        if response.status_code == 304:
+            row = self._row(key)
+            if row is None:
+                return response
+            self.stats["revalidated"] += 1
+            return Response(
+                200,
+                request=response.request,
+                headers=json.loads(row[1]),
+                content=row[2],
+            )
+        etag = response.headers.get("ETag")
+        if response.status_code == 200 and etag:
+            with closing(sqlite3.connect(str(self.path))) as db, db:
+                db.execute(
+                    "INSERT OR REPLACE INTO validators VALUES (?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        etag,
+                        json.dumps(_stored_headers(response)),
+                        response.content,
+                        time.time(),
+                    ),
+                )
+            self.stats["stored"] += 1
+        return response
+
+    def clear(self):
+        """Forget every stored validator.
+        """
+        with closing(sqlite3.connect(str(self.path))) as db, db:
+            db.execute("DELETE FROM validators")
+
+
+class SingleFlight:
+    """Collapses identical concurrent calls into one.
+
+    The first caller for a key runs the fetch, callers arriving while it is in flight wait
+    for it and each get their own copy of the response, or the same exception.
+    """
+
+    def __init__(self):
+        self.stats = {"leaders": 0, "shared": 0}
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fetch) -> Response:
+        """Run fetch unless an identical call is in flight, then share its result.
+
+        Args:
+            key (str): Key from ResponseCache.key.
+            fetch (callable): Returns a read Response.
+
+        Returns:
+            Response: Response of the call that went upstream.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+                self.stats["leaders"] += 1
+            else:
+                self.stats["shared"] += 1
+        if not leader:
+            return _copy(call.result())
+        try:
+            response = fetch()
+        except BaseException as error:
+            call.set_exception(error)
+            raise
+        else:
+            call.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def ado(self, key: str, fetch) -> Response:
+        """Asyncio flavour of do, calls are shared between tasks of the same event loop.
+
+        Args:
+            key (str): Key from ResponseCache.key.
+            fetch (callable): Returns a coroutine resolving to a read Response.
+
+        Returns:
+            Response: Response of the call that went upstream.
+        """
+        key = (id(asyncio.get_event_loop()), key)
+        call = self._calls.get(key)
+        if call is not None:
+            self.stats["shared"] += 1
+            return _copy(await asyncio.shield(call))
+        call = self._calls[key] = asyncio.ensure_future(fetch())
+        self.stats["leaders"] += 1
+        try:
+            return await asyncio.shield(call)
+        finally:
+            self._calls.pop(key, None)
@@ -7,14 +7,20 @@ from httpx import BasicAuth
 def contenttype(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        if "body" in kwargs:
+        if kwargs.get("body") is not None:
             if type(kwargs["body"]) is str:
                 if kwargs["body"].startswith("<"):
-                    kwargs["headers"].update({"Content-Type": "application/xml"})
+                    kwargs["headers"] = {
+                        **(kwargs.get("headers") or {}),
+                        "Content-Type": "application/xml",
+                    }
                 else:
                     raise TypeError
             elif type(kwargs["body"]) is dict:
-                kwargs["headers"].update({"Content-Type": "application/json"})
+                kwargs["headers"] = {
+                    **(kwargs.get("headers") or {}),
+                    "Content-Type": "application/json",
+                }
                 kwargs["body"] = json.dumps(kwargs["body"])
             else:
                 raise TypeError()
@@ -38,7 +44,10 @@ def basicauth(func):
                     )
                     raise
                 basic_auth = BasicAuth(args[0].auth[0], args[0].auth[1])
-                kwargs["headers"].update({"Authorization": basic_auth.auth_header})
+                kwargs["headers"] = {
+                    **(kwargs.get("headers") or {}),
+                    "Authorization": basic_auth.auth_header,
+                }
         except AttributeError:
             pass
         return func(*args, **kwargs)
@@ -59,3 +59,32 @@ class IdempotentTimeout(Exception):
             "No retry attempted as method is not idempotent nor safe to retry."
         )
         super().__init__(self.message)
+
+
+class WebDAVException(Exception):
+    def __init__(self, message="WebDAV request failed."):
+        self.message = message
+        super().__init__(self.message)
+
+
+class WebDAVConnectionError(WebDAVException):
+    def __init__(self, error=None, message="WebDAV connection failed."):
+        if error:
+            message = f"WebDAV connection failed: {error}"
+        super().__init__(message)
+
+
+class RemoteResourceNotFound(WebDAVException):
+    def __init__(self, path=None, message="Remote resource not found."):
+        if path:
+            message = f"Remote resource {path} not found."
+        super().__init__(message)
+
+
+class WebDAVResponseError(WebDAVException):
+    def __init__(self, res):
+        self.response = res
+        super().__init__(
+            f"{res.http_version} {res.status_code}: "
+            f"{res.request.method} {res.request.url}"
+        )
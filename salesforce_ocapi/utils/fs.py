@@ -4,7 +4,7 @@
 import io
 import zipfile
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, Iterator
 
 
 def csvopen(path) -> list:
@@ -23,6 +23,25 @@ def csvopen(path) -> list:
         return [line.strip() for line in file.read().splitlines()]
 
 
+def csviter(path) -> Iterator[str]:
+    """Iterate over a CSV file line by line.
+
+    Lazy counterpart of csvopen, only the current line is held in memory so it suits files
+    too large to load. Blank lines are skipped.
+
+    Args:
+        path (Path or str): Local file path, either as pathlib Path object or string.
+
+    Yields:
+        str: Each entry found in the source file.
+    """
+    with open(path) as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                yield line
+
+
 class Zipper:
     """Zipfile helper class.
 
@@ -0,0 +1,146 @@
+""" Incremental JSON decoding of search responses, yields hits while the page is still downloading.
+"""
+import codecs
+import json
+
+
+class HitStream:
+    """Incremental parser for an OCAPI search result document.
+
+    Feed it the response body chunk by chunk, each element of the `hits` array is decoded and
+    yielded as soon as its closing brace arrives. Only the hit being decoded is held in memory,
+    the other top level fields (total, count, next...) are small and collected into `meta`.
+
+    Args:
+        key (str, optional): Name of the top level array to stream. Defaults to "hits".
+    """
+
+    whitespace = " \t\r\n"
+
+    def __init__(self, key: str = "hits"):
+        self.key = key
+        self.meta = {}
+        self.count = 0
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"
+        self._name = None
+        self._reset_scan()
+
+    def _reset_scan(self):
+        self._scan = None
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def _skip(self) -> bool:
+        buffer = self._buffer
+        while self._pos < len(buffer) and buffer[self._pos] in self.whitespace:
+            self._pos += 1
+        return self._pos < len(buffer)
+
+    def _value_end(self, final: bool) -> int:
+        """Index just past the value starting at the current position, None while incomplete.
+
+        Containers and strings are scanned once, resuming where the previous chunk stopped.
+        """
+        buffer = self._buffer
+        if buffer[self._pos] not in '{["':
+            end = self._pos
+            while end < len(buffer) and buffer[end] not in ",}]" + self.whitespace:
+                end += 1
+            return end if end < len(buffer) or final else None
+        index = self._pos if self._scan is None else self._scan
+        depth, in_string, escape = self._depth, self._in_string, self._escape
+        while index < len(buffer):
+            char = buffer[index]
+            index += 1
+            if in_string:
+                if escape:
+                    escape = False
+                elif char == "\\":
+                    escape = True
+                elif char == '"':
+                    in_string = False
+                    if depth == 0:
+                        return index
+            elif char == '"':
+                in_string = True
+            elif char in "{[":
+                depth += 1
+            elif char in "}]":
+                depth -= 1
+                if depth == 0:
+                    return index
+        self._scan, self._depth = index, depth
+        self._in_string, self._escape = in_string, escape
+        return None
+
+    def _take(self, end: int):
+        value = json.loads(self._buffer[self._pos : end])
+        self._pos = end
+        self._reset_scan()
+        return value
+
+    def feed(self, chunk: bytes, final: bool = False):
+        """Parse another chunk of the response body.
+
+        Args:
+            chunk (bytes): Next piece of the body.
+            final (bool, optional): This is the last chunk. Defaults to False.
+
+        Raises:
+            ValueError: The body is not a JSON object.
+
+        Yields:
+            dict: Each hit completed by this chunk.
+        """
+        self._buffer += self._decoder.decode(chunk, final)
+        while self._skip():
+            char = self._buffer[self._pos]
+            if self._state == "start":
+                if char != "{":
+                    raise ValueError("Search response is not a JSON object.")
+                self._pos += 1
+                self._state = "key"
+            elif self._state == "key":
+                if char in ",}":
+                    self._pos += 1
+                    continue
+                end = self._value_end(final)
+                if end is None:
+                    break
+                self._name = self._take(end)
+                self._state = "colon"
+            elif self._state == "colon":
+                if char != ":":
+                    raise ValueError("Search response is not a JSON object.")
+                self._pos += 1
+                self._state = "value"
+            elif self._state == "value":
+                if self._name == self.key and char == "[":
+                    self._pos += 1
+                    self._state = "hits"
+                    continue
+                end = self._value_end(final)
+                if end is None:
+                    break
+                self.meta[self._name] = self._take(end)
+                self._state = "key"
+            elif self._state == "hits":
+                if char in ",]":
+                    self._pos += 1
+                    if char == "]":
+                        self._state = "key"
+                    continue
+                end = self._value_end(final)
+                if end is None:
+                    break
+                hit = self._take(end)
+                self.count += 1
+                yield hit
+        self._buffer = self._buffer[self._pos :]
+        if self._scan is not None:
+            self._scan -= self._pos
+        self._pos = 0
@@ -1,15 +1,234 @@
 """ Request paginator helper, takes request, gets response and checks for pages, returns all pages.
 """
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from urllib import parse
 
 import jmespath
+from httpcore import TimeoutException
+from opnieuw import RetryException
 from tqdm import tqdm
 
 from salesforce_ocapi.utils.exceptions import (
+    IdempotentTimeout,
     NotOCAPIEndpoint,
     OCAPIMethodNotFound,
     PaginatorProgressHidden,
 )
+from salesforce_ocapi.utils.jsonstream import HitStream
+
+_ALL = None
+
+
+def _merge(left, right):
+    if left is _ALL or right is _ALL:
+        return _ALL
+    merged = dict(left)
+    for field, usage in right.items():
+        merged[field] = _merge(merged[field], usage) if field in merged else usage
+    return merged
+
+
+def _fields(node: dict, inner=_ALL):
+    """Fields of the input a JMESPath AST node reads, given how its result is used.
+
+    Returns a tree of field name to nested usage, _ALL where a value is needed whole.
+    Arrays are transparent, matching OCAPI select paths applying to every element.
+    """
+    kind, children = node["type"], node.get("children", [])
+    if kind == "field":
+        return {node["value"]: inner}
+    if kind in ("identity", "current", "index", "slice"):
+        return inner
+    if kind == "literal":
+        return {}
+    if kind in ("subexpression", "projection", "pipe"):
+        return _fields(children[0], _fields(children[1], inner))
+    if kind in ("index_expression", "flatten"):
+        return _fields(children[0], inner)
+    if kind == "filter_projection":
+        return _fields(
+            children[0], _merge(_fields(children[1], inner), _fields(children[2]))
+        )
+    if kind in ("or_expression", "and_expression"):
+        return _merge(_fields(children[0], inner), _fields(children[1], inner))
+    if kind == "expref":
+        return {}
+    if kind in (
+        "comparator",
+        "not_expression",
+        "function_expression",
+        "multi_select_list",
+        "multi_select_dict",
+        "key_val_pair",
+    ):
+        usage = {}
+        for child in children:
+            usage = _merge(usage, _fields(child))
+        return usage
+    return _ALL
+
+
+def _select(usage) -> str:
+    parts = []
+    for field, nested in usage.items():
+        if nested is _ALL or not nested:
+            parts.append(field)
+        else:
+            parts.append(f"{field}.{_select(nested)}")
+    return f'({",".join(parts)})'
+
+
+def _split_select(select: str) -> list:
+    """Split an OCAPI select expression into its top level fields."""
+    fields, depth, current = [], 0, ""
+    for char in select.strip()[1:-1]:
+        if char == "," and depth == 0:
+            fields.append(current.strip())
+            current = ""
+            continue
+        depth += {"(": 1, ")": -1}.get(char, 0)
+        current += char
+    if current.strip():
+        fields.append(current.strip())
+    return fields
+
+
+def _with_paging(select: str) -> str:
+    """Add the next, count and total fields pagination relies on to a select expression."""
+    fields = list(dict.fromkeys(_split_select(select) + ["next", "count", "total"]))
+    return f'({",".join(fields)})'
+
+
+def select_projection(expression) -> str:
+    """Derive the smallest OCAPI select projection a JMESPath expression needs.
+
+    Args:
+        expression (str or ParsedResult): JMESPath query, source or compiled.
+
+    Returns:
+        str: OCAPI select expression, None if the expression needs whole documents.
+    """
+    if isinstance(expression, str):
+        expression = jmespath.compile(expression)
+    usage = _fields(expression.parsed)
+    if usage is _ALL or "hits" not in usage:
+        return None
+    return _with_paging(_select(usage))
+
+
+class Checkpoint:
+    """Paginator checkpoint file.
+
+    Holds a query fingerprint and the cursor of the first page not yet fully consumed, so an
+    interrupted pagination can resume there instead of starting over.
+
+    Args:
+        path (str): Local file to keep the checkpoint in.
+        every (int, optional): Pages consumed between writes. Defaults to 1.
+    """
+
+    def __init__(self, path, every: int = 1):
+        self.path = Path(path)
+        self.every = every
+        self._pages = 0
+
+    def load(self, fingerprint: str) -> dict:
+        """Read the saved cursor for a query.
+
+        Args:
+            fingerprint (str): Query fingerprint.
+
+        Returns:
+            dict: Saved cursor, None if there is none or it belongs to another query.
+        """
+        try:
+            with open(self.path) as file:
+                saved = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if saved.get("fingerprint") != fingerprint:
+            return None
+        return saved["cursor"]
+
+    def save(self, fingerprint: str, cursor: dict):
+        """Record that pagination can continue from cursor, written every `every` pages.
+
+        Args:
+            fingerprint (str): Query fingerprint.
+            cursor (dict): Either {"start": offset} for POST or {"params": query} for GET.
+        """
+        self._pages += 1
+        if self._pages % self.every:
+            return
+        temp = self.path.with_name(f"{self.path.name}.tmp")
+        with open(temp, "w") as file:
+            json.dump({"fingerprint": fingerprint, "cursor": cursor}, file)
+        os.replace(temp, self.path)
+
+    def clear(self):
+        """Remove the checkpoint once pagination completed.
+        """
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class AdaptivePageSize:
+    """Page size tuner.
+
+    Starts at the API maximum and after every page resizes `count` so the next page should
+    take about `latency` seconds and `size` bytes, whichever limit is hit first. Growth is
+    capped at doubling per page. A page that times out halves the size instead.
+
+    Args:
+        maximum (int, optional): Largest page the API serves. Defaults to 200.
+        minimum (int, optional): Smallest page to shrink to. Defaults to 1.
+        latency (float, optional): Target seconds per page. Defaults to 5.
+        size (int, optional): Target bytes per page. Defaults to 5000000.
+    """
+
+    def __init__(
+        self,
+        maximum: int = 200,
+        minimum: int = 1,
+        latency: float = 5,
+        size: int = 5000000,
+    ):
+        self.maximum = maximum
+        self.minimum = minimum
+        self.latency = latency
+        self.size = size
+        self.count = maximum
+
+    def observe(self, count: int, elapsed: float, size: int):
+        """Resize from a completed page.
+
+        Args:
+            count (int): Page size requested.
+            elapsed (float): Seconds the page took.
+            size (int): Bytes the page held.
+        """
+        scale = min(self.latency / max(elapsed, 1e-6), self.size / max(size, 1), 2.0)
+        self.count = max(self.minimum, min(self.maximum, int(count * scale)))
+
+    def shrink(self) -> bool:
+        """Halve the page size after a timeout.
+
+        Returns:
+            bool: False when already at the minimum and the timeout should be raised.
+        """
+        if self.count <= self.minimum:
+            return False
+        self.count = max(self.minimum, self.count // 2)
+        return True
 
 
 class Paginator:
@@ -20,15 +239,49 @@ class Paginator:
     Args:
         endpoint (Endpoint Object): OCAPI endpoint object from this library.
         method (str): Name of method in the endpoint object to call.
+        progress (bool, optional): Show a progress bar. Defaults to False.
+        prefetch (int, optional): Worker threads fetching pages ahead of the caller. Once the first
+            page reports the total, every remaining start offset is known and fetched concurrently.
+            Defaults to 0, pages are fetched one after another.
+        window (int, optional): Maximum pages fetched ahead of the caller, caps memory use in prefetch
+            mode. Defaults to twice the prefetch workers.
+        checkpoint (str or Checkpoint, optional): File recording the last fully consumed page, pass
+            resume=True to hits, paginate or search to continue from it. Defaults to None.
+        checkpoint_every (int, optional): Pages between checkpoint writes. Defaults to 1.
+        page_size (str or AdaptivePageSize, optional): "auto" tunes `count` from each page's
+            latency and size and shrinks it on timeouts, overriding the count in params or
+            body. Defaults to None, the caller's count is used as is.
 
     Raises:
         NotOCAPIEndpoint: Endpoint given is not an OCAPI endpoint object.
         OCAPIMethodNotFound: Method given is not included in Endpoint object given.
     """
 
-    def __init__(self, endpoint, method, progress: bool = False, *args, **kwargs):
+    def __init__(
+        self,
+        endpoint,
+        method,
+        progress: bool = False,
+        *args,
+        prefetch: int = 0,
+        window: int = None,
+        checkpoint=None,
+        checkpoint_every: int = 1,
+        page_size=None,
+        **kwargs,
+    ):
         self._args = args
         self._kwargs = kwargs
+        self.prefetch = prefetch
+        self.window = window or prefetch * 2
+        if isinstance(checkpoint, (str, Path)):
+            checkpoint = Checkpoint(checkpoint, checkpoint_every)
+        self.checkpoint = checkpoint
+        if page_size == "auto":
+            page_size = AdaptivePageSize()
+        self.page_size = page_size
+        self.stats = {"pages": 0, "shrinks": 0, "page_size": None}
+        self._lock = threading.Lock()
         if progress:
             self.pbar = tqdm(total=0, position=0)
         else:
@@ -45,7 +298,97 @@ class Paginator:
         except AssertionError:
             raise OCAPIMethodNotFound(endpoint, method)
 
-    def _get_pages(self, params=None, *args, **kwargs):
+    def _prepare(self, params, kwargs) -> dict:
+        """Make sure POST bodies select the paging fields and carry the requested page size.
+        """
+        if "body" in kwargs:
+            if kwargs["body"].get("select"):
+                kwargs["body"]["select"] = _with_paging(kwargs["body"]["select"])
+            try:
+                if "count" in params:
+                    kwargs["body"]["count"] = params["count"]
+            except TypeError:
+                pass
+        return kwargs
+
+    def _fingerprint(self, params, kwargs) -> str:
+        """Identify a query independent of the page it is on."""
+        query = {
+            "endpoint": type(self._endpoint).__name__,
+            "instance": getattr(self._endpoint, "instance", None),
+            "site": getattr(self._endpoint, "site", None),
+            "method": self._method.__name__,
+            "args": self._args,
+            "params": {
+                k: v for k, v in (params or {}).items() if k not in ("start", "count")
+            },
+            "kwargs": {k: v for k, v in kwargs.items() if k != "body"},
+            "body": {
+                k: v
+                for k, v in (kwargs.get("body") or {}).items()
+                if k not in ("start", "count")
+            },
+        }
+        raw = json.dumps(query, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _resume(self, fingerprint: str, params, kwargs):
+        """Apply a saved cursor to the first request, returns the params to use."""
+        cursor = self.checkpoint.load(fingerprint) if self.checkpoint else None
+        if cursor is None:
+            return params
+        if "start" in cursor:
+            kwargs["body"]["start"] = cursor["start"]
+            return params
+        return cursor["params"]
+
+    def _consumed(self, fingerprint: str, page: dict):
+        """Checkpoint the cursor following a page the caller finished with."""
+        if self.checkpoint is None:
+            return
+        if not page.get("next"):
+            self.checkpoint.clear()
+        elif isinstance(page["next"], dict):
+            self.checkpoint.save(fingerprint, {"start": page["next"]["start"]})
+        else:
+            query = parse.parse_qs(parse.urlsplit(page["next"]).query)
+            self.checkpoint.save(fingerprint, {"params": query})
+
+    def _fetch(self, *args, size: int = None, **kwargs):
+        """Request one page, sized and timed when the page size adapts.
+
+        Prefetched pages pass the `size` their offset was derived from, it is kept as is and a
+        timeout only shrinks the pages requested after it.
+        """
+        sizer = self.page_size
+        while True:
+            if sizer is not None and size is None:
+                if "body" in kwargs:
+                    kwargs["body"]["count"] = sizer.count
+                else:
+                    params = kwargs.get("params") or {}
+                    kwargs["params"] = {**params, "count": sizer.count}
+            count = size or (sizer.count if sizer is not None else None)
+            began = time.monotonic()
+            try:
+                response = self._method(*args, **kwargs)
+            except (RetryException, IdempotentTimeout, TimeoutException):
+                with self._lock:
+                    shrunk = sizer is not None and sizer.shrink()
+                    if shrunk:
+                        self.stats["shrinks"] += 1
+                if not shrunk:
+                    raise
+                continue
+            with self._lock:
+                self.stats["pages"] += 1
+                if sizer is not None:
+                    elapsed = time.monotonic() - began
+                    sizer.observe(count, elapsed, len(response.content))
+                    self.stats["page_size"] = sizer.count
+            return response
+
+    def _get_pages(self, params=None, *args, resume: bool = False, **kwargs):
         """Get Pages
 
         Private method to handle getting and yielding pages until exhaustion.
@@ -54,19 +397,11 @@ class Paginator:
             response.json(): HTTPX response json() representation of the page.
         """
         args = self._args
-        kwargs = {**self._kwargs, **kwargs}
-
-        if "body" in kwargs:
-            selections = kwargs["body"].get("select")[1:-1].split(",")
-            selections.extend(["next", "count", "total"])
-            selections = list(set(selections))
-            kwargs["body"]["select"] = f'({",".join(selections)})'
-            try:
-                if "count" in params:
-                    kwargs["body"]["count"] = params["count"]
-            except TypeError:
-                pass
-        response = self._method(params=params, *args, **kwargs)
+        kwargs = self._prepare(params, {**self._kwargs, **kwargs})
+        fingerprint = self._fingerprint(params, kwargs)
+        if resume:
+            params = self._resume(fingerprint, params, kwargs)
+        response = self._fetch(params=params, *args, **kwargs)
         r = response.json()
         if len(r.get("hits", [])) == 0:
             yield response
@@ -75,22 +410,115 @@ class Paginator:
         self.pbar.total = r["total"]
         self.pbar.update(len(r["hits"]))
         yield r
+        self._consumed(fingerprint, r)
+        if self.prefetch and r.get("next"):
+            for r in self._prefetch_pages(r, response.request.method, params, kwargs):
+                yield r
+                self._consumed(fingerprint, r)
+            self.pbar.close()
+            return
         if response.request.method == "POST":
             while r.get("next"):
                 kwargs["body"]["start"] = r["next"]["start"]
-                response = self._method(*args, **kwargs)
+                response = self._fetch(*args, **kwargs)
                 r = response.json()
                 if r.get("hits"):
                     self.pbar.update(len(r["hits"]))
                     yield r
+                self._consumed(fingerprint, r)
         if response.request.method == "GET":
             while r.get("next"):
                 params = parse.parse_qs(parse.urlsplit(r["next"]).query)
-                response = self._method(params=params, *args, **kwargs)
+                response = self._fetch(params=params, *args, **kwargs)
                 r = response.json()
                 if r.get("hits"):
                     self.pbar.update(len(r["hits"]))
                     yield r
+                self._consumed(fingerprint, r)
+        self.pbar.close()
+
+    def _prefetch_pages(self, first: dict, method: str, params, kwargs):
+        """Fetch every remaining page concurrently, yielding them in order.
+
+        Start offsets follow on from the first page's start and count up to its total, each
+        page requested with the page size current when it is queued. At most `window` pages
+        are in flight or buffered at any time.
+
+        Yields:
+            response.json(): HTTPX response json() representation of the page.
+        """
+        cursor = first.get("start", 0) + first["count"]
+
+        def fetch(start, count):
+            if method == "POST":
+                body = {**kwargs["body"], "start": start, "count": count}
+                page_kwargs = {**kwargs, "body": body}
+                return self._fetch(*self._args, size=count, **page_kwargs).json()
+            page_params = {**(params or {}), "start": start, "count": count}
+            return self._fetch(
+                params=page_params, size=count, *self._args, **kwargs
+            ).json()
+
+        def submit():
+            nonlocal cursor
+            if cursor >= first["total"]:
+                return False
+            count = self.page_size.count if self.page_size else first["count"]
+            pending.append(pool.submit(fetch, cursor, count))
+            cursor += count
+            return True
+
+        with ThreadPoolExecutor(max_workers=self.prefetch) as pool:
+            pending = deque()
+            for _ in range(max(self.window, 1)):
+                if not submit():
+                    break
+            try:
+                while pending:
+                    r = pending.popleft().result()
+                    submit()
+                    if r.get("hits"):
+                        self.pbar.update(len(r["hits"]))
+                        yield r
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _stream_hits(self, params=None, *args, resume: bool = False, **kwargs):
+        """Stream Hits
+
+        Private method decoding hits straight from the response byte stream, page after page,
+        so only the hit being decoded is held in memory rather than the whole page.
+
+        Yields:
+            dict: Each "hit" object decoded from JSON.
+        """
+        args = self._args
+        kwargs = self._prepare(params, {**self._kwargs, **kwargs})
+        fingerprint = self._fingerprint(params, kwargs)
+        if resume:
+            params = self._resume(fingerprint, params, kwargs)
+        while True:
+            with self._endpoint.streaming():
+                response = self._method(params=params, *args, **kwargs)
+            parser = HitStream()
+            try:
+                for chunk in response.iter_bytes():
+                    for hit in parser.feed(chunk):
+                        self.pbar.update(1)
+                        yield hit
+                yield from parser.feed(b"", final=True)
+            finally:
+                response.close()
+            if parser.meta.get("total"):
+                self.pbar.total = parser.meta["total"]
+            self._consumed(fingerprint, parser.meta)
+            if not parser.count or not parser.meta.get("next"):
+                break
+            if response.request.method == "POST":
+                kwargs["body"]["start"] = parser.meta["next"]["start"]
+            else:
+                params = parse.parse_qs(parse.urlsplit(parser.meta["next"]).query)
         self.pbar.close()
 
     def write(self, message):
@@ -99,20 +527,36 @@ class Paginator:
         else:
             self.pbar.write(message)
 
-    def search(self, search_string: str, *args, **kwargs):
+    def search(
+        self, search_string: str, params=None, *args, pushdown: bool = True, **kwargs
+    ):
         """Search in response JSON.
 
         Filters response JSON using JMESPath queries.
 
+        Unless the request already selects specific fields, the fields the expression reads
+        are sent as the OCAPI select projection, so only those are downloaded.
+
         Args:
             search_string (str): JMESPath query.
+            params (dict, optional): Query parameters for the request. Defaults to None.
+            pushdown (bool, optional): Derive the select projection from the expression. Defaults to True.
+            resume (bool, optional): Continue from the paginator checkpoint if it was saved for
+                the same query. Defaults to False.
 
         Yields:
             dict: Filtered JSON.
         """
         expression = jmespath.compile(search_string)
-        for result in self._get_pages(*args, **kwargs):
-            if result.get("hits"):
+        select = select_projection(expression) if pushdown else None
+        body = kwargs.get("body", self._kwargs.get("body"))
+        if select and body is not None:
+            if body.get("select") in (None, "(**)"):
+                kwargs["body"] = {**body, "select": select}
+        elif select and (params or {}).get("select") is None:
+            params = {**(params or {}), "select": _with_paging(select)}
+        for result in self._get_pages(params, *args, **kwargs):
+            if isinstance(result, dict) and result.get("hits"):
                 yield expression.search(result)
 
     def paginate(self, *args, **kwargs):
@@ -120,21 +564,35 @@ class Paginator:
 
         Wrapper around the _get_pages method.
 
+        Args:
+            resume (bool, optional): Continue from the paginator checkpoint if it was saved for
+                the same query. Defaults to False.
+
         Yields:
             response.json(): HTTPX response json() representation of the page.
         """
         yield from self._get_pages(*args, **kwargs)
 
-    def hits(self, *args, **kwargs):
+    def hits(self, *args, stream: bool = False, **kwargs):
         """Hits only pagination method.
 
         Only returns the hits in the responses. Useful if you don't need additional
         fields in a response.
 
+        Args:
+            stream (bool, optional): Decode hits incrementally from the response bytes instead of
+                loading each page, peak memory is about one hit. Pages are fetched serially in
+                this mode, prefetch and page size tuning are ignored. Defaults to False.
+            resume (bool, optional): Continue from the paginator checkpoint if it was saved for
+                the same query. Defaults to False.
+
         Yields:
             dict: Each "hit" object decoded from JSON.
         """
+        if stream:
+            yield from self._stream_hits(*args, **kwargs)
+            return
         for result in self._get_pages(*args, **kwargs):
-            if result.get("hits"):
+            if isinstance(result, dict) and result.get("hits"):
                 for _ in result["hits"]:
                     yield _
@@ -0,0 +1,197 @@
+""" Partitioned search helper, splits a search into sortable field ranges and paginates them concurrently.
+"""
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from salesforce_ocapi.utils.exceptions import (
+    NotOCAPIEndpoint,
+    OCAPIException,
+    OCAPIMethodNotFound,
+)
+from salesforce_ocapi.utils.paginator import Paginator
+
+
+class PartitionedSearch:
+    """Partitioned Search
+
+    Splits a POST search into range slices over a sortable field and pages through the slices
+    concurrently, each with its own Paginator. Slices stay shallow, so no single pagination
+    runs into the deep `start` penalty or the server side cap.
+
+    Slices are sized from their `total`: a slice holding more than `max_hits` documents is halved
+    until it fits, so quiet and busy periods end up with similar amounts of work.
+
+    Args:
+        endpoint (Endpoint Object): OCAPI endpoint object from this library, eg OrderSearch.
+        method (str): Name of the search method in the endpoint object to call.
+        start (datetime or int): Lower bound of the field, inclusive.
+        end (datetime or int): Upper bound of the field, exclusive.
+        field (str, optional): Sortable field to partition on. Defaults to "creation_date".
+        slices (int, optional): Initial number of equal slices before adaptive splitting. Defaults to 8.
+        max_hits (int, optional): Largest slice allowed before it is split again. Defaults to 10000.
+        workers (int, optional): Slices paginated at the same time. Defaults to 4.
+        buffer (int, optional): Hits buffered ahead of the caller. Defaults to 1000.
+        body (dict): Search request body, its query is combined with each slice's range filter.
+
+    Raises:
+        NotOCAPIEndpoint: Endpoint given is not an OCAPI endpoint object.
+        OCAPIMethodNotFound: Method given is not included in Endpoint object given.
+    """
+
+    def __init__(
+        self,
+        endpoint,
+        method,
+        start,
+        end,
+        *args,
+        field: str = "creation_date",
+        slices: int = 8,
+        max_hits: int = 10000,
+        workers: int = 4,
+        buffer: int = 1000,
+        body: dict = None,
+        **kwargs,
+    ):
+        if not hasattr(endpoint, "base"):
+            raise NotOCAPIEndpoint(endpoint)
+        if not hasattr(endpoint, method):
+            raise OCAPIMethodNotFound(endpoint, method)
+        self._endpoint = endpoint
+        self._method_name = method
+        self._method = getattr(endpoint, method)
+        self._args = args
+        self._kwargs = kwargs
+        self.body = body or {}
+        self.start = start
+        self.end = end
+        self.field = field
+        self.slices = slices
+        self.max_hits = max_hits
+        self.workers = workers
+        self.buffer = buffer
+        self.partitions = []
+
+    @staticmethod
+    def _format(value):
+        if isinstance(value, datetime):
+            if value.tzinfo is not None:
+                value = value.astimezone(timezone.utc)
+            return value.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        return value
+
+    def _split(self, lower, upper, parts: int) -> list:
+        """Split a range into equal parts, never narrower than one second or one unit."""
+        width = upper - lower
+        smallest = timedelta(seconds=1) if isinstance(width, timedelta) else 1
+        parts = max(1, min(parts, int(width / smallest)))
+        bounds = [lower + (width * n) / parts for n in range(parts)] + [upper]
+        if isinstance(lower, int) and isinstance(upper, int):
+            bounds = [int(bound) for bound in bounds]
+        return [(bounds[n], bounds[n + 1]) for n in range(parts) if bounds[n] < bounds[n + 1]]
+
+    def _body(self, lower, upper, **extra) -> dict:
+        query = {
+            "filtered_query": {
+                "query": self.body.get("query", {"match_all_query": {}}),
+                "filter": {
+                    "range_filter": {
+                        "field": self.field,
+                        "from": self._format(lower),
+                        "to": self._format(upper),
+                        "from_inclusive": True,
+                        "to_inclusive": False,
+                    }
+                },
+            }
+        }
+        return {**self.body, "query": query, **extra}
+
+    def _total(self, lower, upper) -> int:
+        body = self._body(lower, upper, select="(total)", count=1, start=0)
+        response = self._method(*self._args, body=body, **self._kwargs)
+        if response.status_code != 200:
+            raise OCAPIException(response)
+        return response.json()["total"]
+
+    def _size(self, pool, ranges) -> list:
+        """Probe slice totals and halve the slices holding more than max_hits documents."""
+        sized = []
+        while ranges:
+            totals = list(pool.map(lambda r: self._total(*r), ranges))
+            pending = []
+            for (lower, upper), total in zip(ranges, totals):
+                halves = self._split(lower, upper, 2) if total > self.max_hits else []
+                if len(halves) == 2:
+                    pending.extend(halves)
+                elif total:
+                    sized.append((lower, upper, total))
+            ranges = pending
+        return sorted(sized, key=lambda partition: partition[0])
+
+    def hits(self, count: int = 200):
+        """Hits from every slice, merged as they arrive.
+
+        Hits are not globally ordered, within a slice they follow the body's sorts.
+
+        Args:
+            count (int, optional): Page size used by each slice. Defaults to 200.
+
+        Yields:
+            dict: Each "hit" object decoded from JSON.
+        """
+        results = queue.Queue(maxsize=self.buffer)
+        stop = threading.Event()
+        done = object()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def run(partition):
+            if stop.is_set():
+                return
+            lower, upper, _ = partition
+            try:
+                paginator = Paginator(
+                    self._endpoint,
+                    self._method_name,
+                    False,
+                    *self._args,
+                    body=self._body(lower, upper),
+                    **self._kwargs,
+                )
+                for hit in paginator.hits(params={"count": count}):
+                    if not put(hit):
+                        return
+            except Exception as error:
+                put(error)
+            finally:
+                put(done)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            self.partitions = self._size(
+                pool, self._split(self.start, self.end, self.slices)
+            )
+            futures = [pool.submit(run, partition) for partition in self.partitions]
+            remaining = len(self.partitions)
+            try:
+                while remaining:
+                    item = results.get()
+                    if item is done:
+                        remaining -= 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield item
+            finally:
+                stop.set()
+                for future in futures:
+                    future.cancel()
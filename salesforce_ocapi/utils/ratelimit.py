@@ -0,0 +1,179 @@
+""" Request scheduling per instance host, token bucket rate limit and backoff on throttling.
+"""
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+
+class _Bucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.throttled = 0
+        self.waited = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self, now: float) -> float:
+        """Take a token, returns the seconds to wait before using it."""
+        with self.lock:
+            wait = max(0.0, self.blocked_until - now)
+            if self.rate:
+                elapsed = now - self.updated
+                self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+                self.updated = now
+                self.tokens -= 1
+                if self.tokens < 0:
+                    wait = max(wait, -self.tokens / self.rate)
+            self.waited += wait
+            return wait
+
+    def block(self, until: float):
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, until)
+            self.throttled += 1
+
+
+class RateLimiter:
+    """Process wide request scheduler keyed by instance host.
+
+    Every request takes a token from its host's bucket first, refilled at `rate` per second
+    up to `burst`, so a job never goes above the quota it was given. A 429 or 503, and other
+    5xx answers to idempotent requests, are retried after the Retry-After the server sent or
+    a jittered exponential backoff. The wait applies to every request to that host, not just
+    the one throttled.
+
+    Args:
+        rate (float, optional): Requests per second per host. Defaults to None, no limit.
+        burst (int, optional): Requests allowed at once before the rate applies. Defaults to 10.
+        retries (int, optional): Times a throttled request is sent again. Defaults to 5.
+        backoff (float, optional): First backoff in seconds, doubled per attempt. Defaults to 0.5.
+        max_backoff (float, optional): Longest backoff without Retry-After. Defaults to 30.
+    """
+
+    idempotent = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+    def __init__(
+        self,
+        rate: float = None,
+        burst: int = 10,
+        retries: int = 5,
+        backoff: float = 0.5,
+        max_backoff: float = 30,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def configure(self, **kwargs):
+        """Change scheduler settings, buckets restart full with the new rate and burst.
+
+        Args:
+            **kwargs: Any of the constructor arguments.
+        """
+        for name, value in kwargs.items():
+            if not hasattr(self, name) or name.startswith("_"):
+                raise TypeError(f"Unknown rate limiter setting {name}")
+            setattr(self, name, value)
+        with self._lock:
+            self._buckets = {}
+
+    def _bucket(self, instance: str) -> _Bucket:
+        host = urlparse(instance or "").netloc
+        bucket = self._buckets.get(host)
+        if bucket is not None:
+            return bucket
+        with self._lock:
+            return self._buckets.setdefault(host, _Bucket(self.rate, self.burst))
+
+    def reserve(self, instance: str) -> float:
+        """Take a token for a request to an instance.
+
+        Args:
+            instance (str): Instance URL including scheme, eg https://
+
+        Returns:
+            float: Seconds to wait before sending.
+        """
+        return self._bucket(instance).reserve(time.monotonic())
+
+    def retry_after(self, instance: str, method: str, response, attempt: int) -> float:
+        """Decide whether a response should be retried and block the host meanwhile.
+
+        Args:
+            instance (str): Instance URL including scheme, eg https://
+            method (str): HTTP verb of the request.
+            response (Response): Response received.
+            attempt (int): Retries already made for this request.
+
+        Returns:
+            float: Seconds to wait before retrying, None to keep the response.
+        """
+        status = response.status_code
+        if status != 429 and status != 503 and not (
+            status >= 500 and method in self.idempotent
+        ):
+            return None
+        if attempt >= self.retries:
+            return None
+        delay = self._parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            cap = min(self.max_backoff, self.backoff * 2 ** attempt)
+            delay = random.uniform(cap / 2, cap)
+        self._bucket(instance).block(time.monotonic() + delay)
+        return delay
+
+    @staticmethod
+    def _parse_retry_after(value: str) -> float:
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def state(self, instance: str = None) -> dict:
+        """Current throttle state.
+
+        Args:
+            instance (str, optional): Only this instance. Defaults to None, every host seen.
+
+        Returns:
+            dict: Per host available tokens, seconds still blocked by a throttle answer,
+                throttle answers received and total seconds requests waited.
+        """
+        now = time.monotonic()
+        if instance is not None:
+            buckets = {urlparse(instance).netloc: self._bucket(instance)}
+        else:
+            buckets = dict(self._buckets)
+        state = {}
+        for host, bucket in buckets.items():
+            with bucket.lock:
+                tokens = bucket.tokens
+                if bucket.rate:
+                    elapsed = now - bucket.updated
+                    tokens = min(bucket.burst, tokens + elapsed * bucket.rate)
+                state[host] = {
+                    "tokens": tokens if bucket.rate else None,
+                    "blocked_for": max(0.0, bucket.blocked_until - now),
+                    "throttled": bucket.throttled,
+                    "waited": bucket.waited,
+                }
+        return state
+
+
+rate_limiter = RateLimiter()
+"""Scheduler shared by every endpoint and token session in this process."""
@@ -1,31 +1,269 @@
 """ Helper methods for doing HTTP requests.
 """
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from hashlib import sha256
+from itertools import islice
+from urllib import parse
+
 from httpcore import _exceptions
-from httpx import Client, Response
-from opnieuw import RetryException, retry
+from httpx import AsyncClient, Client
+from httpx import Request as HTTPRequest
+from httpx import Response
+from opnieuw import RetryException, retry, retry_async
 
+from salesforce_ocapi.utils.cache import ResponseCache, SingleFlight
 from salesforce_ocapi.utils.decorators import basicauth, contenttype
-from salesforce_ocapi.utils.exceptions import IdempotentTimeout
+from salesforce_ocapi.utils.exceptions import IdempotentTimeout, OCAPIException
+from salesforce_ocapi.utils.ratelimit import rate_limiter
+from salesforce_ocapi.utils.transport import connection_pool
+
+_streaming = ContextVar("streaming", default=False)
+_recording = ContextVar("recording", default=None)
+_flights = SingleFlight()
+
+
+def _multi_id_chunks(url: str, ids, limit: int):
+    """Chunks of at most `limit` IDs with their multi-ID URL, url/(id1,id2,...)."""
+    ids = iter(ids)
+    while True:
+        chunk = [str(i) for i in islice(ids, limit)]
+        if not chunk:
+            return
+        quoted = ",".join(parse.quote(i, safe="") for i in chunk)
+        yield chunk, f"{url}/({quoted})"
+
+
+def _multi_id_data(response: Response, ids: list) -> list:
+    """Documents of a multi-ID response in the order of the requested IDs."""
+    if response.status_code >= 400:
+        raise OCAPIException(response)
+    documents = {doc.get("id"): doc for doc in response.json().get("data", [])}
+    return [documents[i] for i in ids if i in documents]
 
 
 class Request:
     """Start a requests session and provide helper methods for HTTP verbs.
+
+    Attributes:
+        cache (ResponseCache): Optional cache for GET responses, None by default. Set on an
+            endpoint object or on this class to cover every endpoint.
+        validators (ValidatorCache): Optional store of ETags and bodies for conditional GETs,
+            None by default, set like cache.
+        coalesce (bool): Share one upstream call between identical GETs in flight at the same
+            time, across threads or tasks. Defaults to True.
     """
 
+    cache = None
+    validators = None
+    coalesce = True
+
     def __init__(self):
-        self.session = Client(timeout=10)
-        self.headers = self.client.AuthHeader
+        self.headers = {}
+
+    @property
+    def session(self) -> Client:
+        """Shared HTTPX client for the instance this object talks to.
+
+        Returns:
+            Client: Pooled client from the process wide connection pool.
+        """
+        return connection_pool.session(self.instance)
+
+    def InjectAttrs(self, **kwargs) -> dict:
+        """Compose the headers of one request, this object's headers are left untouched so one
+        endpoint object can be shared between threads.
+
+        Args:
+            headers (dict, optional): Key value pairs for headers of this request.
+
+        Returns:
+            dict: This object's headers updated with the request's headers.
+        """
+        return {**self.headers, **(kwargs.get("headers") or {})}
+
+    def _auth_headers(self, headers: dict = None) -> dict:
+        """Compose request headers with a bearer token that is fresh at send time.
+
+        Args:
+            headers (dict, optional): Headers for this request only. Defaults to None.
+
+        Returns:
+            dict: Authorization header from the client session merged with injected headers.
+        """
+        return {**self.client.AuthHeader, **self.InjectAttrs(headers=headers)}
+
+    def _reauthenticate(self, headers: dict = None, response: Response = None) -> bool:
+        """Renew the bearer token after a 401, unless the caller supplied its own Authorization.
+
+        The token sent with the rejected request is handed to the client, so threads that got
+        a 401 for a token another thread already replaced replay without fetching again.
+
+        Args:
+            headers (dict, optional): Headers of the request that got the 401. Defaults to None.
+            response (Response, optional): The 401 response. Defaults to None.
+
+        Returns:
+            bool: True if the token was renewed and the request should be replayed.
+        """
+        if "Authorization" in self.InjectAttrs(headers=headers):
+            return False
+        rejected = None
+        if response is not None:
+            sent = response.request.headers.get("Authorization", "")
+            rejected = sent[len("Bearer ") :] if sent.startswith("Bearer ") else None
+        self.client.getToken(rejected)
+        return True
+
+    @contextmanager
+    def streaming(self):
+        """Return responses with unread bodies for requests made inside this block.
+
+        The caller iterates response.iter_bytes() and must close the response. The flag is
+        held in a context variable, so other threads using the same endpoint are unaffected.
+        """
+        token = _streaming.set(True)
+        try:
+            yield
+        finally:
+            _streaming.reset(token)
+
+    @contextmanager
+    def recording(self, record):
+        """Hand requests made inside this block to `record` instead of sending them.
+
+        `record` is called with the method, URL, headers and request keyword arguments, the
+        endpoint method gets back an empty 202 response. No token is fetched for recorded
+        requests. Used to collect batch sub-requests, from sync and async endpoints alike.
+
+        Args:
+            record (callable): Receives each request that would have been sent.
+        """
+        token = _recording.set(record)
+        try:
+            yield
+        finally:
+            _recording.reset(token)
+
+    def _recorded(
+        self, method: str, url: str, headers: dict = None, **kwargs
+    ) -> Response:
+        """Hand a request to the active recorder instead of sending it.
+
+        The headers carry no bearer token, whoever sends the recorded request authorises it.
+        """
+        _recording.get()(method, url, self.InjectAttrs(headers=headers), **kwargs)
+        return Response(202, request=HTTPRequest(method, url))
+
+    def _request(
+        self, method: str, url: str, headers: dict = None, **kwargs
+    ) -> Response:
+        if _recording.get() is not None:
+            return self._recorded(method, url, headers=headers, **kwargs)
+        if _streaming.get():
+            request = self.session.build_request(
+                method, url, headers=self._auth_headers(headers), **kwargs
+            )
+            return self.session.send(request, stream=True)
+        return self.session.request(
+            method, url, headers=self._auth_headers(headers), **kwargs
+        )
+
+    @property
+    def throttle(self) -> dict:
+        """Rate limiter state of this object's instance.
+
+        Returns:
+            dict: Available tokens, seconds blocked, throttle answers and seconds waited.
+        """
+        return rate_limiter.state(self.instance)[connection_pool.host(self.instance)]
+
+    def _identity(self, headers: dict = None) -> tuple:
+        """Values telling the credentials of a request apart.
+
+        The client's bearer token rotates, so its client ID and user stand in for it. An
+        Authorization header set on the request, such as basic auth, is included as a digest.
+        """
+        client = getattr(self, "client", None)
+        supplied = {k.lower(): v for k, v in (headers or {}).items()}.get("authorization")
+        return (
+            getattr(client, "client_id", None),
+            getattr(client, "bm_user", None),
+            sha256(supplied.encode("utf-8")).hexdigest() if supplied else None,
+        )
+
+    def _cache_key(self, url: str, params, headers: dict = None) -> str:
+        """Cache key of a GET, None when no cache is set or the response can't be cached."""
+        if self.cache is None and self.validators is None and not self.coalesce:
+            return None
+        if _streaming.get() or _recording.get() is not None:
+            return None
+        headers = self.InjectAttrs(headers=headers)
+        identity = self._identity(headers)
+        return ResponseCache.key(self.instance, url, params, headers, identity)
+
+    def _get(self, url: str, params=None, headers: dict = None) -> Response:
+        """Send a GET, answered from the response cache when one is set and holds it, and
+        coalesced with an identical GET already in flight.
+        """
+        key = self._cache_key(url, params, headers)
+        if key is None:
+            return self._send("GET", url, headers=headers, params=params)
+        response = self.cache.get(key) if self.cache is not None else None
+        if response is None:
+            if self.coalesce:
+                response = _flights.do(
+                    key, lambda: self._get_upstream(key, url, params, headers)
+                )
+            else:
+                response = self._get_upstream(key, url, params, headers)
+        return response
+
+    def _get_upstream(self, key: str, url: str, params, headers: dict) -> Response:
+        """Send a GET, revalidated with If-None-Match when a validator cache holds its ETag,
+        and store the response in the response cache.
+        """
+        if self.validators is not None:
+            headers = {**(headers or {}), **self.validators.conditional(key)}
+            response = self._send("GET", url, headers=headers, params=params)
+            response = self.validators.resolve(key, response)
+        else:
+            response = self._send("GET", url, headers=headers, params=params)
+        if self.cache is not None:
+            self.cache.set(key, response, getattr(self, "base", None))
+        return response
+
+    def _send(self, method: str, url: str, headers: dict = None, **kwargs) -> Response:
+        """Send a request with the current token, replaying it once on 401 after renewing.
 
-    def InjectAttrs(self, **kwargs):
-        """Add custom headers if requested, default authorisation header included in __init__.
+        Requests wait for the instance's rate limiter and throttled requests are sent again
+        once the rate limiter's backoff has passed.
 
         Args:
-            headers (dict): Key value pairs for headers
+            method (str): HTTP verb.
+            url (str): URL to connect to.
+
+        Returns:
+            Response: HTTPX Response object.
         """
-        if kwargs.get("headers"):
-            self.headers = {**self.headers, **kwargs.get("headers")}
-        if kwargs.get("start"):
-            self.body.update({"start": kwargs.get("start")})
+        attempt = 0
+        while True:
+            if _recording.get() is None:
+                wait = rate_limiter.reserve(self.instance)
+                if wait:
+                    time.sleep(wait)
+            response = self._request(method, url, headers=headers, **kwargs)
+            if response.status_code == 401 and self._reauthenticate(headers, response):
+                response.close()
+                response = self._request(method, url, headers=headers, **kwargs)
+            if rate_limiter.retry_after(self.instance, method, response, attempt) is None:
+                return response
+            response.close()
+            attempt += 1
 
     @retry(
         retry_on_exceptions=(RetryException),
@@ -33,7 +271,7 @@ class Request:
         retry_window_after_first_call_in_seconds=10,
     )
     @basicauth
-    def GET(self, url, params={}, headers: dict = {}) -> Response:
+    def GET(self, url, params=None, headers: dict = None) -> Response:
         """HTTP GET Request
 
         Args:
@@ -43,9 +281,8 @@ class Request:
         Returns:
             Response -- HTTPX Response object
         """
-        self.InjectAttrs(headers=headers)
         try:
-            response = self.session.get(url, params=params, headers=self.headers)
+            response = self._get(url, params=params, headers=headers)
             return response
         except _exceptions.TimeoutException:
             raise RetryException
@@ -58,7 +295,7 @@ class Request:
     @contenttype
     @basicauth
     def PATCH(
-        self, url: str, body=None, headers: dict = {}, idempotent: bool = False,
+        self, url: str, body=None, headers: dict = None, idempotent: bool = False,
     ) -> Response:
         """HTTP PATCH Request
 
@@ -71,14 +308,16 @@ class Request:
         Returns:
             Response -- HTTPX Response object
         """
-        self.InjectAttrs(headers=headers)
         try:
-            response = self.session.patch(url, data=body, headers=self.headers)
+            response = self._send("PATCH", url, headers=headers, data=body)
             return response
         except _exceptions.TimeoutException:
             if idempotent is False:
                 raise IdempotentTimeout(
-                    method="PATCH", url=url, data=body, headers=self.headers
+                    method="PATCH",
+                    url=url,
+                    data=body,
+                    headers=self.InjectAttrs(headers=headers),
                 )
             else:
                 print("retry")
@@ -91,7 +330,7 @@ class Request:
     )
     @contenttype
     @basicauth
-    def PUT(self, url: str, body: dict = {}, headers: dict = {}) -> Response:
+    def PUT(self, url: str, body: dict = None, headers: dict = None) -> Response:
         """HTTP PUT Request
 
         Args:
@@ -102,9 +341,8 @@ class Request:
         Returns:
             Response -- HTTPX Response object
         """
-        self.InjectAttrs(headers=headers)
         try:
-            response = self.session.put(url, data=body, headers=self.headers)
+            response = self._send("PUT", url, headers=headers, data=body)
             return response
         except _exceptions.TimeoutException:
             raise RetryException
@@ -121,7 +359,7 @@ class Request:
         url: str,
         body: str = None,
         params: dict = None,
-        headers: dict = {},
+        headers: dict = None,
         idempotent: bool = False,
     ) -> Response:
         """HTTP POST Request
@@ -136,16 +374,18 @@ class Request:
         Returns:
             Response -- HTTPX Response object
         """
-        self.InjectAttrs(headers=headers)
         try:
-            response = self.session.post(
-                url, data=body, params=params, headers=self.headers
+            response = self._send(
+                "POST", url, headers=headers, data=body, params=params
             )
             return response
         except _exceptions.TimeoutException:
             if idempotent is False:
                 raise IdempotentTimeout(
-                    method="POST", url=url, body=body, headers=self.headers
+                    method="POST",
+                    url=url,
+                    data=body,
+                    headers=self.InjectAttrs(headers=headers),
                 )
             else:
                 print("retry")
@@ -158,7 +398,7 @@ class Request:
     )
     @contenttype
     @basicauth
-    def DELETE(self, url: str, body: dict = {}, headers: dict = {}) -> Response:
+    def DELETE(self, url: str, body: dict = None, headers: dict = None) -> Response:
         """HTTP DELETE Request
 
         Args:
@@ -169,9 +409,8 @@ class Request:
         Returns:
             Response -- HTTPX Response object
         """
-        self.InjectAttrs(headers=headers)
         try:
-            response = self.session.delete(url, headers=self.headers)
+            response = self._send("DELETE", url, headers=headers)
             return response
         except _exceptions.TimeoutException:
             raise RetryException
@@ -189,3 +428,306 @@ class Endpoint(Request):
         self.site = site
         self.instance = instance or self.client.instance
         super().__init__()
+
+    def _get_many(self, url, ids, limit: int, params=None, headers=None, workers=4):
+        """GET a multi-ID resource for any number of IDs.
+
+        IDs are sent `limit` at a time as url/(id1,id2,...), with up to `workers` requests in
+        flight and a few more chunks buffered ahead of the caller.
+
+        Raises:
+            OCAPIException: A chunk request failed.
+
+        Yields:
+            dict: Each document found, in the order of the IDs, whatever order the server
+                answered in. Unknown IDs are left out.
+        """
+
+        def fetch(chunk, chunk_url):
+            response = self.GET(chunk_url, params=params, headers=headers)
+            return _multi_id_data(response, chunk)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            try:
+                for chunk, chunk_url in _multi_id_chunks(url, ids, limit):
+                    pending.append(pool.submit(fetch, chunk, chunk_url))
+                    if len(pending) >= workers * 2:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+
+class AsyncRequest(Request):
+    """Asyncio flavour of Request, every HTTP verb returns a coroutine.
+    """
+
+    @property
+    def session(self) -> AsyncClient:
+        """Shared HTTPX async client for the instance and running event loop.
+
+        Returns:
+            AsyncClient: Pooled async client from the process wide connection pool.
+        """
+        return connection_pool.async_session(self.instance)
+
+    @staticmethod
+    async def _off_loop(func, *args):
+        """Run a blocking call, such as an OAuth request, in the default executor."""
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def _async_auth_headers(self, headers: dict = None) -> dict:
+        """Async flavour of Request._auth_headers.
+
+        A valid token is read in place, renewing one runs off the event loop.
+        """
+        if getattr(self.client, "Valid", False):
+            return self._auth_headers(headers)
+        return await self._off_loop(self._auth_headers, headers)
+
+    async def _get(self, url: str, params=None, headers: dict = None) -> Response:
+        """Async flavour of Request._get."""
+        key = self._cache_key(url, params, headers)
+        if key is None:
+            return await self._send("GET", url, headers=headers, params=params)
+        response = self.cache.get(key) if self.cache is not None else None
+        if response is None:
+            if self.coalesce:
+                response = await _flights.ado(
+                    key, lambda: self._get_upstream(key, url, params, headers)
+                )
+            else:
+                response = await self._get_upstream(key, url, params, headers)
+        return response
+
+    async def _get_upstream(self, key: str, url: str, params, headers: dict) -> Response:
+        """Async flavour of Request._get_upstream."""
+        if self.validators is not None:
+            headers = {**(headers or {}), **self.validators.conditional(key)}
+            response = await self._send("GET", url, headers=headers, params=params)
+            response = self.validators.resolve(key, response)
+        else:
+            response = await self._send("GET", url, headers=headers, params=params)
+        if self.cache is not None:
+            self.cache.set(key, response, getattr(self, "base", None))
+        return response
+
+    async def _send(
+        self, method: str, url: str, headers: dict = None, **kwargs
+    ) -> Response:
+        """Send a request with the current token, replaying it once on 401 after renewing.
+
+        Requests wait for the instance's rate limiter and throttled requests are sent again
+        once the rate limiter's backoff has passed.
+
+        Args:
+            method (str): HTTP verb.
+            url (str): URL to connect to.
+
+        Returns:
+            Response: HTTPX Response object.
+        """
+        if _recording.get() is not None:
+            return self._recorded(method, url, headers=headers, **kwargs)
+        attempt = 0
+        while True:
+            wait = rate_limiter.reserve(self.instance)
+            if wait:
+                await asyncio.sleep(wait)
+            sent = await self._async_auth_headers(headers)
+            response = await self.session.request(method, url, headers=sent, **kwargs)
+            if response.status_code == 401 and await self._off_loop(
+                self._reauthenticate, headers, response
+            ):
+                await response.aclose()
+                sent = await self._async_auth_headers(headers)
+                response = await self.session.request(
+                    method, url, headers=sent, **kwargs
+                )
+            if rate_limiter.retry_after(self.instance, method, response, attempt) is None:
+                return response
+            await response.aclose()
+            attempt += 1
+
+    @retry_async(
+        retry_on_exceptions=(RetryException),
+        max_calls_total=3,
+        retry_window_after_first_call_in_seconds=10,
+    )
+    @basicauth
+    async def GET(self, url, params=None, headers: dict = None) -> Response:
+        """HTTP GET Request
+
+        Args:
+            url (str): URL to connect to.
+            headers (dict, optional): Key Value pairs for additional headers. (default: None)
+
+        Returns:
+            Response -- HTTPX Response object
+        """
+        try:
+            response = await self._get(url, params=params, headers=headers)
+            return response
+        except _exceptions.TimeoutException:
+            raise RetryException
+
+    @retry_async(
+        retry_on_exceptions=(RetryException),
+        max_calls_total=3,
+        retry_window_after_first_call_in_seconds=10,
+    )
+    @contenttype
+    @basicauth
+    async def PATCH(
+        self, url: str, body=None, headers: dict = None, idempotent: bool = False,
+    ) -> Response:
+        """HTTP PATCH Request
+
+        Args:
+            url (str): URL to connect to.
+            body (dict, optional): JSON payload for the request. (default: dict())
+            headers (dict, optional): Key Value pairs for additional headers. (default: None)
+            idempotent (bool, optional): Is this request idempotent? (default: False)
+
+        Returns:
+            Response -- HTTPX Response object
+        """
+        try:
+            response = await self._send("PATCH", url, headers=headers, data=body)
+            return response
+        except _exceptions.TimeoutException:
+            if idempotent is False:
+                raise IdempotentTimeout(
+                    method="PATCH",
+                    url=url,
+                    data=body,
+                    headers=self.InjectAttrs(headers=headers),
+                )
+            else:
+                raise RetryException
+
+    @retry_async(
+        retry_on_exceptions=(RetryException),
+        max_calls_total=3,
+        retry_window_after_first_call_in_seconds=10,
+    )
+    @contenttype
+    @basicauth
+    async def PUT(self, url: str, body: dict = None, headers: dict = None) -> Response:
+        """HTTP PUT Request
+
+        Args:
+            url (str): URL to connect to.
+            body (dict, optional): JSON payload for the request. (default: dict())
+            headers (dict, optional): Key Value pairs for additional headers. (default: None)
+
+        Returns:
+            Response -- HTTPX Response object
+        """
+        try:
+            response = await self._send("PUT", url, headers=headers, data=body)
+            return response
+        except _exceptions.TimeoutException:
+            raise RetryException
+
+    @retry_async(
+        retry_on_exceptions=(RetryException),
+        max_calls_total=3,
+        retry_window_after_first_call_in_seconds=10,
+    )
+    @contenttype
+    @basicauth
+    async def POST(
+        self,
+        url: str,
+        body: str = None,
+        params: dict = None,
+        headers: dict = None,
+        idempotent: bool = False,
+    ) -> Response:
+        """HTTP POST Request
+
+        Args:
+            url (str): URL to connect to.
+            body (dict, optional): JSON payload for the request. (default: dict())
+            params (dict, optional): Dictionary for path parameters. (default: None)
+            headers (dict, optional): Key Value pairs for additional headers. (default: None)
+            idempotent (bool, optional): Is this request idempotent? (default: False)
+
+        Returns:
+            Response -- HTTPX Response object
+        """
+        try:
+            response = await self._send(
+                "POST", url, headers=headers, data=body, params=params
+            )
+            return response
+        except _exceptions.TimeoutException:
+            if idempotent is False:
+                raise IdempotentTimeout(
+                    method="POST",
+                    url=url,
+                    data=body,
+                    headers=self.InjectAttrs(headers=headers),
+                )
+            else:
+                raise RetryException
+
+    @retry_async(
+        retry_on_exceptions=(RetryException),
+        max_calls_total=3,
+        retry_window_after_first_call_in_seconds=10,
+    )
+    @contenttype
+    @basicauth
+    async def DELETE(self, url: str, body: dict = None, headers: dict = None) -> Response:
+        """HTTP DELETE Request
+
+        Args:
+            url (str): URL to connect to.
+            body (dict, optional): JSON payload for the request. (default: dict())
+            headers (dict, optional): Key Value pairs for additional headers. (default: None)
+
+        Returns:
+            Response -- HTTPX Response object
+        """
+        try:
+            response = await self._send("DELETE", url, headers=headers)
+            return response
+        except _exceptions.TimeoutException:
+            raise RetryException
+
+
+class AsyncEndpoint(AsyncRequest, Endpoint):
+    """Asyncio endpoint base class, combine with a synchronous endpoint to get awaitable methods.
+
+    Example:
+        class AsyncOrders(Orders, AsyncEndpoint):
+            pass
+    """
+
+    async def _get_many(
+        self, url, ids, limit: int, params=None, headers=None, workers=4
+    ):
+        """Async generator flavour of Endpoint._get_many, chunks are fetched as tasks."""
+
+        async def fetch(chunk, chunk_url):
+            response = await self.GET(chunk_url, params=params, headers=headers)
+            return _multi_id_data(response, chunk)
+
+        pending = deque()
+        try:
+            for chunk, chunk_url in _multi_id_chunks(url, ids, limit):
+                pending.append(asyncio.ensure_future(fetch(chunk, chunk_url)))
+                if len(pending) >= workers:
+                    for document in await pending.popleft():
+                        yield document
+            while pending:
+                for document in await pending.popleft():
+                    yield document
+        finally:
+            for task in pending:
+                task.cancel()
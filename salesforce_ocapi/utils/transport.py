@@ -0,0 +1,174 @@
+""" Shared HTTP transport, pools connections per instance host across every endpoint object.
+"""
+import asyncio
+import atexit
+import threading
+from urllib.parse import urlparse
+
+import httpcore
+from httpx import AsyncClient, Client
+from httpx._config import SSLConfig
+
+
+class ConnectionPool:
+    """Process wide registry of HTTPX clients keyed by instance host.
+
+    Endpoint objects and token sessions pointing at the same host share one client, so
+    constructing endpoints in a loop reuses already established TLS connections.
+
+    Args:
+        max_keepalive (int, optional): Idle connections kept open per host. Defaults to 10.
+        max_connections (int, optional): Concurrent connections allowed per host. Defaults to 100.
+        keepalive_expiry (float, optional): Seconds an idle connection is kept open. Defaults to 60.
+        timeout (float, optional): Request timeout in seconds. Defaults to 10.
+    """
+
+    def __init__(
+        self,
+        max_keepalive: int = 10,
+        max_connections: int = 100,
+        keepalive_expiry: float = 60,
+        timeout: float = 10,
+    ):
+        self.max_keepalive = max_keepalive
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+        self._clients = {}
+        self._async_clients = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host(instance: str) -> str:
+        """Return the registry key for an instance URL.
+
+        Args:
+            instance (str): Instance URL including scheme, eg https://
+
+        Returns:
+            str: netloc of the instance, empty string if no instance was given.
+        """
+        return urlparse(instance or "").netloc
+
+    def configure(
+        self,
+        max_keepalive: int = None,
+        max_connections: int = None,
+        keepalive_expiry: float = None,
+        timeout: float = None,
+    ):
+        """Change pool settings.
+
+        Existing clients are closed so the next request picks up the new settings.
+
+        Args:
+            max_keepalive (int, optional): Idle connections kept open per host.
+            max_connections (int, optional): Concurrent connections allowed per host.
+            keepalive_expiry (float, optional): Seconds an idle connection is kept open.
+            timeout (float, optional): Request timeout in seconds.
+        """
+        if max_keepalive is not None:
+            self.max_keepalive = max_keepalive
+        if max_connections is not None:
+            self.max_connections = max_connections
+        if keepalive_expiry is not None:
+            self.keepalive_expiry = keepalive_expiry
+        if timeout is not None:
+            self.timeout = timeout
+        self.close()
+
+    def session(self, instance: str) -> Client:
+        """Get the shared client for an instance, creating it on first use.
+
+        Args:
+            instance (str): Instance URL including scheme, eg https://
+
+        Returns:
+            Client: HTTPX client shared by everything talking to this host.
+        """
+        host = self.host(instance)
+        client = self._clients.get(host)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(host)
+            if client is None:
+                client = Client(
+                    timeout=self.timeout,
+                    transport=self._transport(httpcore.SyncConnectionPool),
+                )
+                self._clients[host] = client
+            return client
+
+    def async_session(self, instance: str) -> AsyncClient:
+        """Get the shared async client for an instance on the running event loop.
+
+        Async connections belong to the loop that opened them, so clients are pooled per loop.
+        Clients of loops that have since been closed are dropped when a new one is created.
+
+        Args:
+            instance (str): Instance URL including scheme, eg https://
+
+        Returns:
+            AsyncClient: HTTPX async client shared by coroutines talking to this host.
+        """
+        key = (self.host(instance), asyncio.get_event_loop())
+        client = self._async_clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._async_clients.get(key)
+            if client is None:
+                self._async_clients = {
+                    other: pooled
+                    for other, pooled in self._async_clients.items()
+                    if not other[1].is_closed()
+                }
+                client = AsyncClient(
+                    timeout=self.timeout,
+                    transport=self._transport(httpcore.AsyncConnectionPool),
+                )
+                self._async_clients[key] = client
+            return client
+
+    def _transport(self, pool):
+        return pool(
+            ssl_context=SSLConfig().ssl_context,
+            max_keepalive=self.max_keepalive,
+            max_connections=self.max_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def close(self):
+        """Close every pooled client and forget them.
+
+        Async clients can only be closed from their own event loop, see aclose,
+        here they are dropped so their loop can clean them up.
+        """
+        with self._lock:
+            clients, self._clients = self._clients, {}
+            self._async_clients = {}
+        for client in clients.values():
+            client.close()
+
+    async def aclose(self):
+        """Close the pooled async clients opened on the running event loop.
+        """
+        loop = asyncio.get_event_loop()
+        with self._lock:
+            clients = [
+                client for key, client in self._async_clients.items() if key[1] is loop
+            ]
+            self._async_clients = {
+                key: client
+                for key, client in self._async_clients.items()
+                if key[1] is not loop
+            }
+        for client in clients:
+            await client.aclose()
+
+
+connection_pool = ConnectionPool()
+"""Pool shared by every endpoint and token session in this process."""
+
+atexit.register(connection_pool.close)
@@ -2,15 +2,40 @@ from datetime import datetime as dt
 from hashlib import md5
 from pathlib import Path
 
+import pytz
 from opnieuw import RetryException, retry
-from webdav3.exceptions import (
-    ConnectionException,
-    NoConnection,
-    RemoteResourceNotFound,
-    WebDavException,
-)
 
-import pytz
+from salesforce_ocapi.utils.exceptions import WebDAVException
+
+
+def multipart_md5(chunks, part_size: int) -> str:
+    """S3 multipart upload ETag of a stream of bytes.
+
+    Each part is hashed as its bytes arrive, whatever size the chunks are, only the
+    digests of finished parts are kept.
+
+    Args:
+        chunks (iterable): Content of the file as bytes chunks.
+        part_size (int): Multipart upload part size in bytes.
+
+    Returns:
+        str: MD5 of the part digests, dash and number of parts.
+    """
+    digests = []
+    part, filled = md5(), 0
+    for chunk in chunks:
+        view = memoryview(chunk)
+        while view:
+            piece = view[: part_size - filled]
+            part.update(piece)
+            filled += len(piece)
+            view = view[len(piece) :]
+            if filled == part_size:
+                digests.append(part.digest())
+                part, filled = md5(), 0
+    if filled or not digests:
+        digests.append(part.digest())
+    return "{}-{}".format(md5(b"".join(digests)).hexdigest(), len(digests))
 
 
 @retry(
@@ -51,23 +76,14 @@ def s3_compare(
     etag = s3.e_tag[1:-1]
     try:
         if "-" not in etag:
-            # Compute regular MD5 hash on file buffer
-            sum = md5(client.StreamDownload(webdav["path"]).getbuffer())
-
-            hashsum = sum.hexdigest()
+            # Compute regular MD5 hash while the file streams in
+            hashsum = client.HashObject(webdav["path"])["hashsum"]
 
         if "-" in etag:
             # This function relies on the default chunksize on s3 via the aws cli (8MB)
             # WARNING: Anything else will fail
-            md5s = []
             chunk_size = 8 * 1024 * 1024
-            f = client.StreamDownload(webdav["path"])
-            for data in iter(lambda: f.read(chunk_size), b""):
-                md5s.append(md5(data))
-            f.close()
-            digests = b"".join(m.digest() for m in md5s)
-            digests_md5 = md5(digests)
-            hashsum = "{}-{}".format(digests_md5.hexdigest(), len(md5s))
+            hashsum = multipart_md5(client.IterDownload(webdav["path"]), chunk_size)
 
         webdav.update({"hashsum": hashsum})
         webdav = dict(sorted(webdav.items()))
@@ -88,6 +104,6 @@ def s3_compare(
 
         return comparison
 
-    except (NoConnection, ConnectionException, WebDavException, RemoteResourceNotFound):
+    except WebDAVException:
         client.reconnect()
         raise RetryException
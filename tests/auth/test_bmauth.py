@@ -1,6 +1,7 @@
 from salesforce_ocapi.auth import CommerceCloudBMSession
 from ..conftest import CLIENT_ID, CLIENT_SECRET, BM_USER, BM_PASSWORD, BM_TOKEN
 from httpx._client import Client as httpx_client
+from salesforce_ocapi.utils.transport import connection_pool
 
 
 def get_mock_bm_session(mocked_instance_api):
@@ -35,3 +36,12 @@ def test_authheader(mocked_instance_api):
     session = get_mock_bm_session(mocked_instance_api)
     assert type(session.AuthHeader) is dict
     assert session.AuthHeader == {"Authorization": f'Bearer {BM_TOKEN["access_token"]}'}
+
+
+def test_session_follows_pool_configuration(mocked_instance_api):
+    session = get_mock_bm_session(mocked_instance_api)
+    before = session.session
+    connection_pool.configure()
+    assert session.session is not before
+    session.getToken()
+    assert session.RawToken == BM_TOKEN["access_token"]
@@ -0,0 +1,49 @@
+import os
+import stat
+import time
+
+from salesforce_ocapi.auth import CommerceCloudClientSession, TokenCache
+
+ACCOUNT_MANAGER = "https://account.demandware.com"
+
+
+def cached_token(expires_in=899, access_token="cached-token"):
+    return {
+        "access_token": access_token,
+        "token_type": "Bearer",
+        "expires_in": expires_in,
+        "expires_at": int(time.time()) + expires_in - 15,
+    }
+
+
+def test_store_and_load(tmp_path):
+    cache = TokenCache(tmp_path)
+    key = TokenCache.key("client", "client_credentials", ACCOUNT_MANAGER)
+    cache.store(key, cached_token())
+    token = cache.load(key)
+    assert token["access_token"] == "cached-token"
+    assert 880 <= token["expires_in"] <= 899
+    mode = stat.S_IMODE(os.stat(tmp_path / f"{key}.json").st_mode)
+    assert mode == 0o600
+
+
+def test_load_skips_expiring_and_rejected(tmp_path):
+    cache = TokenCache(tmp_path, min_lifetime=60)
+    key = TokenCache.key("client", "client_credentials", ACCOUNT_MANAGER)
+    cache.store(key, cached_token(expires_in=30))
+    assert cache.load(key) is None
+    cache.store(key, cached_token())
+    assert cache.load(key, rejected="cached-token") is None
+
+
+def test_session_reuses_cached_token(tmp_path):
+    cache = TokenCache(tmp_path)
+    key = TokenCache.key("cache-client-id", "client_credentials", ACCOUNT_MANAGER)
+    cache.store(key, cached_token())
+    session = CommerceCloudClientSession(
+        client_id="cache-client-id",
+        client_secret="secret",
+        instance="https://test01-eu01-example.demandware.net",
+        token_cache=cache,
+    )
+    assert session.RawToken == "cached-token"
@@ -0,0 +1,51 @@
+import threading
+import time
+
+from salesforce_ocapi.auth.manager import TokenManager
+
+
+def counting_fetch(delay=0.0, expires_in=899):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(delay)
+        return {"access_token": f"token-{len(calls)}", "expires_in": expires_in}
+
+    return fetch, calls
+
+
+def test_single_flight_get():
+    manager = TokenManager()
+    fetch, calls = counting_fetch(delay=0.1)
+    threads = [threading.Thread(target=manager.get, args=(fetch,)) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert manager.token["access_token"] == "token-1"
+
+
+def test_refresh_skips_when_already_replaced():
+    manager = TokenManager()
+    fetch, calls = counting_fetch()
+    stale = manager.get(fetch)["access_token"]
+    manager.refresh(fetch, stale=stale)
+    manager.refresh(fetch, stale=stale)
+    assert len(calls) == 2
+    assert manager.token["access_token"] == "token-2"
+
+
+def test_background_refresh_before_expiry():
+    manager = TokenManager(margin=60)
+    fetch, calls = counting_fetch(expires_in=15.2)
+    manager.get(fetch)
+    time.sleep(0.3)
+    manager.cancel()
+    assert len(calls) > 1
+
+
+def test_shared_per_credentials():
+    key = ("client_credentials", "https://account.demandware.com", "id", "secret", None, None)
+    assert TokenManager.for_credentials(key) is TokenManager.for_credentials(key)
@@ -2,6 +2,8 @@ import pytest
 import respx
 import json
 
+from salesforce_ocapi.auth import CommerceCloudBMSession
+
 BM_TOKEN = {
     "access_token": "2261e4b9-0550-4556-bf32-31706e419433",
     "expires_in": 899,
@@ -19,11 +21,12 @@ CLIENT_SECRET = "abcdefghijklmnopqrstuvwxyz"
 BM_USER = "example@company.com"
 BM_PASSWORD = "strongpassword"
 OCAPI_VERSION = "v20_4"
+INSTANCE = "https://test01-eu01-example.demandware.net"
 
 
 @pytest.fixture(scope="session")
 def mocked_instance_api():
-    with respx.mock(base_url="https://test01-eu01-example.demandware.net") as respx_mock:
+    with respx.mock(base_url=INSTANCE) as respx_mock:
         respx_mock.post(
             f"/dw/oauth2/access_token?client_id={CLIENT_ID}", content=json.dumps(BM_TOKEN), alias="bmtokenrequest",
         )
@@ -38,3 +41,13 @@ def mocked_account_manager_api():
         )
         yield respx_mock
 
+
+@pytest.fixture
+def bm_session(mocked_instance_api):
+    return CommerceCloudBMSession(
+        client_id=CLIENT_ID,
+        client_secret=CLIENT_SECRET,
+        instance=INSTANCE,
+        bm_user=BM_USER,
+        bm_password=BM_PASSWORD,
+    )
@@ -0,0 +1,88 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from salesforce_ocapi.endpoints import AsyncOrders, Orders
+from ..conftest import BM_TOKEN
+
+ORDER = {"order_no": "00001234", "status": "new"}
+
+
+@pytest.fixture(scope="module")
+def mocked_orders_api(mocked_instance_api):
+    mocked_instance_api.get(
+        "/s/sitegenesis/dw/shop/v20_4/orders/00001234",
+        content=json.dumps(ORDER),
+        alias="getorder",
+    )
+    yield mocked_instance_api
+
+
+def test_get_order(mocked_orders_api, bm_session):
+    response = Orders(client=bm_session, site="sitegenesis").GetOrder("00001234")
+    assert response.json() == ORDER
+    request = mocked_orders_api.aliases["getorder"].calls[-1][0]
+    assert request.headers["Authorization"] == f'Bearer {BM_TOKEN["access_token"]}'
+
+
+def test_async_get_order(mocked_orders_api, bm_session):
+    orders = AsyncOrders(client=bm_session, site="sitegenesis")
+    calls = mocked_orders_api.aliases["getorder"].call_count
+
+    async def fetch():
+        return await asyncio.gather(*[orders.GetOrder("00001234") for _ in range(5)])
+
+    responses = asyncio.run(fetch())
+    assert [r.json() for r in responses] == [ORDER] * 5
+    assert mocked_orders_api.aliases["getorder"].call_count == calls + 1
+
+    orders.coalesce = False
+    responses = asyncio.run(fetch())
+    assert [r.json() for r in responses] == [ORDER] * 5
+    assert mocked_orders_api.aliases["getorder"].call_count == calls + 6
+
+
+def test_concurrent_get_order_coalesced(mocked_orders_api, bm_session):
+    orders = Orders(client=bm_session, site="sitegenesis")
+    calls = mocked_orders_api.aliases["getorder"].call_count
+    barrier = threading.Barrier(8)
+    route = mocked_orders_api.aliases["getorder"]
+    content = route.response._content
+
+    def slow_order(**kwargs):
+        time.sleep(0.2)
+        return content
+
+    def fetch(_):
+        barrier.wait()
+        return orders.GetOrder("00001234")
+
+    route.response.content = slow_order
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            responses = list(pool.map(fetch, range(8)))
+    finally:
+        route.response.content = content
+    assert [r.json() for r in responses] == [ORDER] * 8
+    assert route.call_count == calls + 1
+
+
+def test_shared_endpoint_headers_per_call(mocked_orders_api, bm_session):
+    orders = Orders(client=bm_session, site="sitegenesis")
+    route = mocked_orders_api.aliases["getorder"]
+    calls = route.call_count
+
+    def fetch(n):
+        return orders.GetOrder("00001234", headers={f"x-test-{n}": str(n)})
+
+    with ThreadPoolExecutor(max_workers=64) as pool:
+        list(pool.map(fetch, range(64)))
+    assert orders.headers == {}
+    sent = [request.headers for request, _ in route.calls[calls:]]
+    assert len(sent) == 64
+    for headers in sent:
+        assert len([name for name in headers if name.startswith("x-test-")]) == 1
@@ -0,0 +1,58 @@
+import asyncio
+import json
+import re
+from urllib import parse
+
+import pytest
+
+from salesforce_ocapi.endpoints import AsyncProducts, Products
+from ..conftest import CLIENT_ID
+
+PRODUCT_IDS = [f"P{n:03}" for n in range(60)]
+
+
+def products(request, ids):
+    ids = parse.unquote(ids).split(",")
+    data = [{"id": product_id} for product_id in reversed(ids) if product_id != "P013"]
+    return json.dumps({"count": len(data), "data": data, "total": len(data)})
+
+
+@pytest.fixture(scope="module")
+def mocked_products_api(mocked_instance_api):
+    mocked_instance_api.get(
+        re.compile(r"/s/sitegenesis/dw/shop/v20_4/products/\((?P<ids>[^)]*)\)"),
+        content=products,
+        alias="getproducts",
+    )
+    mocked_instance_api.get(
+        re.compile(r"/s/sitegenesis/dw/shop/v20_4/products/[^(]"),
+        content=json.dumps({"id": "P 1/2"}),
+        alias="getproduct",
+    )
+    yield mocked_instance_api
+
+
+def test_get_products_chunks_ids(mocked_products_api, bm_session):
+    calls = mocked_products_api.aliases["getproducts"].call_count
+    products = Products(client=bm_session, site="sitegenesis")
+    results = list(products.GetProducts(iter(PRODUCT_IDS), workers=2))
+    assert [p["id"] for p in results] == [i for i in PRODUCT_IDS if i != "P013"]
+    assert mocked_products_api.aliases["getproducts"].call_count == calls + 3
+    request = mocked_products_api.aliases["getproducts"].calls[-1][0]
+    assert request.headers["x-dw-client-id"] == CLIENT_ID
+
+
+def test_async_get_products(mocked_products_api, bm_session):
+    endpoint = AsyncProducts(client=bm_session, site="sitegenesis")
+
+    async def collect():
+        return [p["id"] async for p in endpoint.GetProducts(PRODUCT_IDS)]
+
+    assert asyncio.run(collect()) == [i for i in PRODUCT_IDS if i != "P013"]
+
+
+def test_get_product_quotes_id(mocked_products_api, bm_session):
+    products = Products(client=bm_session, site="sitegenesis")
+    assert products.GetProduct("P 1/2").json() == {"id": "P 1/2"}
+    request = mocked_products_api.aliases["getproduct"].calls[-1][0]
+    assert request.url.path.endswith("/products/P%201%2F2")
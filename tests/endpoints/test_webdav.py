@@ -0,0 +1,355 @@
+import json
+import re
+from hashlib import md5
+from io import BytesIO, UnsupportedOperation
+from urllib.parse import unquote, urlsplit
+
+import pytest
+
+from salesforce_ocapi.endpoints import DirectoryEntry, WebDAV
+from salesforce_ocapi.endpoints.webdav.client import _parse_multistatus
+from salesforce_ocapi.utils.exceptions import RemoteResourceNotFound, WebDAVException
+
+ROOT = "/on/demandware.servlet/webdav/Sites/Impex/src/test"
+CONTENT = bytes(range(256)) * 4096
+
+SERVER = {
+    "files": {},
+    "dirs": set(),
+    "ranges": True,
+    "infinity": False,
+    "truncate": set(),
+    "whole": set(),
+    "unauthorized": set(),
+    "etag": '"v1"',
+    "log": [],
+}
+
+
+def propstat(path: str) -> str:
+    if path in SERVER["dirs"]:
+        props = "<D:resourcetype><D:collection/></D:resourcetype>"
+    else:
+        size = len(SERVER["files"][path])
+        props = (
+            f"<D:resourcetype/><D:getcontentlength>{size}</D:getcontentlength>"
+            f"<D:getetag>{SERVER['etag']}</D:getetag>"
+            "<D:getlastmodified>Mon, 01 Jun 2020 10:00:00 GMT</D:getlastmodified>"
+        )
+    return (
+        f"<D:response><D:href>{path.replace(' ', '%20')}</D:href><D:propstat>"
+        f"<D:prop>{props}</D:prop><D:status>HTTP/1.1 200 OK</D:status>"
+        "</D:propstat></D:response>"
+    )
+
+
+def multistatus(path: str, depth: str) -> str:
+    paths = [path]
+    if depth != "0" and path in SERVER["dirs"]:
+        children = list(SERVER["files"]) + list(SERVER["dirs"])
+        paths += sorted(
+            child
+            for child in children
+            if child != path
+            and child.startswith(path)
+            and (depth == "infinity" or "/" not in child[len(path) :].rstrip("/"))
+        )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><D:multistatus xmlns:D="DAV:">'
+        + "".join(propstat(p) for p in paths)
+        + "</D:multistatus>"
+    )
+
+
+def webdav_server(request, response):
+    path = unquote(request.url.path)
+    if not path.startswith(ROOT):
+        return None
+    method = request.method
+    found = path if path in SERVER["files"] else f"{path.rstrip('/')}/"
+    exists = found in SERVER["files"] or found in SERVER["dirs"]
+    SERVER["log"].append(
+        (method, path, request.headers.get("Range"), request.headers.get("If-Range"))
+    )
+    if method == "PROPFIND":
+        response.status_code = 207 if exists else 404
+        if request.headers["Depth"] == "infinity" and not SERVER["infinity"]:
+            response.status_code = 403
+        elif exists:
+            response.content = multistatus(found, request.headers["Depth"])
+    elif method == "GET":
+        content = SERVER["files"].get(path)
+        match = re.match(r"bytes=(\d+)-(\d+)", request.headers.get("Range", ""))
+        if_range = request.headers.get("If-Range", SERVER["etag"])
+        response.headers["ETag"] = SERVER["etag"]
+        if content is None:
+            response.status_code = 404
+        elif (
+            match
+            and SERVER["ranges"]
+            and if_range == SERVER["etag"]
+            and int(match.group(1)) not in SERVER["whole"]
+        ):
+            start, end = int(match.group(1)), int(match.group(2))
+            response.status_code = 206
+            if start in SERVER["truncate"]:
+                SERVER["truncate"].discard(start)
+                end = start + 10
+            response.content = content[start : end + 1]
+        else:
+            response.content = content
+    elif method == "PUT" and path in SERVER["unauthorized"]:
+        SERVER["unauthorized"].discard(path)
+        request.read()
+        response.status_code = 401
+    elif method == "PUT":
+        SERVER["files"][path] = request.read()
+        response.status_code = 201
+    elif method == "MKCOL":
+        response.status_code = 405 if exists else 201
+        SERVER["dirs"].add(found)
+    elif method == "MOVE":
+        destination = unquote(urlsplit(request.headers["Destination"]).path)
+        SERVER["files"][destination] = SERVER["files"].pop(path)
+        response.status_code = 201
+    elif method == "DELETE":
+        SERVER["files"].pop(path)
+        response.status_code = 204
+    return response
+
+
+@pytest.fixture(scope="module")
+def mocked_webdav_api(mocked_instance_api):
+    mocked_instance_api.add(webdav_server, alias="webdav")
+    yield mocked_instance_api
+
+
+@pytest.fixture
+def webdav(mocked_webdav_api, bm_session):
+    SERVER["files"] = {
+        f"{ROOT}/export.zip": CONTENT,
+        f"{ROOT}/sub/small file.xml": b"<catalog/>",
+    }
+    SERVER.update(dirs={f"{ROOT}/", f"{ROOT}/sub/"}, ranges=True, truncate=set())
+    SERVER.update(infinity=False, whole=set(), unauthorized=set(), etag='"v1"')
+    SERVER["log"] = []
+    return WebDAV(bm_session)
+
+
+def test_directory_list(webdav):
+    assert webdav.GetDirectoryList(ROOT) == ["export.zip", "sub/"]
+    entries = webdav.GetDirectoryList(f"{ROOT}/sub", get_info=True)
+    assert [(x["path"], x["isdir"]) for x in entries] == [
+        (f"{ROOT}/sub/small file.xml", False)
+    ]
+    info = webdav.GetInfo(f"{ROOT}/export.zip")
+    assert info["size"] == str(len(CONTENT))
+    assert info["etag"] == '"v1"'
+    with pytest.raises(RemoteResourceNotFound):
+        webdav.GetInfo(f"{ROOT}/missing.zip")
+
+
+def test_walk_lists_each_folder_once(webdav):
+    SERVER["dirs"] |= {f"{ROOT}/sub/{n}/" for n in range(10)}
+    SERVER["files"].update({f"{ROOT}/sub/{n}/file.xml": b"<x/>" for n in range(10)})
+    files = {x["path"] for x in webdav.RecursiveFileListing(ROOT, workers=3)}
+    assert len(files) == 12
+    folders = set(webdav.RecursiveFolderListing(ROOT))
+    assert folders == {path for path in SERVER["dirs"] if path != f"{ROOT}/"}
+    listings = [x[1] for x in SERVER["log"] if x[0] == "PROPFIND"]
+    assert len(listings) == 2 * 12
+    assert len(set(listings)) == 12
+
+    SERVER["log"] = []
+    assert len(list(webdav.Walk(ROOT, infinity=True))) == 23
+    assert len(SERVER["log"]) == 13
+    SERVER["infinity"] = True
+    SERVER["log"] = []
+    assert len(list(webdav.Walk(ROOT, infinity=True))) == 23
+    assert len(SERVER["log"]) == 1
+
+
+def test_stream_directory_list(webdav):
+    SERVER["files"].update({f"{ROOT}/sub/{n:03}.xml": b"<x/>" for n in range(50)})
+    entries = list(webdav.StreamDirectoryList(f"{ROOT}/sub", get_info=True, count=10))
+    assert len(entries) == 10
+    assert isinstance(entries[0], DirectoryEntry)
+    assert not hasattr(entries[0], "__dict__")
+    assert entries[0].path == f"{ROOT}/sub/000.xml"
+    assert entries[0].size == "4"
+    names = list(webdav.StreamDirectoryList(ROOT))
+    assert names == webdav.GetDirectoryList(ROOT) == ["export.zip", "sub/"]
+
+
+class ChunkedResponse:
+    def __init__(self, content: bytes, size: int):
+        self.chunks = [content[n : n + size] for n in range(0, len(content), size)]
+        self.read = 0
+        self.closed = False
+
+    def iter_bytes(self):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+def test_parse_multistatus_stops_reading_early():
+    SERVER["files"] = {f"{ROOT}/{n:03}.xml": b"<x/>" for n in range(200)}
+    SERVER["dirs"] = {f"{ROOT}/"}
+    response = ChunkedResponse(multistatus(f"{ROOT}/", "1").encode("utf-8"), 7)
+    entries = _parse_multistatus(response)
+    first = [next(entries) for _ in range(3)]
+    assert [x.isdir for x in first] == [True, False, False]
+    assert first[2].path == f"{ROOT}/001.xml"
+    entries.close()
+    assert response.closed
+    assert response.read < len(response.chunks) / 10
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        None,
+        "<html><body>Service unavailable</body></html>",
+        "Service unavailable",
+        "",
+    ],
+)
+def test_parse_multistatus_rejects_incomplete_bodies(body):
+    SERVER["files"] = {f"{ROOT}/{n:03}.xml": b"<x/>" for n in range(3)}
+    SERVER["dirs"] = {f"{ROOT}/"}
+    if body is None:
+        # cut inside the last response element
+        body = multistatus(f"{ROOT}/", "1")[:-60]
+    response = ChunkedResponse(body.encode("utf-8"), 7)
+    with pytest.raises(WebDAVException):
+        list(_parse_multistatus(response))
+    assert response.closed
+
+
+def test_iter_download_yields_fixed_chunks(webdav):
+    chunks = list(webdav.IterDownload(f"{ROOT}/export.zip", chunk_size=100000))
+    assert [len(chunk) for chunk in chunks[:-1]] == [100000] * 10
+    assert b"".join(chunks) == CONTENT
+    buffer = BytesIO(b"header")
+    buffer.seek(6)
+    result = webdav.StreamDownload(f"{ROOT}/export.zip", buffer, chunk_size=65536)
+    assert result.tell() == 6
+    assert buffer.getvalue() == b"header" + CONTENT
+    result = webdav.HashObject(f"{ROOT}/export.zip", chunk_size=65536)
+    assert result["hashsum"] == md5(CONTENT).hexdigest()
+
+
+def test_upload_move_delete(webdav, tmp_path):
+    local = tmp_path / "upload"
+    (local / "nested").mkdir(parents=True)
+    (local / "nested" / "a.xml").write_bytes(b"<a/>" * 100000)
+    webdav.Upload(str(local), f"{ROOT}/upload")
+    assert SERVER["files"][f"{ROOT}/upload/nested/a.xml"] == b"<a/>" * 100000
+    webdav.MakeDir(f"{ROOT}/upload")
+    webdav.StreamUpload(BytesIO(b"streamed"), f"{ROOT}/sub", "b.xml")
+    webdav.Move(f"{ROOT}/sub/b.xml", f"{ROOT}/sub/c.xml")
+    assert SERVER["files"][f"{ROOT}/sub/c.xml"] == b"streamed"
+    webdav.Delete(f"{ROOT}/sub/c.xml")
+    assert f"{ROOT}/sub/c.xml" not in SERVER["files"]
+
+
+class Pipe(BytesIO):
+    """Like a socket file or pipe, has seek and tell but refuses them."""
+
+    def seekable(self):
+        return False
+
+    def tell(self):
+        raise UnsupportedOperation("tell")
+
+    def truncate(self, size=None):
+        raise UnsupportedOperation("truncate")
+
+
+def test_stream_download_into_unseekable_sink(webdav):
+    sink = Pipe()
+    assert webdav.StreamDownload(f"{ROOT}/export.zip", sink) is sink
+    assert sink.getvalue() == CONTENT
+
+
+def test_stream_upload_replays_unseekable_body(webdav):
+    SERVER["unauthorized"] = {f"{ROOT}/sub/piped.xml"}
+    payload = b"<a/>" * 600000
+    webdav.StreamUpload(Pipe(payload), f"{ROOT}/sub", "piped.xml")
+    puts = [entry for entry in SERVER["log"] if entry[0] == "PUT"]
+    assert len(puts) == 2
+    assert SERVER["files"][f"{ROOT}/sub/piped.xml"] == payload
+
+
+def test_download_folder(webdav, tmp_path):
+    webdav.Download(str(tmp_path / "copy"), ROOT)
+    assert (tmp_path / "copy" / "export.zip").read_bytes() == CONTENT
+    assert (tmp_path / "copy" / "sub" / "small file.xml").read_bytes() == b"<catalog/>"
+
+
+def test_parallel_download_resumes_missing_parts(webdav, tmp_path):
+    local = tmp_path / "export.zip"
+    remote = f"{ROOT}/export.zip"
+    fingerprint = json.dumps([remote, len(CONTENT), '"v1"', 262144])
+    with open(local, "wb") as file:
+        file.write(CONTENT[:262144])
+        file.truncate(len(CONTENT))
+    state = tmp_path / "export.zip.part.json"
+    state.write_text(json.dumps({"fingerprint": fingerprint, "cursor": {"done": [0]}}))
+    SERVER["truncate"] = {524288}
+    webdav.ParallelDownload(local, remote, workers=2, part_size=262144)
+    assert local.read_bytes() == CONTENT
+    ranges = [x[2] for x in SERVER["log"] if x[0] == "GET"]
+    assert sorted(ranges) == [
+        "bytes=262144-524287",
+        "bytes=524288-786431",
+        "bytes=524288-786431",
+        "bytes=786432-1048575",
+    ]
+    assert not state.exists()
+
+
+def test_parallel_download_without_range_support(webdav, tmp_path):
+    local = tmp_path / "export.zip"
+    SERVER["ranges"] = False
+    webdav.ParallelDownload(local, f"{ROOT}/export.zip", part_size=262144)
+    assert local.read_bytes() == CONTENT
+    assert len([x for x in SERVER["log"] if x[0] == "GET"]) == 2
+
+
+def test_parallel_download_keeps_state_when_a_part_comes_back_whole(webdav, tmp_path):
+    local = tmp_path / "export.zip"
+    remote = f"{ROOT}/export.zip"
+    state = tmp_path / "export.zip.part.json"
+    SERVER["whole"] = {524288}
+    with pytest.raises(WebDAVException):
+        webdav.ParallelDownload(local, remote, workers=2, part_size=262144)
+    saved = json.loads(state.read_text())["cursor"]
+    assert saved == {"done": [0, 1, 3], "validator": '"v1"'}
+    if_ranges = [x[3] for x in SERVER["log"] if x[0] == "GET"]
+    assert if_ranges == [None, '"v1"', '"v1"', '"v1"']
+
+    SERVER["whole"] = set()
+    SERVER["log"] = []
+    webdav.ParallelDownload(local, remote, workers=2, part_size=262144)
+    assert local.read_bytes() == CONTENT
+    assert [x[2] for x in SERVER["log"] if x[0] == "GET"] == ["bytes=524288-786431"]
+    assert not state.exists()
+
+
+def test_parallel_download_detects_changed_file(webdav, tmp_path):
+    local = tmp_path / "export.zip"
+    remote = f"{ROOT}/export.zip"
+    fingerprint = json.dumps([remote, len(CONTENT), '"v1"', 262144])
+    with open(local, "wb") as file:
+        file.truncate(len(CONTENT))
+    state = tmp_path / "export.zip.part.json"
+    cursor = {"done": [0], "validator": '"v0"'}
+    state.write_text(json.dumps({"fingerprint": fingerprint, "cursor": cursor}))
+    with pytest.raises(WebDAVException):
+        webdav.ParallelDownload(local, remote, part_size=262144)
+    assert json.loads(state.read_text())["cursor"] == cursor
@@ -0,0 +1,108 @@
+import asyncio
+import email
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from salesforce_ocapi.endpoints import AsyncOrders, CustomObjects, Orders
+from salesforce_ocapi.utils import Batch
+from salesforce_ocapi.utils.exceptions import OCAPIException
+from ..conftest import INSTANCE
+
+BOUNDARY = "response-boundary"
+
+
+def batch_response(request):
+    message = email.message_from_bytes(
+        f"Content-Type: {request.headers['Content-Type']}\r\n\r\n".encode()
+        + request.read()
+    )
+    parts = []
+    for part in message.get_payload():
+        body = {
+            "method": part["x-dw-http-method"],
+            "path": request.headers["x-dw-resource-path"]
+            + part["x-dw-resource-path-extension"],
+        }
+        parts += [
+            f"--{BOUNDARY}",
+            f"x-dw-content-id: {part['x-dw-content-id']}",
+            "x-dw-status-code: 200",
+            "Content-Type: application/json",
+            "",
+            json.dumps(body),
+        ]
+    return "\r\n".join(parts + [f"--{BOUNDARY}--", ""])
+
+
+@pytest.fixture(scope="module")
+def mocked_batch_api(mocked_instance_api):
+    mocked_instance_api.post(
+        "/s/-/dw/batch",
+        content=batch_response,
+        content_type=f"multipart/mixed; boundary={BOUNDARY}",
+        alias="batch",
+    )
+    mocked_instance_api.post(
+        "/s/broken/dw/batch", status_code=500, content="{}", alias="brokenbatch"
+    )
+    yield mocked_instance_api
+
+
+def test_batch_demultiplexes_in_order(mocked_batch_api, bm_session):
+    orders = Orders(client=bm_session)
+    objects = CustomObjects(client=bm_session)
+    batch = Batch(bm_session, limit=2)
+    calls = mocked_batch_api.aliases["batch"].call_count
+    for order in ("0001", "0002", "0003"):
+        batch.add(orders.PatchOrder, order, {"status": "completed"})
+    batch.add(objects.PatchCustomObject, "Feed", "key1", {"c_done": True})
+    responses = batch.send()
+
+    assert len(batch) == 0
+    assert mocked_batch_api.aliases["batch"].call_count == calls + 3
+    assert [r.json()["path"] for r in responses] == [
+        "/s/-/dw/shop/v20_4/orders/0001",
+        "/s/-/dw/shop/v20_4/orders/0002",
+        "/s/-/dw/shop/v20_4/orders/0003",
+        "/s/-/dw/data/v20_4/custom_objects/Feed/key1",
+    ]
+    assert {r.json()["method"] for r in responses} == {"PATCH"}
+    assert [r.status_code for r in responses] == [200] * 4
+    request = mocked_batch_api.aliases["batch"].calls[-1][0]
+    assert request.headers["Authorization"].startswith("Bearer ")
+    assert b'{"c_done": true}' in request.read()
+
+
+def test_batch_records_async_calls_without_a_token(mocked_batch_api, bm_session):
+    tokenless = SimpleNamespace(instance=INSTANCE)
+    orders = AsyncOrders(client=tokenless)
+    batch = Batch(bm_session)
+
+    async def queue():
+        for order in ("0001", "0002"):
+            await batch.aadd(orders.PatchOrder, order, {"status": "completed"})
+
+    asyncio.run(queue())
+    batch.add(Orders(client=tokenless).PatchOrder, "0003", {"status": "completed"})
+    with pytest.raises(TypeError):
+        batch.add(orders.PatchOrder, "0004", {"status": "completed"})
+    responses = batch.send()
+
+    assert [r.json()["path"] for r in responses] == [
+        "/s/-/dw/shop/v20_4/orders/0001",
+        "/s/-/dw/shop/v20_4/orders/0002",
+        "/s/-/dw/shop/v20_4/orders/0003",
+    ]
+
+
+def test_failed_batch_keeps_its_calls_queued(mocked_batch_api, bm_session):
+    batch = Batch(bm_session)
+    batch.add(Orders(client=bm_session).PatchOrder, "0001", {"status": "completed"})
+    broken = Orders(client=bm_session, site="broken")
+    batch.add(broken.PatchOrder, "0002", {"status": "completed"})
+    with pytest.raises(OCAPIException):
+        batch.send()
+    assert len(batch) == 1
+    assert batch._items[0][1].path.endswith("/orders/0002")
@@ -0,0 +1,59 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from salesforce_ocapi.utils import BulkRunner, csviter
+
+
+class FakeOrders:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def PatchOrder(self, order, body):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+        if order == "missing":
+            return SimpleNamespace(status_code=404)
+        if order == "broken":
+            raise ValueError(order)
+        return SimpleNamespace(status_code=200)
+
+
+def test_bulk_runner_outcomes_and_summary():
+    orders = FakeOrders()
+    consumed = []
+
+    def items():
+        for n in range(40):
+            consumed.append(n)
+            yield (f"{n:05}", {"status": "completed"})
+        yield ("missing", {})
+        yield {"order": "broken", "body": {}}
+
+    runner = BulkRunner(orders.PatchOrder, workers=4)
+    results = []
+    for result in runner.run(items()):
+        assert len(consumed) <= len(results) + 1 + runner.window
+        results.append(result)
+
+    assert len(results) == 42
+    assert orders.peak <= 4
+    failed = [r.item for r in results if not r.ok]
+    assert sorted(map(str, failed)) == ["('missing', {})", "{'order': 'broken', 'body': {}}"]
+    assert runner.summary["total"] == 42
+    assert runner.summary["statuses"] == {200: 40, 404: 1}
+    assert runner.summary["errors"] == {"ValueError": 1}
+    assert runner.summary["failed"] == 2
+
+
+def test_bulk_runner_ordered(tmp_path):
+    source = tmp_path.joinpath("orders.csv")
+    source.write_text("00001\n\n00002\n00003\n")
+    runner = BulkRunner(lambda order: SimpleNamespace(status_code=200), ordered=True)
+    assert [r.item for r in runner.run(csviter(source))] == ["00001", "00002", "00003"]
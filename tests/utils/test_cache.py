@@ -0,0 +1,114 @@
+import json
+import stat
+import time
+
+import pytest
+from httpx import Request, Response
+
+from salesforce_ocapi.endpoints import CodeVersions, Orders
+from salesforce_ocapi.utils import ResponseCache, ValidatorCache
+from ..conftest import INSTANCE
+
+ORDER = {"order_no": "00005678", "status": "new"}
+VERSIONS = {"count": 1, "data": [{"id": "version1", "active": True}]}
+ETAG = '"1a2b3c"'
+
+
+def response(body: bytes, status_code: int = 200) -> Response:
+    return Response(
+        status_code, request=Request("GET", f"{INSTANCE}/x"), content=body
+    )
+
+
+@pytest.fixture(scope="module")
+def mocked_cached_order_api(mocked_instance_api):
+    mocked_instance_api.get(
+        "/s/-/dw/shop/v20_4/orders/00005678",
+        content=json.dumps(ORDER),
+        alias="cachedorder",
+    )
+    yield mocked_instance_api
+
+
+def code_versions(request, response):
+    if request.method != "GET" or not request.url.path.endswith("/code_versions"):
+        return None
+    if request.headers.get("If-None-Match") == ETAG:
+        response.status_code = 304
+        response.content = b""
+    else:
+        response.content = json.dumps(VERSIONS)
+    response.headers["ETag"] = ETAG
+    return response
+
+
+@pytest.fixture(scope="module")
+def mocked_code_versions_api(mocked_instance_api):
+    mocked_instance_api.add(code_versions, alias="codeversions")
+    yield mocked_instance_api
+
+
+def test_cache_ttl_and_lru():
+    cache = ResponseCache(maxsize=2, ttl=60, ttls={"site": 0.05})
+    cache.set("a", response(b"a"))
+    cache.set("b", response(b"b"), base="site")
+    cache.set("error", response(b"nope", 404))
+    assert cache.get("a").content == b"a"
+    time.sleep(0.06)
+    assert cache.get("b") is None
+    cache.set("c", response(b"c"))
+    cache.set("d", response(b"d"))
+    assert cache.get("a") is None
+    assert cache.get("error") is None
+    assert cache.stats == {"hits": 1, "misses": 3, "evictions": 1}
+
+
+def test_cache_key_ignores_authorization():
+    first = ResponseCache.key(INSTANCE, "/x", {"a": 1}, {"Authorization": "Bearer 1"})
+    second = ResponseCache.key(INSTANCE, "/x", {"a": 1}, {"Authorization": "Bearer 2"})
+    assert first == second
+    assert first != ResponseCache.key(INSTANCE, "/x", {"a": 2})
+
+
+def test_endpoint_get_uses_cache(mocked_cached_order_api, bm_session):
+    orders = Orders(client=bm_session)
+    orders.cache = ResponseCache()
+    calls = mocked_cached_order_api.aliases["cachedorder"].call_count
+    responses = [orders.GetOrder("00005678") for _ in range(3)]
+    assert [r.json() for r in responses] == [ORDER] * 3
+    assert mocked_cached_order_api.aliases["cachedorder"].call_count == calls + 1
+    assert orders.cache.stats["hits"] == 2
+
+
+def test_cache_keeps_basic_auth_credentials_apart(mocked_cached_order_api, bm_session):
+    orders = Orders(client=bm_session)
+    orders.cache = ResponseCache()
+    calls = mocked_cached_order_api.aliases["cachedorder"].call_count
+    for user in ("alice", "bob", "alice"):
+        orders.GetOrder("00005678", headers={"Authorization": f"Basic {user}"})
+    assert mocked_cached_order_api.aliases["cachedorder"].call_count == calls + 2
+    assert orders.cache.stats["hits"] == 1
+
+
+def test_conditional_get_reuses_body(mocked_code_versions_api, bm_session, tmp_path):
+    versions = CodeVersions(client=bm_session)
+    versions.validators = ValidatorCache(tmp_path.joinpath("validators.db"))
+    first = versions.GetCodeVersions()
+    second = versions.GetCodeVersions()
+    calls = mocked_code_versions_api.aliases["codeversions"].calls
+    assert "If-None-Match" not in calls[-2][0].headers
+    assert calls[-1][0].headers["If-None-Match"] == ETAG
+    assert calls[-1][1].status_code == 304
+    assert first.json() == second.json() == VERSIONS
+    assert second.status_code == 200
+    assert versions.validators.stats == {"revalidated": 1, "stored": 1}
+
+
+def test_validator_cache_file_is_private(tmp_path):
+    path = tmp_path.joinpath("validators.db")
+    path.touch(mode=0o644)
+    ValidatorCache(path)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    fresh = tmp_path.joinpath("fresh.db")
+    ValidatorCache(fresh)
+    assert stat.S_IMODE(fresh.stat().st_mode) == 0o600
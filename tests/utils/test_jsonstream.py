@@ -0,0 +1,40 @@
+import json
+
+from salesforce_ocapi.utils.jsonstream import HitStream
+
+PAGE = {
+    "_v": "20.4",
+    "count": 3,
+    "hits": [
+        {"data": {"order_no": "0001", "note": 'braces } ] and "quotes" \\ inside'}},
+        {"data": {"order_no": "0002", "items": [1, 2, {"nested": [3]}]}},
+        {"data": {"order_no": "0003", "name": "café ☃"}},
+    ],
+    "next": {"start": 3, "count": 3},
+    "total": 12345,
+}
+
+
+def stream(body: bytes, size: int):
+    parser = HitStream()
+    hits = []
+    for n in range(0, len(body), size):
+        hits.extend(parser.feed(body[n : n + size]))
+    hits.extend(parser.feed(b"", final=True))
+    return parser, hits
+
+
+def test_hits_match_whole_document_for_any_chunking():
+    body = json.dumps(PAGE, ensure_ascii=False, indent=1).encode("utf-8")
+    for size in (1, 2, 7, 64, len(body)):
+        parser, hits = stream(body, size)
+        assert hits == PAGE["hits"]
+        assert parser.count == 3
+        assert parser.meta == {key: PAGE[key] for key in PAGE if key != "hits"}
+
+
+def test_error_document_has_no_hits():
+    body = json.dumps({"fault": {"type": "InvalidAccessTokenException"}}).encode()
+    parser, hits = stream(body, 5)
+    assert hits == []
+    assert parser.meta["fault"]["type"] == "InvalidAccessTokenException"
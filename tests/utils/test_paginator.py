@@ -0,0 +1,165 @@
+import json
+import threading
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from opnieuw import RetryException
+
+from salesforce_ocapi.utils import AdaptivePageSize, Paginator, select_projection
+
+TOTAL = 95
+
+
+class FakeResponse:
+    def __init__(self, payload, method):
+        self._payload = payload
+        self.request = SimpleNamespace(method=method)
+
+    def json(self):
+        return self._payload
+
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode()
+
+    def iter_bytes(self):
+        body = json.dumps(self._payload).encode()
+        for n in range(0, len(body), 16):
+            yield body[n : n + 16]
+
+    def close(self):
+        pass
+
+
+class FakeSearch:
+    """Stands in for an OCAPI search endpoint serving TOTAL numbered hits."""
+
+    base = "fake_search"
+
+    def __init__(self):
+        self.starts = []
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def streaming(self):
+        yield
+
+    def Search(self, body, params=None, headers=None, **kwargs):
+        start = body.get("start", 0)
+        count = body.get("count", 25)
+        with self.lock:
+            self.starts.append(start)
+        hits = [{"n": n} for n in range(start, min(start + count, TOTAL))]
+        page = {"start": start, "count": len(hits), "total": TOTAL, "hits": hits}
+        if start + count < TOTAL:
+            page["next"] = {"start": start + count, "count": count}
+        return FakeResponse(page, "POST")
+
+
+def test_serial_hits():
+    endpoint = FakeSearch()
+    paginator = Paginator(endpoint, "Search", body={"query": {"match_all_query": {}}})
+    hits = [hit["n"] for hit in paginator.hits(params={"count": 10})]
+    assert hits == list(range(TOTAL))
+    assert endpoint.starts == list(range(0, TOTAL, 10))
+
+
+def test_prefetch_hits_in_order():
+    endpoint = FakeSearch()
+    paginator = Paginator(
+        endpoint, "Search", prefetch=4, window=3, body={"select": "(hits.(n))"}
+    )
+    hits = [hit["n"] for hit in paginator.hits(params={"count": 10})]
+    assert hits == list(range(TOTAL))
+    assert sorted(endpoint.starts) == list(range(0, TOTAL, 10))
+
+
+def test_streamed_hits():
+    endpoint = FakeSearch()
+    paginator = Paginator(endpoint, "Search", body={"query": {"match_all_query": {}}})
+    hits = [hit["n"] for hit in paginator.hits(params={"count": 20}, stream=True)]
+    assert hits == list(range(TOTAL))
+    assert endpoint.starts == list(range(0, TOTAL, 20))
+
+
+def test_select_projection():
+    assert select_projection("hits[*].data.order_no") == (
+        "(hits.(data.(order_no)),next,count,total)"
+    )
+    assert select_projection("hits[?a > `1`].b") == "(hits.(b,a),next,count,total)"
+    assert select_projection("hits[?contains(id, 'x')]") == "(hits,next,count,total)"
+    assert select_projection("total") is None
+
+
+def test_search_pushes_projection_into_body():
+    endpoint = FakeSearch()
+    selects = []
+    search = endpoint.Search
+
+    def recording_search(body, **kwargs):
+        selects.append(body.get("select"))
+        return search(body, **kwargs)
+
+    endpoint.Search = recording_search
+    paginator = Paginator(endpoint, "Search", body={"query": {"match_all_query": {}}})
+    results = list(paginator.search("hits[?n < `3`].n", params={"count": 50}))
+    assert results == [[0, 1, 2], []]
+    assert set(selects) == {"(hits.(n),next,count,total)"}
+
+
+def test_resume_from_checkpoint(tmp_path):
+    checkpoint = tmp_path.joinpath("search.json")
+    endpoint = FakeSearch()
+    paginator = Paginator(endpoint, "Search", checkpoint=checkpoint, body={})
+    seen = []
+    for hit in paginator.hits(params={"count": 10}):
+        seen.append(hit["n"])
+        if hit["n"] == 34:
+            break
+    assert json.loads(checkpoint.read_text())["cursor"] == {"start": 30}
+
+    endpoint = FakeSearch()
+    paginator = Paginator(endpoint, "Search", checkpoint=checkpoint, body={})
+    hits = [hit["n"] for hit in paginator.hits(params={"count": 10}, resume=True)]
+    assert hits == list(range(30, TOTAL))
+    assert endpoint.starts[0] == 30
+    assert not checkpoint.exists()
+
+
+class SlowSearch(FakeSearch):
+    """Times out whenever a page holds more than 50 hits."""
+
+    def Search(self, body, params=None, headers=None, **kwargs):
+        if body.get("count", 25) > 50:
+            raise RetryException
+        return super().Search(body, params, headers, **kwargs)
+
+
+def test_auto_page_size_shrinks_on_timeout():
+    endpoint = SlowSearch()
+    paginator = Paginator(endpoint, "Search", page_size="auto", body={})
+    hits = [hit["n"] for hit in paginator.hits()]
+    assert hits == list(range(TOTAL))
+    assert endpoint.starts[0] == 0
+    assert paginator.stats["shrinks"] >= 2
+    assert paginator.stats["page_size"] <= 100
+
+
+def test_prefetch_adapts_page_size():
+    endpoint = FakeSearch()
+    sizer = AdaptivePageSize(maximum=20, size=200)
+    paginator = Paginator(endpoint, "Search", prefetch=4, page_size=sizer, body={})
+    hits = [hit["n"] for hit in paginator.hits()]
+    assert hits == list(range(TOTAL))
+    assert paginator.stats["pages"] == len(endpoint.starts)
+    assert paginator.stats["page_size"] < 20
+
+
+def test_adaptive_page_size_targets():
+    sizer = AdaptivePageSize(latency=1, size=10000)
+    sizer.observe(200, 4.0, 1000)
+    assert sizer.count == 50
+    sizer.observe(50, 0.1, 5000)
+    assert sizer.count == 100
+    sizer.observe(100, 0.1, 1000)
+    assert sizer.count == 200
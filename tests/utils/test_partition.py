@@ -0,0 +1,104 @@
+from types import SimpleNamespace
+
+import pytest
+from httpx import Request, Response
+
+from salesforce_ocapi.utils import PartitionedSearch
+from salesforce_ocapi.utils.exceptions import OCAPIException
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self._payload = payload
+        self.request = SimpleNamespace(method="POST")
+
+    def json(self):
+        return self._payload
+
+
+class FakeOrderSearch:
+    """Orders numbered 0-999, with creation_date equal to the order number squared."""
+
+    base = "order_search"
+    dates = [n * n for n in range(1000)]
+
+    def Search(self, body, params=None, headers=None, **kwargs):
+        window = body["query"]["filtered_query"]["filter"]["range_filter"]
+        matches = [d for d in self.dates if window["from"] <= d < window["to"]]
+        start, count = body.get("start", 0), body.get("count", 25)
+        hits = [{"data": {"creation_date": d}} for d in matches[start : start + count]]
+        page = {"start": start, "count": len(hits), "total": len(matches), "hits": hits}
+        if start + count < len(matches):
+            page["next"] = {"start": start + count}
+        return FakeResponse(page)
+
+
+def test_partitions_cover_range_once():
+    search = PartitionedSearch(
+        FakeOrderSearch(),
+        "Search",
+        0,
+        1000 * 1000,
+        slices=4,
+        max_hits=100,
+        body={"query": {"match_all_query": {}}},
+    )
+    dates = sorted(hit["data"]["creation_date"] for hit in search.hits(count=50))
+    assert dates == FakeOrderSearch.dates
+    assert all(total <= 100 for _, _, total in search.partitions)
+    assert len(search.partitions) > 4
+
+
+class CountingOrderSearch(FakeOrderSearch):
+    def __init__(self):
+        self.pages = 0
+
+    def Search(self, body, params=None, headers=None, **kwargs):
+        if "select" not in body:
+            self.pages += 1
+        return super().Search(body, params=params, headers=headers, **kwargs)
+
+
+def test_closing_hits_skips_queued_partitions():
+    endpoint = CountingOrderSearch()
+    search = PartitionedSearch(
+        endpoint,
+        "Search",
+        0,
+        1000 * 1000,
+        slices=50,
+        workers=2,
+        buffer=1,
+        body={"query": {"match_all_query": {}}},
+    )
+    hits = search.hits(count=50)
+    next(hits)
+    hits.close()
+    assert len(search.partitions) == 50
+    assert endpoint.pages <= 4
+
+
+class FaultyOrderSearch(FakeOrderSearch):
+    """Answers count probes of the upper half of the range with a fault."""
+
+    def Search(self, body, params=None, headers=None, **kwargs):
+        window = body["query"]["filtered_query"]["filter"]["range_filter"]
+        if "select" in body and window["from"] >= 500 * 1000:
+            fault = b'{"fault": {"type": "InternalServerError"}}'
+            return Response(500, request=Request("POST", "https://x"), content=fault)
+        return super().Search(body, params=params, headers=headers, **kwargs)
+
+
+def test_failed_count_probe_raises():
+    search = PartitionedSearch(
+        FaultyOrderSearch(),
+        "Search",
+        0,
+        1000 * 1000,
+        slices=4,
+        body={"query": {"match_all_query": {}}},
+    )
+    with pytest.raises(OCAPIException):
+        list(search.hits(count=50))
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+from httpx import Request, Response
+
+from salesforce_ocapi.endpoints import Orders
+from salesforce_ocapi.utils import RateLimiter
+from salesforce_ocapi.utils.ratelimit import rate_limiter
+from ..conftest import INSTANCE
+
+ORDER = {"order_no": "00009999", "status": "new"}
+
+
+def response(status_code: int, headers: dict = None) -> Response:
+    return Response(
+        status_code, request=Request("GET", INSTANCE), headers=headers, content=b""
+    )
+
+
+def throttled_order(request, response):
+    if not request.url.path.endswith("/orders/00009999"):
+        return None
+    throttled_order.calls += 1
+    if throttled_order.calls == 1:
+        response.status_code = 429
+        response.headers["Retry-After"] = "0"
+    else:
+        response.content = json.dumps(ORDER)
+    return response
+
+
+@pytest.fixture(scope="module")
+def mocked_throttled_api(mocked_instance_api):
+    throttled_order.calls = 0
+    mocked_instance_api.add(throttled_order, alias="throttledorder")
+    yield mocked_instance_api
+
+
+def test_token_bucket_spaces_requests():
+    limiter = RateLimiter(rate=10, burst=2)
+    waits = [limiter.reserve(INSTANCE) for _ in range(4)]
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.1, abs=0.01)
+    assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+
+def test_retry_after_decisions():
+    limiter = RateLimiter(retries=2, backoff=1, max_backoff=4)
+    assert limiter.retry_after(INSTANCE, "GET", response(200), 0) is None
+    assert limiter.retry_after(INSTANCE, "POST", response(500), 0) is None
+    assert limiter.retry_after(INSTANCE, "GET", response(429, {"Retry-After": "3"}), 0) == 3
+    assert 1 <= limiter.retry_after(INSTANCE, "POST", response(503), 1) <= 2
+    assert limiter.retry_after(INSTANCE, "GET", response(502), 2) is None
+    state = limiter.state(INSTANCE)["test01-eu01-example.demandware.net"]
+    assert state["throttled"] == 2
+    assert 2 < state["blocked_for"] <= 3
+
+
+def test_request_retried_after_429(mocked_throttled_api, bm_session):
+    orders = Orders(client=bm_session)
+    throttled = orders.throttle["throttled"]
+    response = orders.GetOrder("00009999")
+    assert response.status_code == 200
+    assert response.json() == ORDER
+    assert throttled_order.calls == 2
+    assert orders.throttle["throttled"] == throttled + 1
+
+
+def test_token_requests_are_scheduled(bm_session, monkeypatch):
+    hosts = []
+    monkeypatch.setattr(rate_limiter, "reserve", lambda host: hosts.append(host) or 0)
+    bm_session.getToken()
+    assert hosts == [INSTANCE]
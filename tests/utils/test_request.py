@@ -0,0 +1,123 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from salesforce_ocapi.auth import CommerceCloudBMSession
+from salesforce_ocapi.utils.request import AsyncEndpoint, Endpoint
+from ..conftest import CLIENT_SECRET, BM_USER, BM_PASSWORD, INSTANCE
+
+CLIENT_ID = "99999999-8888-7777-6666-555555555555"
+RESOURCE = "/s/-/dw/data/v20_4/revocation"
+
+SERVER = {"issued": 0, "valid": None, "reject": False, "stagger": False, "log": []}
+
+
+def revocation_server(request, response):
+    if request.url.path == "/dw/oauth2/access_token":
+        if f"client_id={CLIENT_ID}" not in request.url.query:
+            return None
+        time.sleep(0.05)
+        SERVER["issued"] += 1
+        SERVER["valid"] = f"token-{SERVER['issued']}"
+        response.content = json.dumps(
+            {"access_token": SERVER["valid"], "expires_in": 899, "token_type": "Bearer"}
+        )
+        return response
+    if request.url.path != RESOURCE:
+        return None
+    sent = request.headers.get("Authorization")
+    SERVER["log"].append(sent)
+    if SERVER["stagger"]:
+        time.sleep(len(SERVER["log"]) % 4 * 0.04)
+    accepted = sent == f"Bearer {SERVER['valid']}" and not SERVER["reject"]
+    response.status_code = 200 if accepted else 401
+    return response
+
+
+@pytest.fixture(scope="module")
+def mocked_revocation_api(mocked_instance_api):
+    mocked_instance_api.add(revocation_server, alias="revocation")
+    yield mocked_instance_api
+
+
+@pytest.fixture
+def endpoint(mocked_revocation_api):
+    SERVER.update(reject=False, stagger=False)
+    session = CommerceCloudBMSession(
+        client_id=CLIENT_ID,
+        client_secret=CLIENT_SECRET,
+        instance=INSTANCE,
+        bm_user=BM_USER,
+        bm_password=BM_PASSWORD,
+    )
+    assert Endpoint(session)._send("GET", INSTANCE + RESOURCE).status_code == 200
+    SERVER["log"] = []
+    yield Endpoint(session)
+    session._manager.cancel()
+
+
+def test_replays_once_with_the_new_token(endpoint):
+    issued = SERVER["issued"]
+    SERVER["valid"] = None
+    assert endpoint._send("GET", INSTANCE + RESOURCE).status_code == 200
+    assert SERVER["issued"] == issued + 1
+    assert SERVER["log"] == [f"Bearer token-{issued}", f"Bearer token-{issued + 1}"]
+
+
+def test_never_replays_twice(endpoint):
+    issued = SERVER["issued"]
+    SERVER["reject"] = True
+    assert endpoint._send("GET", INSTANCE + RESOURCE).status_code == 401
+    assert SERVER["issued"] == issued + 1
+    assert len(SERVER["log"]) == 2
+
+
+def test_caller_authorization_is_not_replayed(endpoint):
+    headers = {"Authorization": "Bearer caller-supplied"}
+    response = endpoint._send("GET", INSTANCE + RESOURCE, headers=headers)
+    assert response.status_code == 401
+    assert SERVER["log"] == ["Bearer caller-supplied"]
+
+
+def test_revoked_token_is_renewed_once(endpoint):
+    issued = SERVER["issued"]
+    SERVER.update(valid=None, stagger=True)
+    barrier = threading.Barrier(32)
+    statuses = []
+
+    def call():
+        barrier.wait()
+        statuses.append(endpoint._send("GET", INSTANCE + RESOURCE).status_code)
+
+    threads = [threading.Thread(target=call) for _ in range(32)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert statuses == [200] * 32
+    assert SERVER["issued"] == issued + 1
+
+
+def test_async_renewal_runs_off_the_event_loop(endpoint):
+    endpoint = AsyncEndpoint(endpoint.client)
+    SERVER["valid"] = None
+    ticks = []
+
+    async def ticker(done):
+        while not done.is_set():
+            ticks.append(1)
+            await asyncio.sleep(0.005)
+
+    async def main():
+        done = asyncio.Event()
+        task = asyncio.ensure_future(ticker(done))
+        response = await endpoint._send("GET", INSTANCE + RESOURCE)
+        done.set()
+        await task
+        return response
+
+    assert asyncio.run(main()).status_code == 200
+    assert len(ticks) >= 5
@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+
+from salesforce_ocapi.utils import IncrementalSync, SyncState
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self._payload = payload
+        self.request = SimpleNamespace(method="POST")
+
+    def json(self):
+        return self._payload
+
+
+class FakeOrderSearch:
+    base = "order_search"
+
+    def __init__(self, orders, on_search=None):
+        self.orders = orders
+        self.on_search = on_search
+        self.searches = 0
+
+    def Search(self, body, params=None, headers=None, **kwargs):
+        query = body["query"]
+        matches = sorted(self.orders, key=lambda order: order["last_modified"])
+        if "filtered_query" in query:
+            window = query["filtered_query"]["filter"]["range_filter"]
+            since, until = window.get("from", ""), window["to"]
+            matches = [o for o in matches if since <= o["last_modified"] <= until]
+        start, count = body.get("start", 0), body.get("count", 25)
+        hits = [{"data": dict(order)} for order in matches[start : start + count]]
+        page = {"start": start, "count": len(hits), "total": len(matches), "hits": hits}
+        if start + count < len(matches):
+            page["next"] = {"start": start + count}
+        self.searches += 1
+        if self.on_search:
+            self.on_search(self)
+        return FakeResponse(page)
+
+
+def order(number, modified):
+    return {"order_no": number, "last_modified": f"2020-06-01T10:00:{modified:02}.000Z"}
+
+
+def test_incremental_runs(tmp_path):
+    state = SyncState(tmp_path / "sync.db")
+    endpoint = FakeOrderSearch([order(f"{n:04}", n // 2) for n in range(10)])
+
+    def run():
+        sync = IncrementalSync(endpoint, "Search", "orders", state=state, checkpoint=3)
+        return [hit["data"]["order_no"] for hit in sync.hits(count=4)]
+
+    assert run() == [f"{n:04}" for n in range(10)]
+    assert run() == []
+    endpoint.orders.append(order("0010", 4))
+    endpoint.orders.append(order("0011", 7))
+    assert run() == ["0010", "0011"]
+    assert state.get("orders") == ("2020-06-01T10:00:07.000Z", {"0011"})
+
+
+def test_record_modified_mid_run_shifts_nothing(tmp_path):
+    state = SyncState(tmp_path / "sync.db")
+
+    def modify_first_order(endpoint):
+        if endpoint.searches == 1:
+            endpoint.orders[1]["last_modified"] = "2020-06-01T10:00:59.000Z"
+
+    orders = [order(f"o{n}", n) for n in range(10)]
+    endpoint = FakeOrderSearch(orders, on_search=modify_first_order)
+    sync = IncrementalSync(endpoint, "Search", "orders", state=state)
+    seen = [hit["data"]["order_no"] for hit in sync.hits(count=3)]
+    assert seen[:3] == ["o0", "o1", "o2"]
+    assert sorted(set(seen)) == [f"o{n}" for n in range(10)]
+    assert seen.count("o1") == 2
+    assert seen[-1] == "o1"
+
+
+def test_many_records_sharing_a_timestamp(tmp_path):
+    state = SyncState(tmp_path / "sync.db")
+    endpoint = FakeOrderSearch([order(f"{n:04}", 1) for n in range(7)])
+    sync = IncrementalSync(endpoint, "Search", "orders", state=state, key="order_no")
+    seen = [hit["data"]["order_no"] for hit in sync.hits(count=2)]
+    assert seen == [f"{n:04}" for n in range(7)]
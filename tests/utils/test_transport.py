@@ -0,0 +1,37 @@
+import asyncio
+
+from salesforce_ocapi.utils.transport import ConnectionPool
+
+
+def test_session_shared_per_host():
+    pool = ConnectionPool()
+    first = pool.session("https://test01-eu01-example.demandware.net")
+    second = pool.session("https://test01-eu01-example.demandware.net/")
+    other = pool.session("https://test02-eu01-example.demandware.net")
+    assert first is second
+    assert first is not other
+    pool.close()
+
+
+def test_configure_replaces_clients():
+    pool = ConnectionPool()
+    first = pool.session("https://test01-eu01-example.demandware.net")
+    pool.configure(max_connections=5, timeout=30)
+    second = pool.session("https://test01-eu01-example.demandware.net")
+    assert first is not second
+    assert pool.max_connections == 5
+    assert second.timeout.read_timeout == 30
+    pool.close()
+
+
+def test_async_clients_of_closed_loops_are_dropped():
+    pool = ConnectionPool()
+
+    async def client():
+        return pool.async_session("https://test01-eu01-example.demandware.net")
+
+    first = asyncio.run(client())
+    second = asyncio.run(client())
+    assert first is not second
+    assert list(pool._async_clients.values()) == [second]
+    pool.close()
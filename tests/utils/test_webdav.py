@@ -0,0 +1,19 @@
+from hashlib import md5
+
+from salesforce_ocapi.utils import multipart_md5
+
+CONTENT = bytes(range(256)) * 100
+
+
+def expected(part_size):
+    parts = [
+        md5(CONTENT[offset : offset + part_size]).digest()
+        for offset in range(0, len(CONTENT), part_size)
+    ]
+    return f"{md5(b''.join(parts)).hexdigest()}-{len(parts)}"
+
+
+def test_multipart_md5_ignores_chunk_boundaries():
+    chunks = [CONTENT[offset : offset + 777] for offset in range(0, len(CONTENT), 777)]
+    assert multipart_md5(chunks, 4096) == expected(4096)
+    assert multipart_md5([CONTENT], 6400) == expected(6400)